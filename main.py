@@ -1,31 +1,31 @@
 # main.py
 import sys
 import os
+import multiprocessing
 
 # ✅ YÜKSEK DPI SCALING DEVRE DIŞI BIRAKILIYOR
 os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
 os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
 
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
-from PyQt6.QtCore import QTimer
-
-# .exe içinde çalışırken dosya yolu düzeltici
-def resource_path(relative_path):
-    base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
-    return os.path.join(base_path, relative_path)
-
 if __name__ == "__main__":
+    # Paketlenmiş exe'de simülasyon süreç havuzunun alt süreçleri burada ayrılır
+    multiprocessing.freeze_support()
+
+    # Uygulama importları burada: spawn ile başlayan alt süreçler main.py'yi
+    # __mp_main__ olarak yeniden import eder, Qt ve sayfa grafiğini yüklemez
+    from utils.startup_timeline import startup_timeline
+    from utils.style import apply_app_stylesheet
+    from PyQt6.QtWidgets import QApplication
+    from ui.main_window import MainWindow
+    from PyQt6.QtCore import QTimer
+    startup_timeline.mark("imports")
+
     app = QApplication(sys.argv)
+    startup_timeline.mark("QApplication")
 
-    # QSS stil dosyasını yükle
-    try:
-        qss_path = resource_path("ui/styles.qss")
-        with open(qss_path, "r") as f:
-            style = f.read()
-            app.setStyleSheet(style)
-    except Exception as e:
-        print(f"Stil dosyası yüklenemedi: {e}")
+    # QSS stil dosyasını yükle (tek sefer, uygulama seviyesinde)
+    apply_app_stylesheet(app)
+    startup_timeline.mark("app stylesheet")
 
     window = MainWindow()
 
@@ -37,5 +37,6 @@ if __name__ == "__main__":
     else:
         window.showFullScreen()
         QTimer.singleShot(100, window.resize_columns)
+    startup_timeline.mark("show")
 
     sys.exit(app.exec())
@@ -0,0 +1,311 @@
+# pages/driver_rotation.py
+"""
+Pilot rotasyonu çözücüsü.
+
+Qt'ye bağımlı değildir. Stint süreleri (stint + pit, saniye), gece stint'leri
+ve takım kuralları (pilot başına min / max sürüş süresi, gece tercihi, en
+fazla art arda stint) ile her stint'e bir pilot atar.
+
+Yöntem: durum (son pilot, art arda stint sayısı) olan bir DP en ucuz
+rotasyonu bulur; pilot başına saniye fiyatları (Lagrange çarpanları) toplam
+süreler dengeli hedefe yaklaşana kadar güncellenir. Hedef, toplam sürenin
+pilotlara eşit paylaştırılmış halidir (min / max sınırlarına kırpılarak,
+kalan pay diğer pilotlara dağıtılır). Sonda tek stint taşımalı yerel arama
+min / max ihlallerini ve kalan dengesizliği düzeltir. 6 pilot × 100+ stint
+birkaç on milisaniyedir.
+"""
+import math
+import time
+from dataclasses import dataclass
+
+# Gece stint'ini gece tercihi olmayan pilota vermenin maliyeti (stint süresine oran)
+NIGHT_PENALTY = 0.25
+# min / max ihlali, dengesizlikten her zaman pahalı
+LIMIT_PENALTY = 1e6
+LAGRANGE_ITERATIONS = 60
+# En iyi skor bu kadar turdur iyileşmiyorsa fiyat güncellemesi durur
+LAGRANGE_PATIENCE = 15
+
+
+def parse_clock(text: str):
+    """"HH:mm" -> saniye; boş ya da geçersizse None."""
+    try:
+        hours, minutes = str(text).strip().split(":")[:2]
+        return int(hours) * 3600 + int(minutes) * 60
+    except (ValueError, AttributeError):
+        return None
+
+
+def format_clock(seconds) -> str:
+    if seconds is None or math.isinf(seconds):
+        return ""
+    minutes = int(round(seconds / 60))
+    return f"{minutes // 60:02}:{minutes % 60:02}"
+
+
+@dataclass(frozen=True)
+class DriverLimits:
+    name: str
+    min_seconds: float = 0.0
+    max_seconds: float = math.inf
+    # Gece stint'lerini tercih eder
+    night: bool = False
+
+
+@dataclass(frozen=True)
+class RotationRules:
+    drivers: tuple = ()
+    max_consecutive: int = 2
+    # Gece penceresi, günün saniyesi (22:00 - 06:00 gibi gece yarısını aşabilir)
+    night_start: int = 22 * 3600
+    night_end: int = 6 * 3600
+
+    @classmethod
+    def from_team(cls, document: dict):
+        """
+        data/teams_drivers/<takım>.json: "drivers" listesi ve isteğe bağlı
+        "rotation" bloğu ({"max_consecutive", "night_start", "night_end",
+        "drivers": {pilot: {"min_drive", "max_drive", "night"}}}).
+        """
+        rotation = document.get("rotation", {}) or {}
+        limits = rotation.get("drivers", {}) or {}
+        drivers = []
+        for name in document.get("drivers", []):
+            name = str(name).strip()
+            if not name:
+                continue
+            limit = limits.get(name, {}) or {}
+            max_seconds = parse_clock(limit.get("max_drive", ""))
+            drivers.append(DriverLimits(
+                name=name,
+                min_seconds=parse_clock(limit.get("min_drive", "")) or 0.0,
+                max_seconds=max_seconds if max_seconds else math.inf,
+                night=bool(limit.get("night", False)),
+            ))
+
+        night_start = parse_clock(rotation.get("night_start", ""))
+        night_end = parse_clock(rotation.get("night_end", ""))
+        try:
+            max_consecutive = max(1, int(rotation.get("max_consecutive", cls.max_consecutive)))
+        except (TypeError, ValueError):
+            max_consecutive = cls.max_consecutive
+        return cls(
+            drivers=tuple(drivers),
+            max_consecutive=max_consecutive,
+            night_start=cls.night_start if night_start is None else night_start,
+            night_end=cls.night_end if night_end is None else night_end,
+        )
+
+    def is_night(self, epoch_seconds: float) -> bool:
+        """Yerel saatte gece penceresinde mi (pencere gece yarısını aşabilir)."""
+        local = time.localtime(epoch_seconds)
+        second = local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec
+        if self.night_start <= self.night_end:
+            return self.night_start <= second < self.night_end
+        return second >= self.night_start or second < self.night_end
+
+
+@dataclass(frozen=True)
+class RotationResult:
+    # Stint başına pilot indeksi (rules.drivers içinde)
+    assignment: tuple
+    drivers: tuple
+    totals: tuple
+    targets: tuple
+    # İnsan okunur ihlaller (boşsa tüm kurallar sağlandı)
+    violations: tuple = ()
+
+    @property
+    def names(self) -> list[str]:
+        return [self.drivers[d] for d in self.assignment]
+
+    @property
+    def feasible(self) -> bool:
+        return not self.violations
+
+
+def longest_run(assignment) -> int:
+    longest = length = 0
+    for i, d in enumerate(assignment):
+        length = length + 1 if i > 0 and assignment[i - 1] == d else 1
+        longest = max(longest, length)
+    return longest
+
+
+def balanced_targets(total: float, drivers) -> list[float]:
+    """Eşit pay, min / max'a kırpılır; kırpılan fark diğer pilotlara dağılır (su doldurma)."""
+    lows = [d.min_seconds for d in drivers]
+    highs = [max(d.max_seconds, d.min_seconds) for d in drivers]
+    low, high = 0.0, total
+    for _ in range(60):
+        level = (low + high) / 2
+        if sum(min(max(level, lo), hi) for lo, hi in zip(lows, highs)) < total:
+            low = level
+        else:
+            high = level
+    return [min(max(high, lo), hi) for lo, hi in zip(lows, highs)]
+
+
+class RotationSolver:
+    def __init__(self, durations: list, night: list, rules: RotationRules):
+        self.durations = [float(d) for d in durations]
+        self.night = list(night) + [False] * (len(durations) - len(night))
+        self.rules = rules
+        self.drivers = rules.drivers
+        self.max_run = max(1, rules.max_consecutive)
+        self.average = (sum(self.durations) / len(self.durations)) if self.durations else 1.0
+        self.targets = balanced_targets(sum(self.durations), self.drivers)
+
+        has_night_drivers = any(d.night for d in self.drivers)
+        self.night_cost = [
+            [NIGHT_PENALTY * seconds if has_night_drivers and is_night and not driver.night else 0.0
+             for driver in self.drivers]
+            for seconds, is_night in zip(self.durations, self.night)
+        ]
+
+    # --- amaç fonksiyonu ---
+
+    def totals(self, assignment) -> list[float]:
+        totals = [0.0] * len(self.drivers)
+        for seconds, d in zip(self.durations, assignment):
+            totals[d] += seconds
+        return totals
+
+    def limit_excess(self, d: int, total: float) -> float:
+        driver = self.drivers[d]
+        return max(0.0, total - driver.max_seconds) + max(0.0, driver.min_seconds - total)
+
+    def driver_score(self, d: int, total: float) -> float:
+        deviation = (total - self.targets[d]) / self.average
+        return deviation * deviation + LIMIT_PENALTY * self.limit_excess(d, total) / self.average
+
+    def score(self, assignment) -> float:
+        totals = self.totals(assignment)
+        night = sum(self.night_cost[i][d] for i, d in enumerate(assignment)) / self.average
+        return sum(self.driver_score(d, t) for d, t in enumerate(totals)) + night
+
+    # --- DP ---
+
+    def cheapest_rotation(self, prices: list[float]) -> list[int]:
+        """
+        Art arda en fazla max_run stint kuralıyla, stint maliyeti
+        prices[d] * süre + gece maliyeti toplamı en küçük atama.
+        """
+        count = len(self.drivers)
+        run = self.max_run
+        inf = math.inf
+        costs = [[prices[d] * seconds + self.night_cost[i][d] for d in range(count)]
+                 for i, seconds in enumerate(self.durations)]
+
+        # value[d][r]: son stint d'de, d'nin r+1. art arda stint'i
+        value = [[costs[0][d]] + [inf] * (run - 1) for d in range(count)]
+        back = [None]
+        for i in range(1, len(self.durations)):
+            best_run = [min(range(run), key=lambda r: value[d][r]) for d in range(count)]
+            best = [value[d][best_run[d]] for d in range(count)]
+            order = sorted(range(count), key=best.__getitem__)
+            switch = []
+            new_value = []
+            for d in range(count):
+                other = order[0] if order[0] != d else (order[1] if count > 1 else None)
+                start = best[other] if other is not None else inf
+                switch.append((other, best_run[other]) if other is not None else (None, 0))
+                new_value.append([start + costs[i][d]] + [value[d][r - 1] + costs[i][d] for r in range(1, run)])
+            value = new_value
+            back.append(switch)
+
+        d = min(range(count), key=lambda x: min(value[x]))
+        r = min(range(run), key=lambda x: value[d][x])
+        if math.isinf(value[d][r]):
+            # Tek pilot ve art arda sınırı: kural sağlanamaz, pilot yine atanır
+            return [d] * len(self.durations)
+
+        assignment = [0] * len(self.durations)
+        for i in range(len(self.durations) - 1, -1, -1):
+            assignment[i] = d
+            if r > 0:
+                r -= 1
+            elif i > 0:
+                d, r = back[i][d]
+        return assignment
+
+    # --- yerel arama ---
+
+    def run_fits(self, assignment, i: int, d: int) -> bool:
+        """i'ye d atanırsa d'nin art arda stint serisi max_run'ı aşmaz mı."""
+        length = 1
+        j = i - 1
+        while j >= 0 and assignment[j] == d and length <= self.max_run:
+            length += 1
+            j -= 1
+        j = i + 1
+        while j < len(assignment) and assignment[j] == d and length <= self.max_run:
+            length += 1
+            j += 1
+        return length <= self.max_run
+
+    def improve(self, assignment: list[int], max_passes: int = 20) -> list[int]:
+        """Tek stint'i başka pilota taşı; skor düştükçe devam."""
+        totals = self.totals(assignment)
+        count = len(self.drivers)
+        for _ in range(max_passes):
+            improved = False
+            for i, seconds in enumerate(self.durations):
+                a = assignment[i]
+                for b in range(count):
+                    if b == a or not self.run_fits(assignment, i, b):
+                        continue
+                    before = (self.driver_score(a, totals[a]) + self.driver_score(b, totals[b])
+                              + self.night_cost[i][a] / self.average)
+                    after = (self.driver_score(a, totals[a] - seconds) + self.driver_score(b, totals[b] + seconds)
+                             + self.night_cost[i][b] / self.average)
+                    if after < before - 1e-9:
+                        assignment[i] = b
+                        totals[a] -= seconds
+                        totals[b] += seconds
+                        a = b
+                        improved = True
+            if not improved:
+                break
+        return assignment
+
+    def solve(self, iterations: int = LAGRANGE_ITERATIONS) -> RotationResult:
+        names = tuple(d.name for d in self.drivers)
+        if not self.drivers or not self.durations:
+            return RotationResult((), names, tuple(0.0 for _ in names), tuple(self.targets))
+
+        prices = [1.0] * len(self.drivers)
+        best, best_score, stale = None, math.inf, 0
+        for k in range(iterations):
+            assignment = self.cheapest_rotation(prices)
+            score = self.score(assignment)
+            if score < best_score:
+                best, best_score, stale = assignment, score, 0
+            else:
+                stale += 1
+                if stale >= LAGRANGE_PATIENCE:
+                    break
+            totals = self.totals(assignment)
+            if all(abs(t - target) <= self.average / 2 for t, target in zip(totals, self.targets)):
+                break
+            # Fazla süren pilot pahalanır, eksik kalan ucuzlar
+            step = 0.5 / (1 + k / 10)
+            prices = [p + step * (t - target) / (self.average * len(self.durations))
+                      for p, t, target in zip(prices, totals, self.targets)]
+
+        assignment = self.improve(list(best))
+        totals = self.totals(assignment)
+        violations = [
+            f"{driver.name}: {format_clock(total)} < min {format_clock(driver.min_seconds)}"
+            for driver, total in zip(self.drivers, totals) if total < driver.min_seconds - 1
+        ] + [
+            f"{driver.name}: {format_clock(total)} > max {format_clock(driver.max_seconds)}"
+            for driver, total in zip(self.drivers, totals) if total > driver.max_seconds + 1
+        ]
+        if longest_run(assignment) > self.max_run:
+            violations.append(f"max {self.max_run} consecutive stints")
+        return RotationResult(tuple(assignment), names, tuple(totals), tuple(self.targets), tuple(violations))
+
+
+def solve_rotation(durations: list, night: list, rules: RotationRules) -> RotationResult:
+    return RotationSolver(durations, night, rules).solve()
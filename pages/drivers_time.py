@@ -1,11 +1,22 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QRadioButton, QButtonGroup,
     QLabel, QDateTimeEdit, QTableWidget, QTableWidgetItem,
-    QComboBox, QPushButton, QHeaderView, QSizePolicy, QLineEdit, QCheckBox
+    QComboBox, QPushButton, QHeaderView, QSizePolicy, QLineEdit, QCheckBox, QMessageBox
 )
-from PyQt6.QtCore import QDateTime, Qt, QTime
+from PyQt6.QtCore import QDateTime, Qt, pyqtSignal
 from PyQt6.QtGui import QPalette, QColor, QBrush
-import os, json
+from pages.strategy_table_model import RecordRole
+from pages.stint_plan import strategy_label
+from pages.driver_rotation import RotationRules, solve_rotation
+from pages.stint_schedule import StintSchedule, format_clock, format_datetime, resolve_clock
+from pages.strategy_utils import format_time
+from pages.stint_preview import StintCardItemDelegate
+from utils.strategy_repository import strategy_repository, strategy_key
+from utils.style import set_style_property
+import os, json, time
+
+# styles.qss'teki QComboBox#DriverCombo[driverSlot="0".."5"] renk sayısı
+DRIVER_COLOR_COUNT = 6
 
 class EditableLabel(QLineEdit):
     def __init__(self, initial_text, parent=None):
@@ -13,49 +24,18 @@ class EditableLabel(QLineEdit):
         super().__init__(parent)
         self.setText(initial_text)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QLineEdit {
-                color: white;
-                background-color: transparent;
-                border: none;
-                font-weight: bold;
-                font-family: Poppins;
-                font-size: 14px;
-                qproperty-alignment: AlignCenter;
-            }
-        """)
+        self.setObjectName("EditableLabel")
         self.setReadOnly(True)
 
     def mouseDoubleClickEvent(self, event):
         self.setReadOnly(False)
         self.selectAll()
-        self.setStyleSheet("""
-            QLineEdit {
-                color: white;
-                background-color: #222;
-                border: 1px solid #ffd700;
-                border-radius: 4px;
-                padding: 4px;
-                font-weight: bold;
-                font-family: Poppins;
-                font-size: 14px;
-            }
-        """)
+        set_style_property(self, "editing", True)
         self.setFocus()
 
     def focusOutEvent(self, event):
         self.setReadOnly(True)
-        self.setStyleSheet("""
-            QLineEdit {
-                color: white;
-                background-color: transparent;
-                border: none;
-                font-weight: bold;
-                font-family: Poppins;
-                font-size: 14px;
-                qproperty-alignment: AlignCenter;
-            }
-        """)
+        set_style_property(self, "editing", False)
         super().focusOutEvent(event)
 
 class DriversTimePage(QWidget):
@@ -64,11 +44,15 @@ class DriversTimePage(QWidget):
 
         self.selected_strategy = "strategy_a"
         self.pilot_list = []
+        self.driver_slots = {}
+        # Seçili takım dosyası (pilotlar + rotasyon kuralları)
+        self.team_document = {}
+        # Stint saatleri epoch saniyesiyle; elle girilen saatler override olarak
+        self.schedule = StintSchedule()
 
         layout = QVBoxLayout(self)
 
         self.radio_group = QButtonGroup(self)
-        keys = ["strategy_a", "strategy_b", "strategy_c", "strategy_d"]
 
         strategy_widget = QWidget()
         strategy_layout = QHBoxLayout(strategy_widget)
@@ -78,44 +62,12 @@ class DriversTimePage(QWidget):
 
         strategy_label = QLabel("Select Strategy:")
         strategy_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        strategy_label.setStyleSheet("""
-            color: white;
-            font-family: Poppins;
-            font-size: 14px;
-            margin: 0px;
-            padding: 0px;
-        """)
+        strategy_label.setObjectName("DriversFormLabel")
         strategy_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)  # Genişlik otomatik, sıkışmaz
         strategy_layout.addWidget(strategy_label)
 
-        for key in keys:
-            radio = QRadioButton(key.replace("_", " ").title())
-            radio.setStyleSheet("""
-                QRadioButton {
-                    color: white;
-                    font-weight: bold;
-                    font-size: 13px;
-                }
-                QRadioButton::indicator {
-                    width: 14px;
-                    height: 14px;
-                }
-                QRadioButton::indicator:checked {
-                    background-color: #ffd700;
-                    border: 2px solid #ffaa00;
-                    border-radius: 7px;
-                }
-                QRadioButton::indicator:unchecked {
-                    background-color: #444;
-                    border: 1px solid #666;
-                    border-radius: 7px;
-                }
-            """)
-            radio.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)  # Genişliği içeriğe sabitle
-            if key == self.selected_strategy:
-                radio.setChecked(True)
-            self.radio_group.addButton(radio)
-            strategy_layout.addWidget(radio)
+        # Radyo butonları plandaki stratejilerden oluşturulur (refresh_strategy_radios)
+        self.strategy_radio_layout = strategy_layout
 
         layout.addWidget(strategy_widget)
         self.radio_group.buttonClicked.connect(self.on_strategy_changed)
@@ -136,34 +88,14 @@ class DriversTimePage(QWidget):
         rst_label = QLabel("RST:")
         rst_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         rst_label.setFixedWidth(40)
-        rst_label.setStyleSheet("""
-            color: white;
-            font-family: Poppins;
-            font-size: 14px;
-        """)
+        rst_label.setObjectName("DriversFormLabel")
 
         self.race_start_picker = QDateTimeEdit()
         self.race_start_picker.setDisplayFormat("dd MMM yyyy HH:mm")
         self.race_start_picker.setDateTime(QDateTime.currentDateTime())
         self.race_start_picker.setFixedWidth(200)
         self.race_start_picker.lineEdit().setMaximumWidth(200)
-        self.race_start_picker.setStyleSheet("""
-            QDateTimeEdit {
-                background-color: rgba(40, 40, 40, 0.5);
-                color: white;
-                border: 1px solid #ffd700;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 14px;
-            }
-            QDateTimeEdit QLineEdit {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
+        self.race_start_picker.setObjectName("RaceStartPicker")
 
         rst_layout.addWidget(rst_label)
         rst_layout.addWidget(self.race_start_picker)
@@ -171,15 +103,7 @@ class DriversTimePage(QWidget):
         # 🏁 TEAM Alanı
         self.team_selector = QComboBox()
         self.team_selector.setFixedWidth(250)
-        self.team_selector.setStyleSheet("""
-            QComboBox {
-                background-color: #2a2a2a;
-                color: white;
-                padding: 6px;
-                border-radius: 6px;
-                border: 1px solid #ffd700;
-            }
-        """)
+        self.team_selector.setObjectName("TeamSelector")
         self.team_selector.currentTextChanged.connect(self.set_current_team)
         self.load_teams_to_dropdown()
 
@@ -191,11 +115,7 @@ class DriversTimePage(QWidget):
         team_label = QLabel("Team:")
         team_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         team_label.setFixedWidth(50)
-        team_label.setStyleSheet("""
-            color: white;
-            font-family: Poppins;
-            font-size: 14px;
-        """)
+        team_label.setObjectName("DriversFormLabel")
 
         team_layout.addWidget(team_label)
         team_layout.addWidget(self.team_selector)
@@ -214,64 +134,43 @@ class DriversTimePage(QWidget):
 
         calculate_button = QPushButton("Calculate")
         calculate_button.setFixedWidth(300)
-        calculate_button.setStyleSheet(""" 
-            QPushButton {
-                background-color: #ffd700;
-                color: black;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 8px;
-                font-family: Poppins;
-                font-size: 14px;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background-color: #ffe033;
-            }
-            QPushButton:pressed {
-                background-color: #e6c200;
-            }
-        """)
+        calculate_button.setObjectName("DriversActionButton")
         calculate_button.clicked.connect(self.on_calculate_clicked)
         save_button = QPushButton("Save Data")
         load_button = QPushButton("Load Data")
+        auto_assign_button = QPushButton("Auto Assign")
+        auto_assign_button.clicked.connect(self.auto_assign_drivers)
 
-        for btn in [save_button, load_button]:
+        for btn in [save_button, load_button, auto_assign_button]:
             btn.setFixedWidth(150)
-            btn.setStyleSheet(calculate_button.styleSheet())
+            btn.setObjectName("DriversActionButton")
 
 
         # ⚠️ Uyarı kutusu - tek QLabel içinde ikon + metin
         warning_label = QLabel("⚠️  Do not perform operations here before generating the table in the Prerace Stint Calculator tab!")
-        warning_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background-color: #c0392b;
-                font-size: 13px;
-                padding: 10px 12px;
-                border: 1px solid #e74c3c;
-                border-radius: 6px;
-                font-family: Poppins;
-                font-weight: bold;
-            }
-        """)
+        warning_label.setObjectName("DriversWarning")
         warning_label.setAlignment(Qt.AlignmentFlag.AlignVCenter)
 
         # → Buton + Uyarı yan yana
         calculate_row.addWidget(calculate_button)
         calculate_row.addWidget(save_button)
         calculate_row.addWidget(load_button)
+        calculate_row.addWidget(auto_assign_button)
         calculate_row.addWidget(warning_label)  # ← eski warning_widget yerine
         calculate_row.setSpacing(16)
         layout.addLayout(calculate_row)
 
-        # ✅ Buton fonksiyon bağlantıları
-        class_name = "hypercar"
-        car_name = "alpinea424"
-        track_name = "silverstonecircuit"
+        # ✅ Buton fonksiyon bağlantıları (class/car/track MainWindow seçicilerinden gelir)
+        self.current_class = ""
+        self.current_car = ""
+        self.current_track = ""
 
-        save_button.clicked.connect(lambda: self.save_inputs_to_json(class_name, car_name, track_name))
-        load_button.clicked.connect(lambda: self.load_inputs_from_json(class_name, car_name, track_name))
+        save_button.clicked.connect(
+            lambda: self.save_inputs_to_json(self.current_class, self.current_car, self.current_track)
+        )
+        load_button.clicked.connect(
+            lambda: self.load_inputs_from_json(self.current_class, self.current_car, self.current_track)
+        )
 
         self.table = QTableWidget()
         self.table.verticalHeader().setVisible(False)
@@ -280,82 +179,14 @@ class DriversTimePage(QWidget):
         self.table.setColumnWidth(1, 340)  # Strategy
         self.table.setColumnWidth(2, 800)  # Start - Finish
         self.table.setColumnWidth(3, 200)  # Driver
+        self.table.setItemDelegateForColumn(1, StintCardItemDelegate(self.table))
 
         palette = self.table.palette()
         palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30, 242))  # 0.95 opaklık
         self.table.setPalette(palette)
 
-        # ✅ Viewport için doğrudan stil uygula (en kritik satır)
-        self.table.viewport().setStyleSheet("""
-            background-color: rgba(30, 30, 30, 0.95);
-        """)
-
-        self.table.horizontalHeader().setStyleSheet("""
-            QHeaderView {
-                background: rgba(30, 30, 30, 0.95);
-            }
-            QHeaderView::section {
-                background-color: rgba(30, 30, 30, 0.95);
-                color: #ffd700;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 6px;
-                border: none;
-            }
-        """)
-
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: rgba(30, 30, 30, 0.95);
-                alternate-background-color: rgba(50, 50, 50, 0.9);
-                color: white;
-                font-size: 14px;
-                font-family: Poppins;
-                border: none;
-                gridline-color: transparent;
-            }
-
-            QTableWidget::item {
-                background-color: transparent;
-            }
-
-            QTableWidget QHeaderView::section {
-                background-color: transparent;
-                color: #ffd700;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 6px;
-                border: none;
-            }
-
-            QHeaderView::section {
-                background-color: transparent;
-                color: #ffd700;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 6px;
-                border: none;
-            }
-
-            QTableCornerButton::section {
-                background-color: rgba(30, 30, 30, 0.95);
-                border: none;
-            }
-
-            QScrollBar:vertical, QScrollBar:horizontal {
-                background: rgba(30, 30, 30, 0.5);
-            }
-
-            QScrollBar::handle {
-                background: #ffd700;
-                border-radius: 4px;
-            }
-
-            QScrollBar::add-line, QScrollBar::sub-line {
-                background: none;
-                border: none;
-            }
-        """)
+        # 🎨 Tablo, viewport ve hücre widget'ları ui/styles.qss'teki #DriversTable kurallarını kullanır
+        self.table.setObjectName("DriversTable")
 
         self.table.setColumnCount(4)
         self.table.setColumnWidth(1, 360)
@@ -368,39 +199,13 @@ class DriversTimePage(QWidget):
         self.table.setRowCount(10)
         for row in range(10):
             self.table.setItem(row, 0, QTableWidgetItem(f"Stint {row + 1}"))
-            self.table.setCellWidget(row, 3, QComboBox())
+            self.table.setCellWidget(row, 3, self.create_driver_combo(row))
 
         # 🔶 Sağdaki driver summary tablosu
         self.summary_table = QTableWidget()
         self.summary_table.setColumnCount(3)
         self.summary_table.setHorizontalHeaderLabels(["Driver", "Total Time", "Total %"])
-        self.summary_table.setStyleSheet("""
-            QTableWidget {
-                background-color: rgba(30, 30, 30, 0.95);
-                color: white;
-                font-size: 14px;
-                font-family: Poppins;
-                border: none;
-            }
-
-            QHeaderView {
-                background-color: transparent;
-            }
-
-            QTableWidget QHeaderView::section {
-                background-color: rgba(30, 30, 30, 0.95);
-                color: #ffd700;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 6px;
-                border: none;
-            }
-
-            QTableCornerButton::section {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.summary_table.setObjectName("DriverSummaryTable")
         self.summary_table.verticalHeader().setVisible(False)
         self.summary_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.summary_table.setFixedWidth(700)
@@ -416,62 +221,70 @@ class DriversTimePage(QWidget):
         layout.addLayout(table_row)
 
 
+    def refresh_strategy_radios(self, strategies: list[str]):
+        """Strateji listesi değiştiyse butonları yeniden kurar; seçim korunur."""
+        buttons = self.radio_group.buttons()
+        if [b.property("strategyKey") for b in buttons] != list(strategies):
+            for button in buttons:
+                self.radio_group.removeButton(button)
+                button.deleteLater()
+            for key in strategies:
+                radio = QRadioButton(strategy_label(key))
+                radio.setObjectName("StrategyRadio")
+                radio.setProperty("strategyKey", key)
+                radio.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)  # Genişliği içeriğe sabitle
+                self.radio_group.addButton(radio)
+                self.strategy_radio_layout.addWidget(radio)
+
+        for button in self.radio_group.buttons():
+            if button.property("strategyKey") == self.selected_strategy:
+                button.setChecked(True)
+
     def on_strategy_changed(self):
         btn = self.radio_group.checkedButton()
         if btn:
-            self.selected_strategy = btn.text().lower().replace(" ", "_")
+            self.selected_strategy = btn.property("strategyKey")
 
             if self.strategy_selected_callback:
-                widgets = self.get_cloned_strategy_widgets(self.selected_strategy)
-                self.strategy_selected_callback(widgets)
+                self.strategy_selected_callback(self.selected_strategy)
 
-    def load_inputs_from_json(self, class_name, car_name, track_name):
-        key = f"{class_name.lower()}_{car_name.lower()}_{track_name.lower()}".replace(" ", "")
-        filename = os.path.join("data", "strategy_inputs", f"{key}.json")
+    def set_current_context(self, class_name, car_name, track_name):
+        """MainWindow'daki class / car / track seçimi; kaydet / yükle bu dosyayı kullanır."""
+        self.current_class = class_name
+        self.current_car = car_name
+        self.current_track = track_name
 
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    def load_inputs_from_json(self, class_name, car_name, track_name):
+        inputs = strategy_repository.get(class_name, car_name, track_name)
 
+        if inputs.exists:
             # ✅ start_time varsa doğrudan QDateTime olarak ayarla
-            if "start_time" in data:
-                try:
-                    start_dt = QDateTime.fromString(data["start_time"], "dd MMM yyyy HH:mm")
-                    if start_dt.isValid():
-                        self.race_start_picker.setDateTime(start_dt)
-                except Exception as e:
-                    print("RST yüklenemedi:", e)
+            if inputs.start_time:
+                start_dt = QDateTime.fromString(inputs.start_time, "dd MMM yyyy HH:mm")
+                if start_dt.isValid():
+                    self.race_start_picker.setDateTime(start_dt)
+                else:
+                    print("RST yüklenemedi:", inputs.start_time)
 
             # ✅ Eğer driver_assignments varsa ComboBox’lara set et
-            if "driver_assignments" in data:
-                assignments = data["driver_assignments"]
-                for row, driver in assignments.items():
-                    try:
-                        combo = self.table.cellWidget(int(row), 3)  # Sütun 3: Driver
-                        if isinstance(combo, QComboBox):
-                            combo.setCurrentText(driver)
-                    except Exception as e:
-                        print(f"Driver yukleme hatasi (row={row}): {e}")
-
-            print(">>> JSON yüklendi:", data)
+            for row, driver in inputs.driver_assignments.items():
+                combo = self.table.cellWidget(row, 3)  # Sütun 3: Driver
+                if isinstance(combo, QComboBox):
+                    combo.setCurrentText(driver)
+
+            print(">>> JSON yüklendi:", inputs.key)
         else:
-            print(">>> Dosya bulunamadı:", filename)
+            print(">>> Dosya bulunamadı:", strategy_repository.path(inputs.key))
 
 
     def copy_strategy_widgets_direct(self, strategy_name):
-        index_map = {
-            "strategy_a": 2,
-            "strategy_b": 3,
-            "strategy_c": 4,
-            "strategy_d": 5
-        }
-        col_index = index_map.get(strategy_name)
-        if col_index is None:
+        if not hasattr(self, "strategy_store") or not self.strategy_store.has_strategy(strategy_name):
             return
 
+        plan = self.strategy_store.plan
+        self.loaded_strategy = strategy_name
+
         previous_drivers = {}
-        manual_times = {}
-        manual_flags = {}
         self.setFocus()
 
         for i in range(self.table.rowCount()):
@@ -479,170 +292,112 @@ class DriversTimePage(QWidget):
             if combo:
                 previous_drivers[i] = combo.currentText()
 
-            time_widget = self.table.cellWidget(i, 2)
-            if isinstance(time_widget, StintTimeWidget):
-                manual_times[i] = time_widget.get_times()
-                manual_flags[i] = time_widget.is_manual()
-
-
-        row_count = self.table_component.table.rowCount()
+        row_count = plan.row_count
         self.table.setRowCount(row_count)
 
-        global_start_time = self.race_start_picker.dateTime().toSecsSinceEpoch()
-        current_time = global_start_time
-
-        for i in range(row_count):
+        # --- SAAT HESAPLAMA (epoch saniyesi; override'lar satır bazında korunur) ---
+        records = [self.strategy_store.record(i, strategy_name) for i in range(row_count)]
+        # Süreler planın kümülatif toplamlarının farkı: satır başına yuvarlama birikmez
+        durations = []
+        elapsed = 0
+        for record in records:
+            total = round(record.total_seconds) if record else elapsed
+            durations.append(total - elapsed)
+            elapsed = total
+        self.schedule.rebuild(self.race_start_picker.dateTime().toSecsSinceEpoch(), durations)
+
+        for i, record in enumerate(records):
             self.table.setItem(i, 0, QTableWidgetItem(f"Stint {i + 1}"))
 
-            original_widget = self.table_component.table.cellWidget(i, col_index)
-            if original_widget is None:
-                continue
-
-            # --- STRATEGY KART KLONU ---
-            cloned_widget = original_widget.__class__()
-            cloned_widget.setFixedWidth(360)
-            cloned_widget.setFixedHeight(220)
-            cloned_layout = QVBoxLayout(cloned_widget)
-            cloned_layout.setSpacing(15)
-            fuel_virtual_row = QHBoxLayout()
-
-            for child in original_widget.findChildren(QLabel):
-                label_text = child.text()
-                copy_label = QLabel(label_text)
-                copy_label.setStyleSheet(child.styleSheet())
-                copy_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                copy_label.setFixedHeight(child.height())
-
-                if "Fuel" in label_text or "Virtual" in label_text:
-                    fuel_virtual_row.addWidget(copy_label)
-                else:
-                    cloned_layout.addWidget(copy_label)
-            cloned_layout.addLayout(fuel_virtual_row)
-            self.table.setCellWidget(i, 1, cloned_widget)
-
-            # --- STINT + PIT SÜRESİ ---
-            stint_seconds = 0
-            pit_seconds = 0
-            for lbl in original_widget.findChildren(QLabel):
-                txt = lbl.text()
-                if "Stint Time" in txt:
-                    try:
-                        t = txt.split(": ", 1)[-1]
-                        h, m, s = map(int, t.strip().split(":"))
-                        stint_seconds = h * 3600 + m * 60 + s
-                    except:
-                        pass
-                elif "Pit Time" in txt:
-                    try:
-                        t = txt.split(": ", 1)[-1]
-                        h, m, s = map(int, t.strip().split(":"))
-                        pit_seconds = h * 3600 + m * 60 + s
-                    except:
-                        pass
-            total_seconds = stint_seconds + pit_seconds
-
-            # --- SAAT HESAPLAMA ---
-            if i in manual_flags and manual_flags[i]:  # sadece checkbox işaretliyse işle
-                manual_start, manual_finish = manual_times.get(i, ("", ""))
-
-                # START
-                if manual_start.strip():
-                    start_str = manual_start.strip()
-                    start_qt = QTime.fromString(start_str, "HH:mm")
-                    if start_qt.isValid():
-                        date = self.race_start_picker.dateTime().date()
-                        start_dt = QDateTime(date, start_qt)
-                        current_time = start_dt.toSecsSinceEpoch()
-                    else:
-                        start_str = QDateTime.fromSecsSinceEpoch(int(current_time)).toString("HH:mm")
-                else:
-                    start_str = QDateTime.fromSecsSinceEpoch(int(current_time)).toString("HH:mm")
-
-                # FINISH
-                if manual_finish.strip():
-                    finish_str = manual_finish.strip()
-                    finish_qt = QTime.fromString(finish_str, "HH:mm")
-                    if finish_qt.isValid():
-                        date = self.race_start_picker.dateTime().date()
-                        finish_dt = QDateTime(date, finish_qt)
-                        current_time = finish_dt.toSecsSinceEpoch()
-                else:
-                    finish_time = current_time + total_seconds
-                    finish_str = QDateTime.fromSecsSinceEpoch(int(finish_time)).toString("HH:mm")
-                    current_time = finish_time
-
-            else:
-                start_str = QDateTime.fromSecsSinceEpoch(int(current_time)).toString("HH:mm")
-                finish_time = current_time + total_seconds
-                finish_str = QDateTime.fromSecsSinceEpoch(int(finish_time)).toString("HH:mm")
-                current_time = finish_time
+            # --- STRATEGY KARTI (delegate çizer, item sadece kaydı taşır) ---
+            card_item = self.table.item(i, 1)
+            if card_item is None:
+                card_item = QTableWidgetItem()
+                card_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                self.table.setItem(i, 1, card_item)
+            card_item.setText("-" if record is None else "")
+            card_item.setData(RecordRole, record)
 
-
-                # --- ZAMAN WIDGET'I EKLE ---
-                time_widget = StintTimeWidget(start_str, finish_str, editable=False)
+            # --- ZAMAN WIDGET'I (varsa yeniden kullanılır) ---
+            time_widget = self.table.cellWidget(i, 2)
+            if not isinstance(time_widget, StintTimeWidget):
+                time_widget = StintTimeWidget(row=i)
+                time_widget.override_changed.connect(self.on_time_override_changed)
                 self.table.setCellWidget(i, 2, time_widget)
+            self.update_time_widget(i)
 
             # --- DRIVER ---
-            combo = QComboBox()
-            combo.addItem("-")
-            combo.addItems(self.pilot_list)
+            combo = self.create_driver_combo(i)
             if i in previous_drivers:
                 combo.setCurrentText(previous_drivers[i])
 
-            strategy_widget = self.table.cellWidget(i, 1)
-            is_disabled = False
-            if strategy_widget is None or strategy_widget.findChild(QLabel) is None:
-                is_disabled = True
-            else:
-                texts = [lbl.text().strip() for lbl in strategy_widget.findChildren(QLabel)]
-                if all(t == "" or t == "-" for t in texts):
-                    is_disabled = True
-
-            combo.setEnabled(not is_disabled)
-            combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: {"#2a2a2a" if is_disabled else "rgba(255, 215, 0, 0.4)"};
-                    color: {"#555555" if is_disabled else "white"};
-                    border: none;
-                    padding: 6px;
-                    border-radius: 4px;
-                    font-family: Poppins;
-                }}
-                QComboBox QAbstractItemView {{
-                    background-color: rgba(30, 30, 30, 0.25);
-                    color: white;
-                    selection-background-color: #ffd700;
-                }}
-            """)
+            # Kaydı olmayan stint'e pilot atanamaz (:disabled stili)
+            combo.setEnabled(record is not None)
             self.table.setCellWidget(i, 3, combo)
 
+    def update_time_widget(self, row: int):
+        time_widget = self.table.cellWidget(row, 2)
+        if isinstance(time_widget, StintTimeWidget) and row < len(self.schedule):
+            time_widget.set_times(self.schedule.starts[row], self.schedule.finishes[row],
+                                  self.schedule.has_override(row))
+
+    def on_time_override_changed(self, row: int):
+        """Elle girilen saat değişti: sadece bu satırdan sonra etkilenen stint'ler yeniden hesaplanır."""
+        time_widget = self.table.cellWidget(row, 2)
+        if not isinstance(time_widget, StintTimeWidget) or row >= len(self.schedule):
+            return
+
+        if not time_widget.is_manual():
+            changed = self.schedule.clear_override(row)
+        else:
+            chain_start, chain_finish = self.schedule.chain_times(row)
+            start_text, finish_text = time_widget.get_times()
+            start = resolve_clock(start_text, chain_start) if start_text else None
+            finish = resolve_clock(finish_text, chain_finish) if finish_text else None
+            if (start_text and start is None) or (finish_text and finish is None):
+                print(f"❌ Stint {row + 1}: geçersiz saat (HH:mm ya da HH:mm:ss):", start_text, finish_text)
+            changed = self.schedule.set_override(row, start, finish)
+
+        for i in changed:
+            self.update_time_widget(i)
+        # Geçersiz metin zincirdeki değere döner
+        self.update_time_widget(row)
+        self.update_driver_summary_table()
 
     def set_table_component(self, table_component):
         self.table_component = table_component
 
+    def set_strategy_store(self, store):
+        self.strategy_store = store
+        store.rows_changed.connect(self.on_strategy_rows_changed)
+        store.plan_changed.connect(lambda plan: self.refresh_strategy_radios(store.strategies))
+        self.refresh_strategy_radios(store.strategies)
+
+    def on_strategy_rows_changed(self, first, last):
+        # Pit ayarı değişince tablodaki kartlar yeni kayıtlarla güncellenir
+        # (satır sayısı / saatler için Calculate gerekir)
+        strategy = getattr(self, "loaded_strategy", None)
+        if strategy is None:
+            return
+        for i in range(first, min(last + 1, self.table.rowCount())):
+            card_item = self.table.item(i, 1)
+            record = self.strategy_store.record(i, strategy)
+            if card_item is not None and record is not None:
+                card_item.setData(RecordRole, record)
+
     def save_inputs_to_json(self, class_name, car_name, track_name):
-        key = f"{class_name.lower()}_{car_name.lower()}_{track_name.lower()}".replace(" ", "")
-        filename = os.path.join("data", "strategy_inputs", f"{key}.json")
-
-        # 🔁 JSON'u tek seferde oku
-        if os.path.exists(filename):
-            try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except:
-                print(">>> JSON okunamadı, boş başlatıldı.")
-                data = {}
-        else:
-            data = {}
+        key = strategy_key(class_name, car_name, track_name)
 
         # ✅ Güncellemeler
-        data["start_time"] = self.race_start_picker.dateTime().toString("dd MMM yyyy HH:mm")
-        data["team"] = self.team_selector.currentText()
-        data["loadstrategy"] = self.selected_strategy
+        changes = {
+            "start_time": self.race_start_picker.dateTime().toString("dd MMM yyyy HH:mm"),
+            "team": self.team_selector.currentText(),
+            "loadstrategy": self.selected_strategy,
+        }
 
-        # 🔁 race_time korunuyorsa elleme, sadece varsa yeniden yaz
-        if "race_time" not in data:
-            data["race_time"] = "00:00:00"
+        # 🔁 race_time korunuyorsa elleme, yoksa varsayılanı yaz
+        if not strategy_repository.get_by_key(key).race_time:
+            changes["race_time"] = "00:00:00"
 
         # ✅ QComboBox'lardan pilot seçimlerini al
         assignments = {}
@@ -653,13 +408,11 @@ class DriversTimePage(QWidget):
                 if selected_driver and selected_driver != "-":
                     assignments[str(row)] = selected_driver
 
-        data["driver_assignments"] = assignments
+        changes["driver_assignments"] = assignments
 
-        # 🔁 Dosyaya kaydet
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-
-        print(">>> JSON güncellendi:", filename)
+        # 🔁 Bellekteki belgeye birleştir; dosyaya arka planda yazılır
+        strategy_repository.update(key, changes)
+        print(">>> JSON güncellendi:", strategy_repository.path(key))
 
 
 
@@ -706,72 +459,82 @@ class DriversTimePage(QWidget):
         if os.path.exists(filepath):
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
+                self.team_document = data
                 self.driver_list = [d for d in data.get("drivers", []) if d.strip()]
                 self.pilot_list = self.driver_list
 
-                # ✅ Her pilota sırayla renk ata (dinamik)
-                base_colors = ["#FFD700", "#00BFFF", "#32CD32", "#FF8C00", "#BA55D3", "#DC143C"]
-                self.driver_colors = {
-                    driver: base_colors[i % len(base_colors)]
+                # ✅ Her pilota sırayla renk yuvası ata (renkler styles.qss'te driverSlot ile)
+                self.driver_slots = {
+                    driver: str(i % DRIVER_COLOR_COUNT)
                     for i, driver in enumerate(self.pilot_list)
                 }
 
                 self.populate_driver_dropdowns()
 
+    def auto_assign_drivers(self):
+        """
+        Stint zaman çizelgesi ve takım kurallarıyla dengeli rotasyonu çözer
+        ve pilot combo'larını doldurur.
+        """
+        if not hasattr(self, "strategy_store") or not self.strategy_store.has_strategy(self.selected_strategy):
+            print("❌ Otomatik atama için önce Prerace Stint Calculator'da plan hesaplanmalı.")
+            return
+        rules = RotationRules.from_team(self.team_document)
+        if not rules.drivers:
+            print("❌ Otomatik atama için takımda pilot yok:", getattr(self, "team_name", ""))
+            return
+
+        if getattr(self, "loaded_strategy", None) != self.selected_strategy:
+            self.copy_strategy_widgets_direct(self.selected_strategy)
+
+        store = self.strategy_store
+        strategy = self.selected_strategy
+        rows, durations, night = [], [], []
+        for row in range(min(self.table.rowCount(), len(self.schedule))):
+            if store.record(row, strategy) is None:
+                continue
+            # Elle girilen saatler dahil gerçek süre ve zaman
+            seconds = self.schedule.duration(row)
+            rows.append(row)
+            durations.append(seconds)
+            night.append(rules.is_night(self.schedule.starts[row] + seconds / 2))
+
+        started = time.perf_counter()
+        result = solve_rotation(durations, night, rules)
+        print(f"🧮 Rotasyon: {len(rows)} stint × {len(rules.drivers)} pilot "
+              f"{(time.perf_counter() - started) * 1000:.0f} ms")
+
+        for row, name in zip(rows, result.names):
+            combo = self.table.cellWidget(row, 3)
+            if isinstance(combo, QComboBox):
+                combo.setCurrentText(name)
+        self.update_driver_summary_table()
+
+        if result.violations:
+            QMessageBox.warning(self, "Auto Assign", "Kurallar tam sağlanamadı:\n" + "\n".join(result.violations))
+
     def populate_driver_dropdowns(self):
         if not hasattr(self, "table"):
             return  # tablo henüz yoksa boş geç
 
         row_count = self.table.rowCount()
         for row in range(row_count):
-            combo = QComboBox()
-            combo.addItem("-")
-            combo.addItems(self.driver_list)
-
-            # ✅ Varsayılan pilot ve renk belirleme
-            driver_name = combo.currentText().strip()
-            bg_color = self.driver_colors.get(driver_name, "#2a2a2a")
-
-            # ✅ Stil uygula
-            combo.setStyleSheet(f"""
-                QComboBox {{
-                    background-color: {bg_color};
-                    color: white;
-                    border: none;
-                    padding: 6px;
-                    border-radius: 4px;
-                    font-family: Poppins;
-                }}
-                QComboBox QAbstractItemView {{
-                    background-color: rgba(30, 30, 30, 0.95);
-                    color: white;
-                    selection-background-color: #FFD700;
-                }}
-            """)
-
-            # ✅ Seçim değişirse arka plan güncelle
-            combo.currentTextChanged.connect(lambda _, row=row, combo=combo: self.update_driver_style(row, combo))
-
-            self.table.setCellWidget(row, 3, combo)
+            self.table.setCellWidget(row, 3, self.create_driver_combo(row))
+
+    def create_driver_combo(self, row):
+        combo = QComboBox()
+        combo.setObjectName("DriverCombo")
+        combo.addItem("-")
+        combo.addItems(self.pilot_list)
+        combo.setProperty("driverSlot", "")
+
+        # ✅ Seçim değişirse sadece driverSlot property'si değişir
+        combo.currentTextChanged.connect(lambda _, row=row, combo=combo: self.update_driver_style(row, combo))
+        return combo
 
     def update_driver_style(self, row, combo):
         driver = combo.currentText().strip()
-        bg_color = self.driver_colors.get(driver, "#2a2a2a")
-        combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {bg_color};
-                color: white;
-                border: none;
-                padding: 6px;
-                border-radius: 4px;
-                font-family: Poppins;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: rgba(30, 30, 30, 0.95);
-                color: white;
-                selection-background-color: #FFD700;
-            }}
-        """)
+        set_style_property(combo, "driverSlot", self.driver_slots.get(driver, ""))
 
     def load_teams_to_dropdown(self):
         self.team_selector.clear()
@@ -799,27 +562,12 @@ class DriversTimePage(QWidget):
                 continue  # boş seçimleri atla
 
             # Strategy hücresi kontrolü (zorunlu değil ama varsa korunabilir)
-            strategy_widget = self.table.cellWidget(row, 1)
-            if not strategy_widget:
+            strategy_item = self.table.item(row, 1)
+            if strategy_item is None or strategy_item.data(RecordRole) is None:
                 continue
 
-            # 🔄 Start-Finish saat farkından süreyi hesapla
-            time_widget = self.table.cellWidget(row, 2)
-            if time_widget:
-                if isinstance(time_widget, StintTimeWidget):
-                    start_str, finish_str = time_widget.get_times()
-                    start_time = QTime.fromString(start_str, "HH:mm")
-                    finish_time = QTime.fromString(finish_str, "HH:mm")
-                    if start_time.isValid() and finish_time.isValid():
-                        total = start_time.secsTo(finish_time)
-                        if total < 0:
-                            total += 24 * 3600  # gece yarısı aşımı için düzeltme
-                    else:
-                        total = 0
-                else:
-                    total = 0
-            else:
-                total = 0
+            # 🔄 Süre çizelgeden (epoch saniyesi, override'lar dahil)
+            total = self.schedule.duration(row) if row < len(self.schedule) else 0
 
             # 🔢 Toplam süreyi topla
             total_race_seconds += total
@@ -829,7 +577,7 @@ class DriversTimePage(QWidget):
         self.summary_table.setRowCount(len(driver_times))
 
         for i, (driver, total_sec) in enumerate(driver_times.items()):
-            time_str = QTime(0, 0).addSecs(total_sec).toString("hh:mm:ss")
+            time_str = format_time(total_sec)
             percent = (total_sec / total_race_seconds * 100) if total_race_seconds > 0 else 0
 
             # 🎯 Hücreler
@@ -856,108 +604,37 @@ class DriversTimePage(QWidget):
             # 🎯 Total % hücresi QLabel ile (garanti stil)
             label_percent = QLabel(f"{percent:.1f}%")
             label_percent.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label_percent.setStyleSheet(f"""
-                background-color: {"#e74c3c" if percent >= 70 else "transparent"};
-                color: {"white" if percent >= 70 else "white"};
-                font-size: 16px;
-                font-weight: bold;
-                font-family: Poppins;
-                padding: 6px;
-                border-radius: 4px;
-            """)
+            label_percent.setObjectName("DriverPercent")
+            label_percent.setProperty("warning", percent >= 70)
 
             self.summary_table.setCellWidget(i, 2, label_percent)
 
-    def get_cloned_strategy_widgets(self, strategy_name: str):
-        index_map = {
-            "strategy_a": 2,
-            "strategy_b": 3,
-            "strategy_c": 4,
-            "strategy_d": 5
-        }
-        col_index = index_map.get(strategy_name)
-        if col_index is None or not hasattr(self, "table_component"):
-            return []
-
-        widgets = []
-        row_count = self.table_component.table.rowCount()
-
-        for i in range(row_count):
-            original_widget = self.table_component.table.cellWidget(i, col_index)
-            if original_widget is None:
-                continue
-
-            # yeni widget
-            cloned_widget = QWidget()
-            layout = QVBoxLayout(cloned_widget)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setSpacing(6)
-            fuel_virtual_row = QHBoxLayout()
-
-            for child in original_widget.findChildren(QLabel):
-                lbl = QLabel(child.text())
-                lbl.setStyleSheet(child.styleSheet())
-                lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                if "Fuel" in child.text() or "Virtual" in child.text():
-                    fuel_virtual_row.addWidget(lbl)
-                else:
-                    layout.addWidget(lbl)
-
-            layout.addLayout(fuel_virtual_row)
-            widgets.append(cloned_widget)
-
-        return widgets
-
 class StintTimeWidget(QWidget):
-    def __init__(self, start_text="", finish_text="", editable=False):
+    # Elle girilen saat ya da manuel mod değişti (satır)
+    override_changed = pyqtSignal(int)
+
+    def __init__(self, start_text="", finish_text="", editable=False, row=0):
         super().__init__()
+        self.row = row
+
+        self.setObjectName("StintTimeWidget")
 
         self.start_input = QLineEdit(start_text)
+        self.start_input.setObjectName("StintStart")
         self.finish_input = QLineEdit(finish_text)
-        self.start_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2ecc71;  /* Yeşil */
-                color: white;
-                font-weight: bold;
-                border: 1px solid #27ae60;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-family: Poppins;
-            }
-        """)
-        self.finish_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #e74c3c;  /* Kırmızı */
-                color: white;
-                font-weight: bold;
-                border: 1px solid #c0392b;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-family: Poppins;
-            }
-        """)
+        self.finish_input.setObjectName("StintFinish")
 
         for input in (self.start_input, self.finish_input):
-            input.setFixedWidth(60)
+            input.setFixedWidth(80)
             input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            input.setStyleSheet("""
-                QLineEdit {
-                    background-color: #222;
-                    color: white;
-                    font-weight: bold;
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    padding: 4px;
-                    font-family: Poppins;
-                }
-            """)
+            input.editingFinished.connect(self.on_editing_finished)
 
         self.checkbox = QCheckBox("🖊️")
         self.checkbox.setChecked(editable)
         self.checkbox.setToolTip("Manuel saat girişi")
         self.checkbox.stateChanged.connect(self.toggle_editable)
 
-        self.toggle_editable()
+        self.toggle_editable(emit=False)
 
         layout = QVBoxLayout(self)
         row = QHBoxLayout()
@@ -970,41 +647,32 @@ class StintTimeWidget(QWidget):
         layout.addWidget(self.checkbox)
 
         self.setLayout(layout)
-        self.setStyleSheet("color: white;")
 
-    def toggle_editable(self):
+    def toggle_editable(self, *_, emit=True):
         editable = self.checkbox.isChecked()
         self.start_input.setReadOnly(not editable)
         self.finish_input.setReadOnly(not editable)
-
-        self.start_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: #2ecc71;
-                color: white;
-                font-weight: bold;
-                border: 1px solid #27ae60;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-family: Poppins;
-            }}
-        """)
-        self.finish_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: #e74c3c;
-                color: white;
-                font-weight: bold;
-                border: 1px solid #c0392b;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-family: Poppins;
-            }}
-        """)
+        if emit:
+            self.override_changed.emit(self.row)
+
+    def on_editing_finished(self):
+        if self.is_manual():
+            self.override_changed.emit(self.row)
+
+    def set_times(self, start: int, finish: int, manual: bool = None):
+        """Epoch saniyeleri "HH:mm:ss" olarak gösterilir; tam tarih tooltip'te."""
+        self.start_input.setText(format_clock(start))
+        self.finish_input.setText(format_clock(finish))
+        self.start_input.setToolTip(format_datetime(start))
+        self.finish_input.setToolTip(format_datetime(finish))
+        if manual is not None and manual != self.checkbox.isChecked():
+            self.checkbox.blockSignals(True)
+            self.checkbox.setChecked(manual)
+            self.checkbox.blockSignals(False)
+            self.toggle_editable(emit=False)
 
     def get_times(self):
         return self.start_input.text().strip(), self.finish_input.text().strip()
 
     def is_manual(self):
         return self.checkbox.isChecked()
-
-
-
@@ -0,0 +1,297 @@
+# pages/fcy_engine.py
+"""
+FCY (Full Course Yellow) altında yeniden strateji motoru.
+
+Qt'ye bağımlı değildir. Kalan yarış süresi, planın form değerleri
+(PlanInputs) ve mevcut stint / yakıt / lastik durumu ile "şimdi pit",
+"k tur sonra pit" ve "pit yok" seçeneklerinin tamamını, ilk pitte lastik
+değişimli ve değişimsiz olarak, bayrak anında tamamlanmış beklenen tur
+sayısına göre sıralar.
+
+Zaman modeli: FCY penceresi boyunca tur süresi lap_time_factor kadar uzar;
+pit süresi (pit lane + servis) plandaki gibi saf zaman kaybıdır. Pencere
+mutlak zamanda sabit olduğundan FCY'ye denk gelen pit daha az mesafe
+kaybettirir. FCY bittikten sonraki kısım kapalı formda hesaplanır, bu yüzden
+bir seçeneğin maliyeti kalan stint sayısından bağımsızdır (tüm seçenekler
+milisaniyenin altında).
+"""
+import math
+from dataclasses import dataclass, replace
+
+from pages.stint_plan import PlanInputs, StintRecord, TIME_EPSILON
+
+# FCY'de tur süresi çarpanı ve kalan FCY süresi bilinmiyorsa varsayılan
+FCY_LAP_TIME_FACTOR = 1.5
+FCY_EXPECTED_SECONDS = 180.0
+MAX_TIRE_WEAR = 100.0
+FCY_STRATEGY = "strategy_fcy_auto"
+
+
+@dataclass(frozen=True)
+class FcyState:
+    """FCY anındaki durum (süreler saniye, yakıt litre)."""
+    remaining_seconds: float
+    # Dolu depoyla planlanan stint uzunluğu (tur)
+    stint_laps: int
+    laps_into_stint: float = 0
+    # Depodaki yakıt; None ise stint başında dolu depo varsayılır
+    fuel: float = None
+    # Lastiklerin tur sayısı; None ise laps_into_stint
+    tire_laps: float = None
+    fcy_seconds: float = FCY_EXPECTED_SECONDS
+    lap_time_factor: float = FCY_LAP_TIME_FACTOR
+
+
+@dataclass(frozen=True)
+class FcyOption:
+    # None: bayrağa kadar pit yok
+    pit_in_laps: int
+    change_tires: bool
+    # Bayrak anında beklenen tur (kesirli, sıralama ölçütü)
+    finish_laps: float
+    # Bu pit dahil kalan pit sayısı
+    stops: int
+    # Şu andan itibaren ilk pitin başladığı an ve süresi
+    pit_at_seconds: float = 0.0
+    pit_seconds: float = 0.0
+    fuel_added: float = 0.0
+    under_fcy: bool = False
+    # Plana göre (stint sonunda lastikli pit) kazanç, yeşil bayrak saniyesi
+    gain_seconds: float = 0.0
+
+    @property
+    def title(self) -> str:
+        if self.pit_in_laps is None:
+            return "No stop"
+        if self.pit_in_laps == 0:
+            return "Pit now"
+        return f"Pit in {self.pit_in_laps} lap" + ("s" if self.pit_in_laps > 1 else "")
+
+    @property
+    def service(self) -> str:
+        if self.pit_in_laps is None:
+            return "-"
+        return "Fuel + Tires" if self.change_tires else "Fuel only"
+
+
+def drive_seconds(laps: float, start: float, fcy_end: float, lap: float, fcy_lap: float) -> float:
+    """start anından itibaren laps tur sürmenin süresi (FCY penceresi fcy_end'e kadar)."""
+    if start >= fcy_end:
+        return laps * lap
+    fcy_laps = (fcy_end - start) / fcy_lap
+    if laps <= fcy_laps:
+        return laps * fcy_lap
+    return (fcy_end - start) + (laps - fcy_laps) * lap
+
+
+def laps_in(seconds: float, start: float, fcy_end: float, lap: float, fcy_lap: float) -> float:
+    """start anından itibaren seconds sürede gidilen tur."""
+    if start >= fcy_end:
+        return seconds / lap
+    fcy_part = min(seconds, fcy_end - start)
+    return fcy_part / fcy_lap + (seconds - fcy_part) / lap
+
+
+class FcyEngine:
+    """
+    engine = FcyEngine(plan.inputs)
+    engine.options(state)          -> [FcyOption, ...] (en iyi önce)
+    engine.column(plan, ...)       -> seçilen seçeneğin StintRecord sütunu
+    """
+
+    def __init__(self, inputs: PlanInputs, tire_consumption: float = 0.0):
+        self.inputs = inputs
+        self.tire_consumption = tire_consumption
+
+    def full_fuel(self, state: FcyState) -> float:
+        return state.stint_laps * self.inputs.fuel_consumption
+
+    def stop_seconds(self, state: FcyState, litres: float, tires: bool) -> float:
+        """Pit lane + yakıt (doldurulan miktarla orantılı) + isteğe bağlı lastik."""
+        full = self.full_fuel(state)
+        refuel = self.inputs.fuel_time * (litres / full) if full > 0 else 0.0
+        return self.inputs.pit_lane_time + refuel + (self.inputs.tire_time if tires else 0.0)
+
+    def tires_ok(self, laps: float) -> bool:
+        return self.tire_consumption <= 0 or laps * self.tire_consumption <= MAX_TIRE_WEAR + TIME_EPSILON
+
+    def simulate(self, state: FcyState, pit_in_laps, change_tires: bool, trace: list = None):
+        """
+        Seçeneği bayrağa kadar yürütür; uygun değilse None, aksi halde FcyOption.
+        trace verilirse her stint (tur, sürüş, pit) olarak eklenir.
+        """
+        lap = self.inputs.average_lap_time
+        remaining = state.remaining_seconds
+        if lap <= 0 or remaining <= 0 or state.stint_laps <= 0:
+            return None
+        fcy_lap = lap * state.lap_time_factor
+        fcy_end = min(max(state.fcy_seconds, 0.0), remaining)
+        per_lap = self.inputs.fuel_consumption
+        fuel = state.fuel if state.fuel is not None else self.full_fuel(state) - state.laps_into_stint * per_lap
+        fuel_laps = fuel / per_lap if per_lap > 0 else math.inf
+        tire_laps = state.tire_laps if state.tire_laps is not None else state.laps_into_stint
+
+        def drive(laps, start):
+            return drive_seconds(laps, start, fcy_end, lap, fcy_lap)
+
+        def covered(seconds, start):
+            return laps_in(seconds, start, fcy_end, lap, fcy_lap)
+
+        if pit_in_laps is None:
+            distance = covered(remaining, 0.0)
+            if distance > fuel_laps + TIME_EPSILON or not self.tires_ok(tire_laps + distance):
+                return None
+            if trace is not None:
+                trace.append((distance, remaining, 0.0))
+            return FcyOption(None, False, distance, 0)
+
+        if pit_in_laps > fuel_laps + TIME_EPSILON or not self.tires_ok(tire_laps + pit_in_laps):
+            return None
+        pit_at = drive(pit_in_laps, 0.0)
+        if pit_at + self.inputs.pit_lane_time >= remaining:
+            return None  # bayrak pitten önce iniyor: "pit yok" ile aynı
+
+        litres = max(0.0, self.full_fuel(state) - (fuel - pit_in_laps * per_lap))
+        first_stop = self.stop_seconds(state, litres, change_tires)
+        if trace is not None:
+            trace.append((pit_in_laps, pit_at, first_stop))
+        t = pit_at + first_stop
+        distance = float(pit_in_laps)
+        stops = 1
+        tire_laps = 0 if change_tires else tire_laps + pit_in_laps
+
+        stint_laps = state.stint_laps
+        full_stop = self.stop_seconds(state, self.full_fuel(state), True)
+
+        def finish_stint(start):
+            """start'tan bayrağa kadar tek stint yetiyorsa mesafesi, yoksa None."""
+            left = remaining - start
+            if drive(stint_laps, start) + self.inputs.pit_lane_time < left:
+                return None
+            return covered(left, start)
+
+        # FCY hâlâ sürüyorsa stint'ler tek tek yürütülür (en fazla birkaç stint)
+        while t < fcy_end or (trace is not None and t < remaining):
+            last = finish_stint(t)
+            if last is not None:
+                if not self.tires_ok(tire_laps + last):
+                    return None
+                if trace is not None:
+                    trace.append((last, remaining - t, 0.0))
+                return self._option(state, pit_in_laps, change_tires, distance + last, stops,
+                                    pit_at, first_stop, litres, fcy_end)
+            if not self.tires_ok(tire_laps + stint_laps):
+                return None
+            stint = drive(stint_laps, t)
+            if trace is not None:
+                trace.append((stint_laps, stint, full_stop))
+            t += stint + full_stop
+            distance += stint_laps
+            stops += 1
+            tire_laps = 0
+
+        # Yeşil bayrak kuyruğu (kapalı form): her ara stint stint_laps tur + tam pit
+        left = remaining - t
+        if left > 0:
+            if not self.tires_ok(tire_laps + min(stint_laps, left / lap)):
+                return None
+            cycle = stint_laps * lap + full_stop
+            extra_stops = max(0, math.ceil((left - stint_laps * lap - self.inputs.pit_lane_time) / cycle))
+            distance += (left - extra_stops * full_stop) / lap
+            stops += extra_stops
+
+        return self._option(state, pit_in_laps, change_tires, distance, stops,
+                            pit_at, first_stop, litres, fcy_end)
+
+    @staticmethod
+    def _option(state, pit_in_laps, change_tires, distance, stops, pit_at, first_stop, litres, fcy_end):
+        return FcyOption(
+            pit_in_laps=pit_in_laps,
+            change_tires=change_tires,
+            finish_laps=distance,
+            stops=stops,
+            pit_at_seconds=pit_at,
+            pit_seconds=first_stop,
+            fuel_added=litres,
+            under_fcy=pit_at < fcy_end,
+        )
+
+    def plan_option(self, state: FcyState):
+        """Planın kendi kararı: stint sonunda lastikli pit (yakıt yetmiyorsa daha erken)."""
+        per_lap = self.inputs.fuel_consumption
+        fuel = state.fuel if state.fuel is not None else self.full_fuel(state) - state.laps_into_stint * per_lap
+        planned = max(0, math.ceil(state.stint_laps - state.laps_into_stint - TIME_EPSILON))
+        if per_lap > 0:
+            planned = min(planned, int(fuel / per_lap + TIME_EPSILON))
+        return self.simulate(state, None, False) or self.simulate(state, planned, True)
+
+    def options(self, state: FcyState) -> list[FcyOption]:
+        """Tüm uygun pit-şimdi / pit-sonra / pit-yok seçenekleri, en iyi önce."""
+        per_lap = self.inputs.fuel_consumption
+        fuel = state.fuel if state.fuel is not None else self.full_fuel(state) - state.laps_into_stint * per_lap
+        max_laps = int(fuel / per_lap + TIME_EPSILON) if per_lap > 0 else state.stint_laps
+        if self.inputs.average_lap_time > 0:
+            # Bayraktan sonrası için seçenek üretmeye gerek yok
+            max_laps = min(max_laps, int(state.remaining_seconds / self.inputs.average_lap_time) + 1)
+
+        candidates = [self.simulate(state, None, False)]
+        for laps in range(max(0, max_laps) + 1):
+            candidates.append(self.simulate(state, laps, True))
+            candidates.append(self.simulate(state, laps, False))
+        options = [o for o in candidates if o is not None]
+
+        baseline = self.plan_option(state)
+        base_laps = baseline.finish_laps if baseline is not None else None
+        if base_laps is not None:
+            lap = self.inputs.average_lap_time
+            options = [replace(o, gain_seconds=(o.finish_laps - base_laps) * lap) for o in options]
+
+        options.sort(key=lambda o: (
+            -round(o.finish_laps, 6), o.stops, not o.change_tires,
+            o.pit_in_laps if o.pit_in_laps is not None else -1
+        ))
+        return options
+
+    def column(self, state: FcyState, option: FcyOption, base_records: list, row: int,
+               race_time: float, strategy: str = FCY_STRATEGY, strategy_index: int = 0) -> list:
+        """
+        Seçeneğin stint sütunu: base_records[:row] aynen kalır, row'daki stint
+        FCY pitine kadar uzar/kısalır, sonrası seçeneğe göre yeniden kurulur.
+        """
+        trace = []
+        if self.simulate(state, option.pit_in_laps, option.change_tires, trace) is None:
+            return []
+
+        inputs = self.inputs
+        records = []
+        for r in base_records[:row]:
+            records.append(StintRecord(
+                row=r.row, strategy=strategy, strategy_index=strategy_index, laps=r.laps,
+                stint_seconds=r.stint_seconds, pit_seconds=r.pit_seconds, total_seconds=r.total_seconds,
+                remaining_seconds=r.remaining_seconds, fuel=r.fuel, virtual=r.virtual, extra_laps=r.extra_laps,
+            ))
+
+        elapsed_race = race_time - state.remaining_seconds
+        stint_start = records[-1].total_seconds if records else 0.0
+        # Aktif stint'in FCY'den önce sürülen kısmı ilk parçaya eklenir
+        carried_laps = state.laps_into_stint
+        carried_seconds = max(0.0, elapsed_race - stint_start)
+        total = stint_start
+        for i, (laps, drive, pit) in enumerate(trace):
+            laps_total = laps + carried_laps
+            stint_seconds = drive + carried_seconds
+            carried_laps = carried_seconds = 0.0
+            total += stint_seconds + pit
+            records.append(StintRecord(
+                row=row + i,
+                strategy=strategy,
+                strategy_index=strategy_index,
+                laps=int(round(laps_total)),
+                stint_seconds=stint_seconds,
+                pit_seconds=pit,
+                total_seconds=total,
+                remaining_seconds=max(0.0, race_time - total),
+                fuel=inputs.fuel_consumption * laps_total,
+                virtual=inputs.virtual_fuel * laps_total,
+            ))
+        return records
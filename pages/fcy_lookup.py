@@ -0,0 +1,179 @@
+# pages/fcy_lookup.py
+"""
+Tüm yarış için önceden hesaplanmış FCY cevap tablosu.
+
+Plan hesaplandıktan sonra arka planda, her strateji için kalan sürenin her
+dakikası × mevcut stint'teki tur sayısı (0..stint_laps) ızgarasında FCY
+motorunun (pages.fcy_engine) en iyi seçeneği NumPy ile tek geçişte bulunur.
+Sonuç kompakt bir int16 dizisidir; FCY başladığında öneri bir dizi
+erişimidir (O(1)), tam sıralama beklenmez.
+
+Izgara, telemetri olmadan planın varsaydığı durumu kullanır: stint başında
+dolu depo, lastikler stint başında değişmiş, FCY_EXPECTED_SECONDS'lık FCY.
+"""
+from dataclasses import replace
+
+import numpy as np
+
+from pages.fcy_engine import FcyEngine, FcyState, FCY_EXPECTED_SECONDS, FCY_LAP_TIME_FACTOR, MAX_TIRE_WEAR
+from pages.stint_plan import PlanInputs, PlanCancelled, TIME_EPSILON
+
+# Hücre kodları: k tur sonra pit -> 2k (+1 lastik değişimi); pit yok / uygun seçenek yok
+NO_STOP = -1
+NO_OPTION = -2
+TIE_EPSILON = 1e-6
+
+
+class FcyLookup:
+    """
+    codes[m, j]: kalan süre m dakika (m*60 .. m*60+59 s), stint'te j tur
+    tamamlanmışken en iyi seçeneğin kodu. finish_laps aynı ızgarada bayrakta
+    beklenen tur.
+    """
+
+    def __init__(self, strategy: str, stint_laps: int, codes: np.ndarray, finish_laps: np.ndarray):
+        self.strategy = strategy
+        self.stint_laps = stint_laps
+        self.codes = codes
+        self.finish_laps = finish_laps
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.finish_laps.nbytes
+
+    def code(self, remaining_seconds: float, laps_into_stint: float) -> int:
+        minute = min(max(int(remaining_seconds // 60), 0), self.codes.shape[0] - 1)
+        lap = min(max(int(round(laps_into_stint)), 0), self.codes.shape[1] - 1)
+        return int(self.codes[minute, lap])
+
+    def recommend(self, engine: FcyEngine, state: FcyState):
+        """
+        Tablodaki seçenek (pit turu, lastik) anlık durum için motorla bir kez
+        yürütülür; uygun değilse None (çağıran tam sıralamaya düşer).
+        """
+        code = self.code(state.remaining_seconds, state.laps_into_stint)
+        if code == NO_OPTION:
+            return None
+        if code == NO_STOP:
+            option = engine.simulate(state, None, False)
+        else:
+            option = engine.simulate(state, code // 2, bool(code % 2))
+        if option is None:
+            return None
+
+        baseline = engine.plan_option(state)
+        if baseline is None:
+            return option
+        gain = (option.finish_laps - baseline.finish_laps) * engine.inputs.average_lap_time
+        return replace(option, gain_seconds=gain)
+
+
+def build_fcy_lookup(inputs: PlanInputs, stint_laps: int, tire_consumption: float = 0.0,
+                     strategy: str = "", fcy_seconds: float = FCY_EXPECTED_SECONDS,
+                     lap_time_factor: float = FCY_LAP_TIME_FACTOR, cancelled=None) -> FcyLookup:
+    """
+    FcyEngine.simulate'in ızgara üzerinde vektörize hali; her (pit turu,
+    lastik) seçeneği tüm hücreler için bir kez hesaplanır ve en iyisi tutulur.
+    cancelled: seçenek başına sorulur; True dönerse PlanCancelled.
+    """
+    minutes = int(inputs.race_time // 60) + 1
+    lap = inputs.average_lap_time
+    codes = np.full((minutes, stint_laps + 1), NO_OPTION, dtype=np.int16)
+    best = np.full(codes.shape, -np.inf)
+    if lap <= 0 or stint_laps <= 0:
+        return FcyLookup(strategy, stint_laps, codes, best.astype(np.float32))
+
+    # Hücre ortası: m. dakika için m*60 + 30 saniye (yarış süresini aşmadan)
+    remaining = np.minimum(np.arange(minutes) * 60.0 + 30.0, inputs.race_time)[:, None]
+    laps_into = np.arange(stint_laps + 1, dtype=float)[None, :]
+    remaining, laps_into = np.broadcast_arrays(remaining, laps_into)
+
+    fcy_lap = lap * lap_time_factor
+    fcy_end = np.minimum(max(fcy_seconds, 0.0), remaining)
+    lane = inputs.pit_lane_time
+    per_lap = inputs.fuel_consumption
+    fuel_laps = stint_laps - laps_into if per_lap > 0 else np.full(remaining.shape, np.inf)
+    full_stop = lane + inputs.fuel_time + inputs.tire_time
+
+    def drive(laps, start):
+        in_fcy = np.maximum(fcy_end - start, 0.0)
+        fcy_laps = in_fcy / fcy_lap
+        return np.where(start >= fcy_end, laps * lap,
+                        np.where(laps <= fcy_laps, laps * fcy_lap, in_fcy + (laps - fcy_laps) * lap))
+
+    def covered(seconds, start):
+        fcy_part = np.clip(np.minimum(seconds, fcy_end - start), 0.0, None)
+        return fcy_part / fcy_lap + (seconds - fcy_part) / lap
+
+    def tires_ok(laps):
+        if tire_consumption <= 0:
+            return np.ones(np.shape(laps), dtype=bool)
+        return laps * tire_consumption <= MAX_TIRE_WEAR + TIME_EPSILON
+
+    best_stops = np.zeros(codes.shape, dtype=np.int32)
+    best_tires = np.zeros(codes.shape, dtype=bool)
+
+    def keep(score, stops, code, tires):
+        with np.errstate(invalid="ignore"):  # -inf - -inf: uygun olmayan hücreler
+            better = (score > best + TIE_EPSILON) | (
+                (np.abs(score - best) <= TIE_EPSILON) & np.isfinite(score)
+                & ((stops < best_stops) | ((stops == best_stops) & tires & ~best_tires))
+            )
+        best[better] = score[better]
+        best_stops[better] = stops[better]
+        best_tires[better] = tires
+        codes[better] = code
+
+    # Pit yok
+    distance = covered(remaining, 0.0)
+    feasible = (distance <= fuel_laps + TIME_EPSILON) & tires_ok(laps_into + distance)
+    keep(np.where(feasible, distance, -np.inf), np.zeros(codes.shape, dtype=np.int32), NO_STOP, False)
+
+    max_laps = min(stint_laps, int(inputs.race_time / lap) + 1)
+    for k in range(max_laps + 1):
+        for change_tires in (True, False):
+            if cancelled is not None and cancelled():
+                raise PlanCancelled()
+
+            feasible = (k <= fuel_laps + TIME_EPSILON) & tires_ok(laps_into + k)
+            pit_at = drive(k, 0.0)
+            feasible &= pit_at + lane < remaining
+
+            refuel = inputs.fuel_time * np.minimum((laps_into + k) / stint_laps, 1.0) if per_lap > 0 else 0.0
+            t = pit_at + lane + refuel + (inputs.tire_time if change_tires else 0.0)
+            distance = np.full(remaining.shape, float(k))
+            stops = np.ones(remaining.shape, dtype=np.int32)
+            tire_laps = np.zeros(remaining.shape) if change_tires else laps_into + k
+            done = np.zeros(remaining.shape, dtype=bool)
+
+            # FCY hâlâ sürüyorsa stint'ler tek tek (her adım en az bir stint ilerler)
+            active = feasible & (t < fcy_end)
+            while active.any():
+                left = remaining - t
+                stint = drive(stint_laps, t)
+                last = active & (stint + lane >= left)
+                last_distance = covered(left, t)
+                feasible &= ~(last & ~tires_ok(tire_laps + last_distance))
+                distance = np.where(last, distance + last_distance, distance)
+                done |= last
+
+                more = active & ~last
+                feasible &= ~(more & ~tires_ok(tire_laps + stint_laps))
+                t = np.where(more, t + stint + full_stop, t)
+                distance = np.where(more, distance + stint_laps, distance)
+                stops = stops + more
+                tire_laps = np.where(more, 0.0, tire_laps)
+                active = feasible & ~done & (t < fcy_end)
+
+            # Yeşil bayrak kuyruğu (FcyEngine.simulate ile aynı kapalı form)
+            left = remaining - t
+            tail = ~done & (left > 0)
+            feasible &= ~(tail & ~tires_ok(tire_laps + np.minimum(stint_laps, left / lap)))
+            cycle = stint_laps * lap + full_stop
+            extra = np.maximum(0, np.ceil((left - stint_laps * lap - lane) / cycle)).astype(np.int32)
+            distance = np.where(tail, distance + (left - extra * full_stop) / lap, distance)
+            stops = np.where(tail, stops + extra, stops)
+
+            keep(np.where(feasible, distance, -np.inf), stops, 2 * k + int(change_tires), change_tires)
+
+    return FcyLookup(strategy, stint_laps, codes, best.astype(np.float32))
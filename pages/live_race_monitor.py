@@ -2,42 +2,38 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QScrollArea, QRadioButton, QButtonGroup, QPushButton, QComboBox, QSizePolicy
 from PyQt6.QtCore import Qt, QTimer, QDateTime, QTime, QDate, QLocale
 from pages.table_component import TableComponent
-from pages.strategy_utils import generate_adaptive_strategies
-import re  # ⏱ süre metni için
+from pages.stint_preview import StintPreviewView
+from pages.stint_plan import strategy_label
+from pages.fcy_engine import FcyEngine, FcyState, FCY_EXPECTED_SECONDS, FCY_STRATEGY
+from utils.race_clock import RaceClock
+from utils.telemetry import TelemetrySnapshot
+import re  # ⏱ FCY snapshot metni için
+import time
 #from pages.strategy_utils import generate_strategy_table
 
-def parse_average_lap_time(text: str) -> int:
-    try:
-        minutes, rest = text.strip().split(":")
-        seconds = float(rest)
-        return int(int(minutes) * 60 + seconds)
-    except Exception as e:
-        print(f"❌ parse_average_lap_time() hatası: {e}")
-        return 90  # fallback değeri
+PREVIEW_REFRESH_SECONDS = 60
+
+# FCY panelinde gösterilen en iyi seçenek sayısı
+FCY_OPTION_COUNT = 6
 
 class LiveRaceMonitor(QWidget):
     def __init__(self):
         super().__init__()
 
-        self.fcy_timer = QTimer(self)
-        self.fcy_timer.timeout.connect(self.update_fcy_timer)
-
-        self.pitlane_timer = QTimer(self)
-        self.pitlane_timer.timeout.connect(self.update_pitlane_timer)
-
-        self.pitzone_timer = QTimer(self)
-        self.pitzone_timer.timeout.connect(self.update_pitzone_timer)
+        # ⏱ Tüm sayaçlar tek monotonic saatten hesaplanır, tick başına tek UI güncellemesi
+        self.race_clock = RaceClock(self)
+        self.race_clock.tick.connect(self.on_clock_tick)
+        self.last_preview_refresh = self.race_clock.now()
 
         self.adaptive_strategy_widget = QWidget()
         self.adaptive_strategy_widget.setVisible(False)
         self.adaptive_strategy_layout = QVBoxLayout(self.adaptive_strategy_widget)
 
-        # ⛽ Pitlane timer özel kontrolü
-        self.pitlane_pause_time = None
+        # 🟢 Son vurgulanan (strateji, satır); değişmedikçe tablo yeniden çizilmez
+        self.active_stint_key = None
 
-        self.fcy_timer_start = None
-        self.pitlane_timer_start = None
-        self.pitzone_timer_start = None
+        # 📡 Telemetriden uygulanan son durum (geçişleri tespit etmek için)
+        self.telemetry_snapshot = TelemetrySnapshot()
 
         self.fcy_time_label = QLabel("⏱ FCY: 00:00")
         self.pitlane_time_label = QLabel("⏱ Pitlane: 00:00")
@@ -45,35 +41,24 @@ class LiveRaceMonitor(QWidget):
 
         self.fcy_snapshot_label = QLabel("🕒 FCY Start: --:--:--\n🕒 FCY Finish: --:--:--")
 
-        self.setStyleSheet("background-color: transparent;")
+        # 🎨 Stiller ui/styles.qss'te objectName seçicileriyle tanımlı
+        self.setObjectName("LiveRaceMonitor")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 2, 30, 2)
         layout.setSpacing(20)
 
-        # Zamanlayıcılar
-        self.finish_timer = QTimer(self)
-        self.finish_timer.timeout.connect(self.update_finish_timer)
         self.finish_time_left = 0
-        self.finish_timer_running = False
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_timer)
-        self.timer.start(1000)
 
         self.target_time = QDateTime.currentDateTime().addSecs(3600)
 
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_strategy_preview)
-        self.refresh_timer.start(60000)
-
         self.countdown_label = QLabel("--:--:--")
         self.finish_countdown = QLabel("--:--:--")
         self.finish_start_pause_button = QPushButton("▶")
         self.finish_start_pause_button.clicked.connect(self.toggle_finish_timer)
 
+        # Seçenekler plandaki stratejilerden doldurulur (refresh_strategy_combo)
         self.strategy_combo = QComboBox()
-        self.strategy_combo.addItems(["Strategy A", "Strategy B", "Strategy C", "Strategy D"])
         self.strategy_combo.currentIndexChanged.connect(self.on_strategy_changed)
 
         self.refresh_button = QPushButton("Refresh Strategy")
@@ -90,10 +75,7 @@ class LiveRaceMonitor(QWidget):
         self.strategy_zone = QWidget()
         self.strategy_zone.setMinimumHeight(120)
         self.strategy_zone.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.strategy_zone.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 0.25);
-            border-radius: 10px;
-        """)
+        self.strategy_zone.setObjectName("StrategyZone")
         self.strategy_zone_layout = QVBoxLayout(self.strategy_zone)
         self.strategy_zone_layout.setContentsMargins(12, 12, 12, 12)
         self.strategy_zone_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -104,47 +86,13 @@ class LiveRaceMonitor(QWidget):
         strategy_row_layout.setSpacing(12)
 
         strategy_label = QLabel("🎯 Select Strategy:")
-        strategy_label.setStyleSheet("""
-            color: white;
-            font-size: 14px;
-            font-weight: bold;
-            font-family: Poppins;
-        """)
+        strategy_label.setObjectName("StrategyLabel")
 
         self.strategy_combo.setFixedWidth(160)
-        self.strategy_combo.setStyleSheet("""
-            QComboBox {
-                background-color: black;
-                color: white;
-                padding: 8px 16px;
-                font-family: Poppins;
-                font-size: 14px;
-                font-weight: bold;
-                border: 1px solid #555;
-                border-radius: 4px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: black;
-                color: white;
-                selection-background-color: #FFD700;
-            }
-        """)
+        self.strategy_combo.setObjectName("StrategyCombo")
 
         self.refresh_button.setFixedWidth(160)
-        self.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FFD700;
-                color: black;
-                font-weight: bold;
-                font-size: 14px;
-                font-family: Poppins;
-                padding: 8px 16px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #ffcc00;
-            }
-        """)
+        self.refresh_button.setObjectName("RefreshStrategyButton")
 
 
         strategy_row_layout.addWidget(strategy_label)
@@ -159,61 +107,39 @@ class LiveRaceMonitor(QWidget):
 
         start_card = QWidget()
         start_card.setFixedSize(240, 120)
-        start_card.setStyleSheet("background-color: rgba(0, 0, 0, 0.25); border-radius: 12px;")
+        start_card.setObjectName("CountdownCard")
         start_layout = QVBoxLayout(start_card)
         start_layout.setContentsMargins(12, 12, 12, 12)
         start_layout.setSpacing(8)
 
         start_title = QLabel("⏳ Race Start Countdown")
         start_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        start_title.setStyleSheet("color: white; font-weight: bold; font-size: 14px; font-family: Poppins;")
+        start_title.setObjectName("CountdownTitle")
 
         self.countdown_label.setFixedSize(180, 40)
         self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.countdown_label.setStyleSheet("""
-            background-color: #FFD700;
-            color: black;
-            font-weight: bold;
-            font-size: 18px;
-            border-radius: 8px;
-            font-family: Poppins;
-        """)
+        self.countdown_label.setObjectName("CountdownLabel")
 
         start_layout.addWidget(start_title)
         start_layout.addWidget(self.countdown_label)
 
         finish_card = QWidget()
         finish_card.setFixedSize(240, 120)
-        finish_card.setStyleSheet("background-color: rgba(0, 0, 0, 0.25); border-radius: 12px;")
+        finish_card.setObjectName("CountdownCard")
         finish_layout = QVBoxLayout(finish_card)
         finish_layout.setContentsMargins(12, 12, 12, 12)
         finish_layout.setSpacing(8)
 
         finish_title = QLabel("⏱ Race Finish Countdown")
         finish_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        finish_title.setStyleSheet("color: white; font-weight: bold; font-size: 14px; font-family: Poppins;")
+        finish_title.setObjectName("CountdownTitle")
 
         self.finish_countdown.setFixedSize(140, 40)
         self.finish_countdown.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.finish_countdown.setStyleSheet("""
-            background-color: #FFD700;
-            color: black;
-            font-weight: bold;
-            font-size: 18px;
-            border-radius: 8px;
-            font-family: Poppins;
-        """)
+        self.finish_countdown.setObjectName("CountdownLabel")
 
         self.finish_start_pause_button.setFixedSize(40, 40)
-        self.finish_start_pause_button.setStyleSheet("""
-            QPushButton {
-                background-color: #222;
-                color: #FFD700;
-                font-weight: bold;
-                font-size: 16px;
-                border-radius: 6px;
-            }
-        """)
+        self.finish_start_pause_button.setObjectName("FinishStartPauseButton")
 
         finish_row = QWidget()
         finish_row_layout = QHBoxLayout(finish_row)
@@ -233,10 +159,7 @@ class LiveRaceMonitor(QWidget):
 
         # 🔻 Strategy Preview Zone – Alt alan
         self.strategy_preview_zone = QWidget()
-        self.strategy_preview_zone.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 0.25);
-            border-radius: 10px;
-        """)
+        self.strategy_preview_zone.setObjectName("StrategyPreviewZone")
         self.strategy_preview_zone_layout = QVBoxLayout(self.strategy_preview_zone)
         self.strategy_preview_zone_layout.setContentsMargins(12, 12, 12, 12)
         self.strategy_preview_zone_layout.setSpacing(16)
@@ -249,44 +172,12 @@ class LiveRaceMonitor(QWidget):
         stint_table_layout.setContentsMargins(0, 0, 0, 0)
         stint_table_layout.setSpacing(0)
 
-        self.strategy_table_container = QWidget()
-        self.strategy_table_container.setFixedWidth(308)
-        self.strategy_table_container.setStyleSheet("background-color: transparent;")
-
-        self.strategy_table_layout = QVBoxLayout(self.strategy_table_container)
-        self.strategy_table_layout.setContentsMargins(0, 0, 0, 0)
-        self.strategy_table_layout.setSpacing(12)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setContentsMargins(0, 0, 0, 0)
-        scroll_area.setFixedWidth(320)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-            }
-            QScrollBar:vertical {
-                width: 12px;
-                background: transparent;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #888;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-        scroll_area.setWidget(self.strategy_table_container)
-
-        stint_table_layout.addWidget(scroll_area)
+        # Stint önizlemesi: widget kopyalanmaz, store kayıtlarından çizilir
+        self.strategy_preview = StintPreviewView()
+        self.strategy_preview.setFixedWidth(320)
+        self.strategy_preview.setObjectName("StrategyPreview")
+
+        stint_table_layout.addWidget(self.strategy_preview)
 
         # 🟡 FCY Panel
         self.fcy_time_label = QLabel("⏱ FCY: 00:00")
@@ -299,36 +190,18 @@ class LiveRaceMonitor(QWidget):
 
         fcy_widget = QWidget()
         fcy_widget.setFixedWidth(320)
-        fcy_widget.setStyleSheet("background-color: rgba(0, 0, 0, 0.3); border-radius: 10px;")
+        fcy_widget.setObjectName("FcyPanel")
         fcy_layout = QVBoxLayout(fcy_widget)
         fcy_layout.setContentsMargins(12, 12, 12, 12)
         fcy_layout.setSpacing(8)
 
         title = QLabel("🟡 FCY Panel")
-        title.setStyleSheet("color: #FFD700; font-weight: bold; font-size: 16px; font-family: Poppins;")
-
-        self.fcy_time_label.setStyleSheet("color: white; font-size: 14px; font-family: Poppins;")
-        self.pitlane_time_label.setStyleSheet("color: white; font-size: 14px; font-family: Poppins;")
-        self.pitzone_time_label.setStyleSheet("color: white; font-size: 14px; font-family: Poppins;")
-        self.fcy_snapshot_label.setStyleSheet("""
-            color: white;
-            font-size: 13px;
-            background-color: rgba(0, 0, 0, 0.3);
-            padding: 6px;
-            border-radius: 6px;
-            font-family: Poppins;
-        """)
-        self.fcy_start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FFD700;
-                color: black;
-                font-weight: bold;
-                font-size: 14px;
-                border-radius: 6px;
-                padding: 6px;
-                font-family: Poppins;
-            }
-        """)
+        title.setObjectName("FcyPanelTitle")
+
+        for label in (self.fcy_time_label, self.pitlane_time_label, self.pitzone_time_label):
+            label.setObjectName("TimerLabel")
+        self.fcy_snapshot_label.setObjectName("FcySnapshotLabel")
+        self.fcy_start_button.setObjectName("FcyStartButton")
 
         fcy_layout.addWidget(title)
         fcy_layout.addWidget(self.fcy_time_label)
@@ -349,26 +222,8 @@ class LiveRaceMonitor(QWidget):
         pitlane_start_btn.clicked.connect(lambda: self.start_timer("pitlane"))
         pitlane_stop_btn.clicked.connect(lambda: self.stop_timer("pitlane"))
 
-        pitlane_start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFD700;
-                color: black;
-                font-weight: bold;
-                padding: 6px;
-                border-radius: 6px;
-                font-family: Poppins;
-            }
-        """)
-        pitlane_stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #555;
-                color: white;
-                font-weight: bold;
-                padding: 6px;
-                border-radius: 6px;
-                font-family: Poppins;
-            }
-        """)
+        pitlane_start_btn.setObjectName("PitStartButton")
+        pitlane_stop_btn.setObjectName("PitStopButton")
 
         pitlane_btns_layout.addWidget(pitlane_start_btn)
         pitlane_btns_layout.addWidget(pitlane_stop_btn)
@@ -386,31 +241,18 @@ class LiveRaceMonitor(QWidget):
         pitzone_start_btn.clicked.connect(lambda: (self.stop_timer("pitlane"), self.start_timer("pitzone")))
         pitzone_stop_btn.clicked.connect(lambda: (self.stop_timer("pitzone"), self.start_timer("pitlane")))
 
-        pitzone_start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFD700;
-                color: black;
-                font-weight: bold;
-                padding: 6px;
-                border-radius: 6px;
-                font-family: Poppins;
-            }
-        """)
-        pitzone_stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #555;
-                color: white;
-                font-weight: bold;
-                padding: 6px;
-                border-radius: 6px;
-                font-family: Poppins;
-            }
-        """)
+        pitzone_start_btn.setObjectName("PitStartButton")
+        pitzone_stop_btn.setObjectName("PitStopButton")
 
         pitzone_btns_layout.addWidget(pitzone_start_btn)
         pitzone_btns_layout.addWidget(pitzone_stop_btn)
         fcy_layout.addWidget(pitzone_btns)
 
+        # 📡 Telemetri durumu (servis bağlıysa otomatik güncellenir)
+        self.telemetry_label = QLabel("📡 Telemetry: off")
+        self.telemetry_label.setObjectName("TelemetryLabel")
+        fcy_layout.addWidget(self.telemetry_label)
+
         horizontal_container = QHBoxLayout()
         horizontal_container.setContentsMargins(0, 0, 0, 0)
         horizontal_container.setSpacing(16)
@@ -426,29 +268,17 @@ class LiveRaceMonitor(QWidget):
         scroll_fcy_preview.setWidgetResizable(True)
         scroll_fcy_preview.setFixedWidth(320)
         scroll_fcy_preview.setFixedHeight(660)  # Yukarıdan/aşağıdan kesilmemesi için sınır veriyoruz
-        scroll_fcy_preview.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                width: 10px;
-                background: transparent;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #FFD700;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-        """)
+        scroll_fcy_preview.setObjectName("FcyPreviewScroll")
 
         # 👉 FCY preview hücrelerinin bulunduğu konteyner (scroll içine gömülür)
         self.fcy_preview_container = QWidget()
-        self.fcy_preview_container.setStyleSheet("background-color: transparent;")
+        self.fcy_preview_container.setObjectName("FcyPreviewContainer")
         self.fcy_preview_layout = QVBoxLayout(self.fcy_preview_container)
         self.fcy_preview_layout.setContentsMargins(0, 0, 0, 0)
         self.fcy_preview_layout.setSpacing(12)
+        # (hücre, etiketler) havuzu ve hücrelerde gösterilen seçenekler
+        self.fcy_cells = []
+        self.fcy_cell_options = []
 
         scroll_fcy_preview.setWidget(self.fcy_preview_container)
 
@@ -458,14 +288,7 @@ class LiveRaceMonitor(QWidget):
         fcy_preview_title.setFixedHeight(66)  # Sarı kartlarla uyumlu
         fcy_preview_title.setFixedWidth(308)  # じ FCY kartlarıyla hizalı
         fcy_preview_title.setContentsMargins(12, 0, 0, 0)  # Soldan içerik boşluğu
-        fcy_preview_title.setStyleSheet("""
-            background-color: #FFD700;
-            color: black;
-            font-size: 14px;
-            font-weight: bold;
-            font-family: Poppins;
-            border-radius: 8px;
-        """)
+        fcy_preview_title.setObjectName("FcyPreviewTitle")
 
         self.adaptive_strategy_layout.addWidget(fcy_preview_title)
 
@@ -473,81 +296,27 @@ class LiveRaceMonitor(QWidget):
 
         weather_label = QLabel("☁️ Weather Forecast Placeholder")
         weather_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        weather_label.setStyleSheet("color: lightblue; font-size: 18px; font-weight: bold;")
+        weather_label.setObjectName("WeatherLabel")
         layout.addWidget(weather_label)
 
         radar_label = QLabel("📡 Radar Image Placeholder")
         radar_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        radar_label.setStyleSheet("color: lightgreen; font-size: 18px; font-weight: bold;")
+        radar_label.setObjectName("RadarLabel")
         layout.addWidget(radar_label)
 
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_strategy_preview)
-        self.refresh_timer.start(60000)
 
+    def on_clock_tick(self, now: float):
+        """RaceClock tick'i: tüm sayaç etiketleri tek seferde güncellenir."""
+        self.update_timer()
+        self.update_finish_timer(now)
+        for name in ("fcy", "pitlane", "pitzone"):
+            if self.race_clock.stopwatch(name).running:
+                self._update_timer_label(name, now)
 
-    def load_selected_strategy(self, widgets: list[QWidget], driver_names: list[str]):
-        """
-        DriversTimePage'den gelen görsel widget listesini strateji önizleme alanına yansıtır.
-        Her widget için başlık (Stint X) sarmalayıcıya eklenir.
-        Ayrıca her başlığın altına ilgili sürücünün adı da eklenir.
-        """
-        if hasattr(self, "strategy_table_layout"):
-            # Eski widget'ları temizle
-            while self.strategy_table_layout.count():
-                item = self.strategy_table_layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-
-            # 🟡 Sürücü isimlerini al
-            driver_names = []
-            main_window = self.window()
-            if hasattr(main_window, "page_drivers_time"):
-                page = main_window.page_drivers_time
-                for i in range(len(widgets)):
-                    combo = page.table.cellWidget(i, 3)
-                    if isinstance(combo, QComboBox):
-                        driver_names.append(combo.currentText().strip())
-                    else:
-                        driver_names.append("")
-
-            # Yeni widget'ları ekle
-            for i, w in enumerate(widgets):
-                wrapper = QWidget()
-                wrapper_layout = QVBoxLayout(wrapper)
-                wrapper.setContentsMargins(0, 0, 0, 0)
-                wrapper_layout.setSpacing(6)
-                wrapper.setFixedWidth(300)
-
-                stint_label = QLabel(f"Stint {i + 1}")
-                stint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                stint_label.setFixedWidth(300)
-                stint_label.setStyleSheet("""
-                    color: white;
-                    background-color: rgba(0, 0, 0, 0.5);
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 6px;
-                    padding: 6px;
-                """)
-
-                driver_label = QLabel(driver_names[i] if i < len(driver_names) else "-")
-                driver_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                driver_label.setFixedWidth(300)
-                driver_label.setStyleSheet("""
-                    color: #FFD700;
-                    font-size: 13px;
-                    font-style: italic;
-                    padding-bottom: 2px;
-                """)
-
-                wrapper_layout.addWidget(stint_label)
-                wrapper_layout.addWidget(driver_label)
-                w.setFixedWidth(300)
-                wrapper_layout.addWidget(w)
-
-                self.strategy_table_layout.addWidget(wrapper)
+        # 🔁 Strateji önizlemesi dakikada bir yenilenir
+        if now - self.last_preview_refresh >= PREVIEW_REFRESH_SECONDS:
+            self.last_preview_refresh = now
+            self.refresh_strategy_preview()
 
     def update_timer(self):
         now = QDateTime.currentDateTime().toLocalTime()
@@ -584,186 +353,161 @@ class LiveRaceMonitor(QWidget):
         else:
             print("❌ Geçersiz QDateTime geldi:", qdatetime)
 
-    def show_strategy_preview_widgets(self, widgets: list[QWidget]):
+    def show_strategy_preview(self, strategy_name: str, driver_names: list[str] = None):
         """
-        DriversTimePage'den gelen görsel widget listesini strateji önizleme alanına yansıtır.
+        Strateji önizlemesini değiştirir. Kartlar yeniden oluşturulmaz; view aynı
+        item'ları store'daki yeni stratejinin kayıtlarıyla yeniden çizer.
+        driver_names verilirse her başlığın altında ilgili sürücünün adı gösterilir.
         """
-        if hasattr(self, "strategy_table_layout"):
-            while self.strategy_table_layout.count():
-                item = self.strategy_table_layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-
-            # 🔧 Eksik olan başlık kısmını burada oluştur
-            for i, w in enumerate(widgets):
-                wrapper = QWidget()
-                wrapper_layout = QVBoxLayout(wrapper)
-                wrapper.setFixedWidth(300)
-                wrapper_layout.setContentsMargins(0, 0, 0, 0)
-                wrapper_layout.setSpacing(6)
-
-                stint_label = QLabel(f"Stint {i + 1}")
-                stint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                stint_label.setFixedWidth(300)  # 🔥 Hücre ile aynı genişlikte yap
-                stint_label.setStyleSheet("""
-                    color: white;
-                    background-color: rgba(0, 0, 0, 0.5);
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 6px;
-                    padding: 6px;
-                """)
-
-                wrapper_layout.addWidget(stint_label)
-                w.setFixedWidth(300)
-                wrapper_layout.addWidget(w)
-
-                self.strategy_table_layout.addWidget(wrapper)
+        self.preview_strategy = strategy_name
+        self.strategy_preview.set_strategy(strategy_name, driver_names)
+        self.active_stint_key = None
+        self.highlight_active_stint()
 
     def set_table_component(self, table_component):
         self.table_component = table_component
 
+    def set_strategy_store(self, store):
+        self.strategy_store = store
+        self.strategy_preview.set_store(store)
+        store.plan_changed.connect(self.on_strategy_plan_changed)
+        store.rows_changed.connect(self.on_strategy_rows_changed)
+
+    def on_strategy_rows_changed(self, first, last):
+        self.active_stint_key = None
+        self.highlight_active_stint()
+
+    def on_strategy_plan_changed(self, plan):
+        # Yeni planda model aktif satırları sıfırlar; önbellek de sıfırlanmalı
+        self.active_stint_key = None
+        self.refresh_strategy_combo()
+        # Önizleme modeli plan_changed'e kendisi abone; burada sadece vurgu yenilenir
+        if hasattr(self, "selected_strategy"):
+            self.highlight_active_stint()
+
     def load_strategy_column(self, strategy_name: str):
-        if not hasattr(self, "table_component"):
+        if not hasattr(self, "table_component") or not hasattr(self, "strategy_store"):
             print("TableComponent bağlantısı yok.")
             return
 
-        # 🔄 Strateji kolon indexleri (fcy eklendi)
-        index_map = {
-            "strategy_a": 2,
-            "strategy_b": 3,
-            "strategy_c": 4,
-            "strategy_d": 5,
-            "strategy_fcy_auto": 6  # ✅ FCY sonrası öneri kolonu
-        }
-
-        col_index = index_map.get(strategy_name)
-        if col_index is None:
+        if not self.strategy_store.has_strategy(strategy_name):
             print("Geçersiz strateji adı:", strategy_name)
             return
 
-        widgets = []
-        for i in range(self.table_component.table.rowCount()):
-            original = self.table_component.table.cellWidget(i, col_index)
-            if original is None:
-                continue
-
-            clone = QWidget()
-            clone.setFixedWidth(300)
-            layout = QVBoxLayout(clone)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setSpacing(6)
-
-            # ✅ Sadece içerikler klonlanıyor, başlık yok
-            fuel_row = QHBoxLayout()
-            for child in original.findChildren(QLabel):
-                label = QLabel(child.text())
-                label.setStyleSheet(child.styleSheet())
-                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                if "Fuel" in child.text() or "Virtual" in child.text():
-                    fuel_row.addWidget(label)
-                else:
-                    layout.addWidget(label)
+        # ✅ Kartlar store'daki kayıtlardan çizilir, tablo hücreleri klonlanmaz
+        self.show_strategy_preview(strategy_name)
 
-            layout.addLayout(fuel_row)
-            widgets.append(clone)
 
-        self.show_strategy_preview_widgets(widgets)
-        self.highlight_active_stint()
 
+    def refresh_strategy_combo(self):
+        """Combo'yu plandaki stratejilerle (üretilmişler dahil) doldurur; seçim korunur."""
+        strategies = self.strategy_store.strategies if hasattr(self, "strategy_store") else []
+        current = [self.strategy_combo.itemData(i) for i in range(self.strategy_combo.count())]
+        selected = getattr(self, "selected_strategy", None)
 
+        self.strategy_combo.blockSignals(True)
+        if current != strategies:
+            self.strategy_combo.clear()
+            for strategy in strategies:
+                self.strategy_combo.addItem(strategy_label(strategy), strategy)
+        index = self.strategy_combo.findData(selected)
+        self.strategy_combo.setCurrentIndex(index if index >= 0 else 0)
+        self.strategy_combo.blockSignals(False)
+        # Seçili strateji yeni planda yoksa (ör. FCY sütunu) combo'nun düştüğü stratejiye geçilir
+        if selected is not None and index < 0 and self.strategy_combo.currentData() is not None:
+            self.selected_strategy = self.strategy_combo.currentData()
 
     def on_strategy_changed(self):
-        strategy_keys = ["strategy_a", "strategy_b", "strategy_c", "strategy_d"]
-        index = self.strategy_combo.currentIndex()
-        if 0 <= index < len(strategy_keys):
-            self.selected_strategy = strategy_keys[index]
+        strategy = self.strategy_combo.currentData()
+        if strategy is not None:
+            self.selected_strategy = strategy
             self.load_strategy_column(self.selected_strategy)
 
-    def update_finish_timer(self):
+    def update_finish_timer(self, now: float = None):
+        # now (monotonic) tick imzası için; finish duvar saatinden okunur
+        finish = self.race_clock.finish
+        if not finish.running:
+            return
+
+        # Kalan süre duvar saatine sabitlenmiş başlangıçtan hesaplanır
+        wall_now = self.race_clock.wall_now()
+        self.finish_time_left = finish.left_seconds(wall_now)
         if self.finish_time_left <= 0:
+            finish.pause(wall_now)
+            self.finish_start_pause_button.setText("▶")
             self.finish_countdown.setText("Race Over!")
-            self.finish_timer.stop()
             return
 
-        # 🔴 Her saniyede aktif stint vurgusunu güncelle
+        # 🔴 Aktif stint vurgusu (sadece aktif stint değişince yeniden çizilir)
         self.highlight_active_stint()
+        self.finish_countdown.setText(self.format_hms(self.finish_time_left))
 
-        self.finish_time_left -= 1
-        hours = self.finish_time_left // 3600
-        minutes = (self.finish_time_left % 3600) // 60
-        seconds = self.finish_time_left % 60
-        self.finish_countdown.setText(f"{hours:02}:{minutes:02}:{seconds:02}")
+    @staticmethod
+    def format_hms(seconds: int) -> str:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        secs = seconds % 60
+        return f"{hours:02}:{minutes:02}:{secs:02}"
 
     def highlight_active_stint(self):
-        if not hasattr(self, "table_component"):
+        if not hasattr(self, "strategy_store") or not hasattr(self, "selected_strategy"):
+            return
+
+        store = self.strategy_store
+        if store.plan is None:
             return
 
         # ✅ FCY ile eklenen özel strateji adı da desteklenmeli
-        strategy_keys = ["strategy_a", "strategy_b", "strategy_c", "strategy_d", "strategy_fcy_auto"]
-        if self.selected_strategy not in strategy_keys:
+        if not store.has_strategy(self.selected_strategy):
             print("❌ Tanımsız strateji adı:", self.selected_strategy)
             return
 
-        col_index = strategy_keys.index(self.selected_strategy) + 2
-
-        for row in range(self.table_component.table.rowCount()):
-            cell = self.table_component.table.cellWidget(row, col_index)
-            if not cell:
-                continue
-
-            for child in cell.findChildren(QLabel):
-                if "🟢 ACTIVE" in child.text():
-                    new_text = child.text().replace("🟢 ACTIVE", "").strip()
-                    child.setText(new_text)
-                    child.setStyleSheet(child.styleSheet().replace("color: lime;", ""))
-
-        found_active = False
-        for row in range(self.table_component.table.rowCount()):
-            if found_active:
-                break
-
-            cell = self.table_component.table.cellWidget(row, col_index)
-            if not cell:
-                continue
-
-            for label in cell.findChildren(QLabel):
-                if hasattr(label, "property") and label.property("highlighted"):
-                    continue
-
-                if "Remaining:" in label.text():
-                    match = re.search(r"Remaining:\s*(\d+):(\d+):(\d+)", label.text())
-                    if match:
-                        h, m, s = map(int, match.groups())
-                        remaining_secs = h * 3600 + m * 60 + s
-                        if remaining_secs <= self.finish_time_left:
-                            stint_label = cell.findChildren(QLabel)[0]
-                            if "🟢 ACTIVE" not in stint_label.text():
-                                stint_label.setProperty("highlighted", True)
-                                stint_label.setText(f"{stint_label.text().split('🟢')[0].strip()}  🟢 ACTIVE")
-                                stint_label.setStyleSheet("color: lime; font-weight: bold;")
-                            found_active = True
-                            break
-
+        # Kalan süresi finish countdown'a ulaşan ilk stint aktif stint'tir (timeline üzerinde bisect)
+        active_row = store.active_row(self.selected_strategy, self.finish_time_left)
 
+        # 🔁 Aktif stint değişmediyse hiçbir şey yeniden çizilmez
+        active_key = (self.selected_strategy, active_row)
+        if active_key == self.active_stint_key:
+            return
+        self.active_stint_key = active_key
+        self.table_component.model.set_active_row(self.selected_strategy, active_row)
+        self.strategy_preview.set_active_row(
+            active_row if self.strategy_preview.strategy == self.selected_strategy else None
+        )
 
     def toggle_finish_timer(self):
-        if self.finish_timer_running:
-            self.finish_timer.stop()
-            self.finish_timer_running = False
+        finish = self.race_clock.finish
+        wall_now = self.race_clock.wall_now()
+        if finish.running:
+            # ⏸ Duraklatma süresi kaydedilir, devam edince düşülür
+            finish.pause(wall_now)
             self.finish_start_pause_button.setText("▶")
         else:
-            self.finish_timer.start(1000)
-            self.finish_timer_running = True
+            finish.start(wall_now)
             self.finish_start_pause_button.setText("⏸")
+            # Sonraki tick gösterilen saniyenin değiştiği ana hizalansın
+            self.race_clock.realign()
+
+    @property
+    def finish_timer_running(self) -> bool:
+        return self.race_clock.finish.running
+
+    def sync_finish_time(self, seconds_left: float):
+        """
+        Telemetri / oyun içi saatten gelen kalan süre ile geri sayımı düzeltir.
+        Sayaç yeniden başlatılmaz, sadece sapma düzeltmesi güncellenir.
+        """
+        self.race_clock.sync_finish(seconds_left)
+        self.update_finish_timer()
+        if not self.race_clock.finish.running:
+            self.finish_time_left = self.race_clock.finish.left_seconds(self.race_clock.wall_now())
+            self.finish_countdown.setText(self.format_hms(self.finish_time_left))
 
     def set_finish_time_seconds(self, seconds: int):
+        self.race_clock.finish.set_total(seconds)
+        self.finish_start_pause_button.setText("▶")
         self.finish_time_left = seconds
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        s = seconds % 60
-        self.finish_countdown.setText(f"{h:02}:{m:02}:{s:02}")
+        self.finish_countdown.setText(self.format_hms(seconds))
 
         # ✅ Eğer daha önce hiç strateji seçilmemişse varsayılan olarak A'yı kullan
         if not hasattr(self, "selected_strategy"):
@@ -778,29 +522,27 @@ class LiveRaceMonitor(QWidget):
         if hasattr(main_window, "page_drivers_time"):
             page = main_window.page_drivers_time
             strategy_name = page.selected_strategy
-            widgets = page.get_cloned_strategy_widgets(strategy_name)
 
             # 👇 Driver adlarını sırayla al
             driver_names = []
-            for i in range(len(widgets)):
+            for i in range(len(self.strategy_store.column(strategy_name))):
                 combo = page.table.cellWidget(i, 3)
                 if isinstance(combo, QComboBox):
                     driver_names.append(combo.currentText().strip())
                 else:
                     driver_names.append("")
 
-            self.load_selected_strategy(widgets, driver_names)
+            self.show_strategy_preview(strategy_name, driver_names)
 
     def start_timer(self, name):
-        now = QDateTime.currentDateTime()
+        stopwatch = self.race_clock.stopwatch(name)
+        now = self.race_clock.now()
 
-        if name == "pitlane" and self.pitlane_pause_time:
+        if name == "pitlane" and stopwatch.paused:
             # Devam et
-            pause_duration = self.pitlane_pause_time.secsTo(now)
-            self.pitlane_timer_start = self.pitlane_timer_start.addSecs(pause_duration)
-            self.pitlane_pause_time = None
+            stopwatch.resume(now)
         else:
-            setattr(self, f"{name}_timer_start", now)
+            stopwatch.start(now)
 
         # FCY snapshot işlemi
         if name == "fcy":
@@ -808,241 +550,183 @@ class LiveRaceMonitor(QWidget):
                 f"🕒 FCY Start:  {self.finish_countdown.text()}\n🕒 FCY Finish:  --:--:--"
             )
             self.trigger_adaptive_strategy()
-            self.recalculate_fcy_strategy()  # FCY tablosunu doğrudan üret
-
-        getattr(self, f"{name}_timer").start(1000)
 
     def stop_timer(self, name):
-        getattr(self, f"{name}_timer").stop()
-
-        now = QDateTime.currentDateTime()
-        start_time = getattr(self, f"{name}_timer_start", None)
-
-        if start_time:
-            seconds = start_time.secsTo(now)
-
-            # Pitlane özel durumu: duraklat
-            if name == "pitlane" and getattr(self, "pitlane_pause_time", None) is None:
-                self.pitlane_pause_time = now
-                return  # gösterim güncellenmesin
-
-            minutes = seconds // 60
-            sec = seconds % 60
-            time_str = f"{minutes:02}:{sec:02}"
-            getattr(self, f"{name}_time_label").setText(f"⏱ {name.upper()}: {time_str}")
-
-            # FCY finish snapshot
-            if name == "fcy":
-                current = self.fcy_snapshot_label.text()
-                updated = re.sub(
-                    r"🕒 FCY Finish:.*",
-                    f"🕒 FCY Finish:  {QTime.currentTime().toString('HH:mm:ss')}",
-                    current
-                )
-                self.fcy_snapshot_label.setText(updated)
-
-    def update_fcy_timer(self):
-        self._update_timer_label("fcy")
-
-    def update_pitlane_timer(self):
-        self._update_timer_label("pitlane")
-
-    def update_pitzone_timer(self):
-        self._update_timer_label("pitzone")
-
-    def _update_timer_label(self, name):
-        start_time = getattr(self, f"{name}_timer_start", None)
-        if start_time:
-            now = QDateTime.currentDateTime()
-            seconds = start_time.secsTo(now)
-            minutes = seconds // 60
-            sec = seconds % 60
-            time_str = f"{minutes:02}:{sec:02}"
-            getattr(self, f"{name}_time_label").setText(f"⏱ {name.upper()}: {time_str}")
+        stopwatch = self.race_clock.stopwatch(name)
+        if not stopwatch.running:
+            return
 
-    def trigger_adaptive_strategy(self):
-        # Kalan süreyi al ve sadece öneri panelini göster
-        time_str = self.finish_countdown.text()
-        try:
-            h, m, s = map(int, time_str.split(":"))
-            remaining = h * 3600 + m * 60 + s
-            self.adaptive_strategy_widget.setVisible(True)
-            self.recalculate_fcy_strategy()  # direkt tabloyu üret
-        except Exception as e:
-            print(f"❌ Süre okunamadı: {e}")
-
-
-        except Exception as e:
-            error_label = QLabel(f"❌ Süre alınamadı: {str(e)}")
-            error_label.setStyleSheet("color: red; font-family: Poppins;")
-            self.adaptive_strategy_layout.addWidget(error_label)
-            self.adaptive_strategy_widget.setVisible(True)
-
-    def on_adaptive_strategy_selected(self, strategy_text: str):
-        print(f"📥 Seçilen strateji: {strategy_text}")
-
-        try:
-            import re
-            match = re.search(r"(\d+)\s*x\s*(\d+)\s*dk", strategy_text)
-            if not match:
-                print("❌ Strateji formatı parse edilemedi:", strategy_text)
-                return
+        now = self.race_clock.now()
+        stopwatch.pause(now)
 
-            stint_count = int(match.group(1))
-            stint_minutes = int(match.group(2))
+        # Pitlane özel durumu: Pitlane In ile kaldığı yerden devam eder
+        if name == "pitlane":
+            return  # gösterim güncellenmesin
 
-            # 🔁 Mevcut finish countdown değerinden kalan saniyeyi hesapla
-            finish_time = self.finish_countdown.text()
-            h, m, s = map(int, finish_time.split(":"))
-            remaining_secs = h * 3600 + m * 60 + s
+        self._update_timer_label(name, now)
 
-            if hasattr(self, "table_component"):
-                self.table_component.generate_fcy_strategy_column(
-                    stint_count, stint_minutes, remaining_secs
-                )
+        # FCY finish snapshot
+        if name == "fcy":
+            current = self.fcy_snapshot_label.text()
+            updated = re.sub(
+                r"🕒 FCY Finish:.*",
+                f"🕒 FCY Finish:  {QTime.currentTime().toString('HH:mm:ss')}",
+                current
+            )
+            self.fcy_snapshot_label.setText(updated)
 
-                self.selected_strategy = "strategy_fcy_auto"
-                self.load_strategy_column("strategy_fcy_auto")
-                self.adaptive_strategy_widget.setVisible(False)
+    def _update_timer_label(self, name, now: float):
+        seconds = int(self.race_clock.stopwatch(name).elapsed(now))
+        minutes = seconds // 60
+        sec = seconds % 60
+        time_str = f"{minutes:02}:{sec:02}"
+        getattr(self, f"{name}_time_label").setText(f"⏱ {name.upper()}: {time_str}")
 
-        except Exception as e:
-            print("❌ Strateji uygulama hatası:", e)
+    def trigger_adaptive_strategy(self):
+        # Öneri panelini göster ve seçenekleri üret (FCY başına tek hesap)
+        self.adaptive_strategy_widget.setVisible(True)
+        self.recalculate_fcy_strategy()
 
-    def recalculate_fcy_strategy(self):
-        try:
-            # 🔄 Seçilen FCY taban stratejisi (A/B/C/D)
-            base_index = self.fcy_base_strategy_combo.currentIndex()
-            selected_key = ["strategy_a", "strategy_b", "strategy_c", "strategy_d"][base_index]
-
-            if hasattr(self, "strategy_form"):
-                stint_laps = int(self.strategy_form.strategy_inputs[selected_key].text())
-
-                lap_time = parse_average_lap_time(self.strategy_form.lap_time())
-                pit_time = int(self.strategy_form.pit_time())
-                fuel_per_lap = float(str(self.strategy_form.fuel_per_lap()).replace(",", "."))
-                virtual_per_lap = float(str(self.strategy_form.virtual_fuel_per_lap()).replace(",", "."))
-                tire_consumption = float(str(self.strategy_form.tire_consumption()).replace(",", "."))
-
-                h, m, s = map(int, self.finish_countdown.text().split(":"))
-                remaining_secs = h * 3600 + m * 60 + s
-
-                print("🔧 FCY strateji hesaplama:")
-                print(f"   Seçilen strateji: {selected_key}")
-                print(f"   Laps: {stint_laps}")
-                print(f"   Lap time: {lap_time} saniye")
-                print(f"   Pit time: {pit_time} saniye")
-                print(f"   Fuel/lap: {fuel_per_lap} L")
-                print(f"   Virtual fuel: {virtual_per_lap} L")
-                print(f"   Tire consumption: {tire_consumption} %")
-                print(f"   Kalan süre: {remaining_secs} saniye")
-
-                self.draw_fcy_preview_table_from_laps(
-                    stint_laps, lap_time, pit_time, remaining_secs, fuel_per_lap
-                )
-
-        except Exception as e:
-            print("❌ FCY strateji hesaplama hatası:", e)
-
-    def draw_fcy_preview_table_from_laps(self, stint_laps, lap_time_secs, pit_time_secs, total_time_secs, fuel_per_lap):
-        print("📐 FCY Tablo çizimi başladı")
-        print(f"➤️  stint_laps: {stint_laps}, lap_time_secs: {lap_time_secs}, pit_time_secs: {pit_time_secs}, total_time_secs: {total_time_secs}, fuel_per_lap: {fuel_per_lap}")
+    def current_fcy_state(self):
+        """
+        Seçili stratejinin aktif stint'i, kalan süre, telemetri yakıtı ve FCY
+        sayacından FCY motoru girdisi; plan ya da aktif stint yoksa None.
+        """
+        if not hasattr(self, "strategy_store") or not hasattr(self, "selected_strategy"):
+            return None
+        store = self.strategy_store
+        plan = store.plan
+        strategy = self.selected_strategy
+        if plan is None or not store.has_strategy(strategy) or self.finish_time_left <= 0:
+            return None
+
+        row = store.active_row(strategy, self.finish_time_left)
+        record = store.record(row, strategy) if row is not None else None
+        if record is None:
+            return None
+
+        lap_time = plan.inputs.average_lap_time
+        elapsed_in_stint = max(0.0, plan.inputs.race_time - self.finish_time_left - plan.start_seconds(row, strategy))
+        fcy_elapsed = self.race_clock.stopwatch("fcy").elapsed(self.race_clock.now())
+        state = FcyState(
+            remaining_seconds=self.finish_time_left,
+            # Üretilmiş sütunlarda (ör. FCY) form değeri yok: sütundaki en uzun stint
+            stint_laps=plan.data.get(strategy) or max(r.laps for r in store.column(strategy)),
+            laps_into_stint=elapsed_in_stint / lap_time if lap_time > 0 else 0,
+            fuel=self.telemetry_snapshot.fuel,
+            fcy_seconds=max(0.0, FCY_EXPECTED_SECONDS - fcy_elapsed),
+        )
+        return strategy, row, state
 
-        if not hasattr(self, "strategy_form"):
-            print("❌ strategy_form bağlı değil.")
+    def recalculate_fcy_strategy(self):
+        """
+        Önce önceden hesaplanmış tablodan en iyi seçenek (O(1)) gösterilir;
+        tam sıralama bir sonraki event loop turunda diğer hücreleri doldurur.
+        Tablo henüz hazır değilse doğrudan tam sıralama yapılır.
+        """
+        current = self.current_fcy_state()
+        if current is None:
+            print("❌ FCY için aktif stint bulunamadı (plan hesaplanmış ve yarış saati kurulmuş olmalı).")
             return
 
-        try:
-            fuel_time = int(self.strategy_form.fuel_time())
-            tire_time = int(self.strategy_form.tire_time())
-            virtual_per_lap = float(str(self.strategy_form.virtual_fuel_per_lap()).replace(",", "."))
-            tire_per_stint = float(str(self.strategy_form.tire_consumption()).replace(",", "."))
-        except Exception as e:
-            print(f"❌ FCY tablo parametre okuma hatası: {e}")
-            return
+        plan = self.strategy_store.plan
+        engine = FcyEngine(plan.inputs, plan.data.get("tire_consumption", 0))
+        strategy, row, state = current
+        self.fcy_context = (engine, strategy, row, state)
+
+        lookups = self.table_component.fcy_lookups if hasattr(self, "table_component") else {}
+        lookup = lookups.get(strategy)
+        if lookup is not None and lookup.stint_laps == state.stint_laps:
+            started = time.perf_counter()
+            best = lookup.recommend(engine, state)
+            if best is not None:
+                print(f"🧠 FCY: tablodan öneri {(time.perf_counter() - started) * 1000:.2f} ms")
+                self.draw_fcy_options([best])
+                context = self.fcy_context
+                QTimer.singleShot(0, lambda: self.rank_fcy_options(context))
+                return
+
+        self.rank_fcy_options(self.fcy_context)
+
+    def rank_fcy_options(self, context):
+        if context is not getattr(self, "fcy_context", None):
+            return  # bu arada yeni bir FCY hesabı başladı
+        engine, _, _, state = context
+        started = time.perf_counter()
+        options = engine.options(state)
+        print(f"🧠 FCY: {len(options)} seçenek {(time.perf_counter() - started) * 1000:.1f} ms")
+        self.draw_fcy_options(options[:FCY_OPTION_COUNT])
 
-        while self.fcy_preview_layout.count():
-            item = self.fcy_preview_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        stint_list = []
-        used_time = 0
-
-        # Aktif stint indexini bul
-        active_stint_index = -1
-        if hasattr(self, "table_component"):
-            for row in range(self.table_component.table.rowCount()):
-                cell = self.table_component.table.cellWidget(row, 2)  # Strategy A
-                if not cell:
-                    continue
-                for label in cell.findChildren(QLabel):
-                    if "🌟 ACTIVE" in label.text():
-                        active_stint_index = row
-                        break
-                if active_stint_index >= 0:
-                    break
-
-        while used_time + pit_time_secs + lap_time_secs <= total_time_secs:
-            laps_this_stint = min(stint_laps, (total_time_secs - used_time - pit_time_secs) // lap_time_secs)
-            if laps_this_stint <= 0:
-                break
-
-            stint_secs = laps_this_stint * lap_time_secs
-            total_secs = stint_secs + pit_time_secs
-            cumulative_total_secs = used_time + total_secs
-            fuel_total = laps_this_stint * fuel_per_lap
-            virtual_total = laps_this_stint * virtual_per_lap
-            tire_total = laps_this_stint * tire_per_stint
-            remaining_secs = max(0, total_time_secs - used_time - total_secs)
-
-            print(f"🌯 Stint eklendi: laps={laps_this_stint}, time={total_secs}s, fuel={fuel_total:.2f}L, virtual={virtual_total:.2f}, tire={tire_total:.2f}%, remaining={remaining_secs}s")
-
-            stint_list.append({
-                "laps": laps_this_stint,
-                "stint_secs": stint_secs,
-                "total_secs": cumulative_total_secs,
-                "fuel": fuel_total,
-                "virtual": virtual_total,
-                "tire": tire_total,
-                "remaining": remaining_secs
-            })
-
-            used_time += total_secs
-
-        for i, stint in enumerate(stint_list):
+    def fcy_cell(self, index: int):
+        """Önizleme hücreleri bir kez kurulur; sonraki FCY'lerde sadece metinleri değişir."""
+        while len(self.fcy_cells) <= index:
             cell = QWidget()
-            cell.setStyleSheet("""
-                background-color: #FFD700;
-                border-radius: 6px;
-                padding: 4px;
-            """)
+            cell.setObjectName("FcyPreviewCell")
             layout = QVBoxLayout(cell)
             layout.setContentsMargins(4, 4, 4, 4)
             layout.setSpacing(4)
 
-            total_h = stint['total_secs'] // 3600
-            total_m = (stint['total_secs'] % 3600) // 60
-            total_s = stint['total_secs'] % 60
-
-            labels = [
-                QLabel(f"🔧 Stint Time: {stint['stint_secs'] // 60:02}:{stint['stint_secs'] % 60:02}"),
-                QLabel(f"🔧 Pit Time: {pit_time_secs // 60:02}:{pit_time_secs % 60:02}"),
-                QLabel(f"⏱️ Total Time: {total_h:02}:{total_m:02}:{total_s:02}"),
-                QLabel(f"⏳ Remaining: {stint['remaining'] // 3600:02}:{(stint['remaining'] % 3600) // 60:02}:{stint['remaining'] % 60:02}"),
-                QLabel(f"⛽ Fuel: {stint['fuel']:.2f} L"),
-                QLabel(f"🔸 Virtual: {stint['virtual']:.2f}")
-            ]
-
-            for lbl in labels:
-                lbl.setStyleSheet("""
-                    color: black;
-                    font-size: 13px;
-                    font-family: Poppins;
-                    font-weight: bold;
-                """)
+            labels = []
+            for _ in range(5):
+                lbl = QLabel()
+                lbl.setObjectName("FcyPreviewLabel")
                 layout.addWidget(lbl)
+                labels.append(lbl)
+
+            apply_button = QPushButton("Apply")
+            apply_button.setObjectName("FcyApplyButton")
+            position = len(self.fcy_cells)
+            apply_button.clicked.connect(lambda _, i=position: self.apply_fcy_option(self.fcy_cell_options[i]))
+            layout.addWidget(apply_button)
 
             self.fcy_preview_layout.addWidget(cell)
+            self.fcy_cells.append((cell, labels))
+        return self.fcy_cells[index]
+
+    def draw_fcy_options(self, options):
+        self.fcy_cell_options = list(options)
+        for rank, option in enumerate(options, start=1):
+            cell, labels = self.fcy_cell(rank - 1)
+            lines = [
+                f"{rank}. {option.title} · {option.service}",
+                f"🏁 Finish: {option.finish_laps:.2f} laps · {option.stops} stops",
+                f"⏱️ vs Plan: {option.gain_seconds:+.1f} s",
+            ]
+            if option.pit_in_laps is not None:
+                pit = int(round(option.pit_seconds))
+                lines.append(f"🔧 Pit: {pit // 60:02}:{pit % 60:02}" + (" (FCY)" if option.under_fcy else ""))
+                lines.append(f"⛽ Fuel Added: {option.fuel_added:.1f} L")
+
+            for i, lbl in enumerate(labels):
+                lbl.setText(lines[i] if i < len(lines) else "")
+                lbl.setVisible(i < len(lines))
+            cell.setVisible(True)
+
+        for cell, _ in self.fcy_cells[len(options):]:
+            cell.setVisible(False)
+
+    def apply_fcy_option(self, option):
+        """Seçilen FCY seçeneği mevcut planın satırlarını koruyarak ayrı bir sütun olarak eklenir."""
+        context = getattr(self, "fcy_context", None)
+        if context is None or not hasattr(self, "table_component"):
+            return
+
+        engine, strategy, row, state = context
+        plan = self.strategy_store.plan
+        index = plan.strategy_index(FCY_STRATEGY)
+        records = engine.column(
+            state, option, self.strategy_store.column(strategy), row, plan.inputs.race_time,
+            FCY_STRATEGY, len(plan.strategies) if index is None else index
+        )
+        if not records:
+            print("❌ FCY seçeneği uygulanamadı:", option.title)
+            return
+
+        self.table_component.apply_fcy_column(records)
+        self.selected_strategy = FCY_STRATEGY
+        self.refresh_strategy_combo()
+        self.load_strategy_column(FCY_STRATEGY)
+        self.adaptive_strategy_widget.setVisible(False)
 
     def set_strategy_form(self, strategy_form):
         self.strategy_form = strategy_form
@@ -1067,16 +751,72 @@ class LiveRaceMonitor(QWidget):
         #table_widget = generate_strategy_table(strategy_data)  # ✅ utils fonksiyonu
 
         # Önce temizle
-        while self.strategy_table_layout.count():
-            item = self.strategy_table_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        self.show_strategy_preview(None)
+
+    def set_telemetry_service(self, service):
+        """Telemetri servisi arka plan thread'inden yayınlar; alıcı GUI thread'inde kuyruktan çalışır."""
+        self.telemetry_service = service
+        service.snapshot_ready.connect(self.apply_telemetry, Qt.ConnectionType.QueuedConnection)
+        service.status_changed.connect(self.on_telemetry_status, Qt.ConnectionType.QueuedConnection)
+
+    def on_telemetry_status(self, status: str):
+        if status == "stopped":
+            self.telemetry_label.setText("📡 Telemetry: off")
+        elif status == "connected":
+            self.telemetry_label.setText("📡 Telemetry: connected")
+        else:
+            self.telemetry_label.setText(f"📡 Telemetry: {status}")
 
-        #self.strategy_table_layout.addWidget(table_widget)
+    def apply_telemetry(self, snapshot):
+        """
+        Birleştirilmiş telemetri durumunu uygular. Sadece önceki duruma göre
+        değişen alanlar işlenir: FCY / pit geçişleri butonlarla aynı sayaçları
+        sürer, kalan süre finish geri sayımını senkronlar.
+        """
+        previous = self.telemetry_snapshot
+        self.telemetry_snapshot = snapshot
+
+        if snapshot.time_left is not None and snapshot.time_left != previous.time_left:
+            self.sync_finish_time(snapshot.time_left)
+
+        if snapshot.fcy_active != previous.fcy_active:
+            if snapshot.fcy_active != self.race_clock.stopwatch("fcy").running:
+                self.toggle_fcy_timer()
+
+        if snapshot.pit_state != previous.pit_state:
+            self.apply_pit_state(previous.pit_state, snapshot.pit_state)
+
+        parts = []
+        if snapshot.lap is not None:
+            parts.append(f"Lap {snapshot.lap}")
+        if snapshot.last_lap_seconds is not None:
+            minutes, secs = divmod(snapshot.last_lap_seconds, 60)
+            parts.append(f"Last {int(minutes)}:{secs:06.3f}")
+        if snapshot.fuel is not None:
+            parts.append(f"Fuel {snapshot.fuel:.1f} L")
+        if parts:
+            self.telemetry_label.setText("📡 " + " · ".join(parts))
+
+    def apply_pit_state(self, previous: str, current: str):
+        """Pit durum geçişini Pitlane / Pitzone butonlarının yaptığı sayaç işlemlerine çevirir."""
+        if previous == "track":
+            # Yeni pit girişi: pitlane sayacı sıfırdan başlar
+            self.race_clock.stopwatch("pitlane").reset()
+            self.start_timer("pitlane")
+        elif previous == "pitzone":
+            self.stop_timer("pitzone")
+
+        if current == "pitzone":
+            self.stop_timer("pitlane")
+            self.start_timer("pitzone")
+        elif current == "pitlane" and previous == "pitzone":
+            self.start_timer("pitlane")
+        elif current == "track":
+            self.stop_timer("pitlane")
+            self._update_timer_label("pitlane", self.race_clock.now())
 
     def toggle_fcy_timer(self):
-        if self.fcy_timer.isActive():
+        if self.race_clock.stopwatch("fcy").running:
             self.stop_timer("fcy")
             self.fcy_start_button.setText("▶ FCY")
         else:
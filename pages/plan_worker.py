@@ -0,0 +1,220 @@
+# pages/plan_worker.py
+"""
+Stint planının arka planda hesaplanması.
+
+Calculate'e basıldığında StintPlan GUI thread'inde değil, tek thread'li bir
+QThreadPool işinde kurulur; canlı saat ve sayfa çizimi beklemez. İş, form
+verisinin ve satır ayarlarının (custom_pit_times / custom_laps) kopyasıyla
+çalışır, bu yüzden hesap sürerken tabloda yapılan değişiklikler işi bozmaz.
+Yeni bir istek önceki işi iptal eder (satır başına kontrol edilir); iptal
+edilen ya da geride kalan işin sonucu GUI'ye hiç ulaşmaz.
+
+FcyLookupWorker aynı düzenle, plan uygulandıktan sonra her stratejinin FCY
+cevap tablosunu (pages.fcy_lookup) kurar. SimulationWorker Monte Carlo
+simülasyonunu (pages.race_simulation) yürütür; iş sadece süreç havuzunu
+bekler, GUI thread'i bloklanmaz. Üçü de _BackgroundWorker'ın istek numarası,
+iptal ve sonuç / hata akışını paylaşır; alt sınıflar sadece işi kurar.
+"""
+from abc import ABCMeta, abstractmethod
+import copy
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from pages.fcy_lookup import build_fcy_lookup
+from pages.race_simulation import SimulationParams, run_simulation
+from pages.stint_plan import StintPlan, PlanInputs, PlanCancelled
+
+
+class _AbstractQtMeta(type(QObject), ABCMeta):
+    """Qt sınıflarının (sip) metasınıfı ile ABCMeta: eksik hook nesne oluşturulurken TypeError verir."""
+
+
+class _JobSignals(QObject):
+    # istek numarası, sonuç
+    finished = pyqtSignal(int, object)
+    # istek numarası, hata metni
+    failed = pyqtSignal(int, str)
+
+
+class _Job(QRunnable, metaclass=_AbstractQtMeta):
+    """Tek istek. compute() sonucu döndürür; iptal PlanCancelled ile biter."""
+    error_message = "❌ Arka plan işi hatası:"
+
+    def __init__(self, generation: int, signals: _JobSignals):
+        super().__init__()
+        self.generation = generation
+        self.signals = signals
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @abstractmethod
+    def compute(self):
+        """İşin sonucu; havuz thread'inde çalışır."""
+
+    def run(self):
+        if self.cancel_event.is_set():
+            return
+        try:
+            result = self.compute()
+        except PlanCancelled:
+            return
+        except Exception as e:
+            print(self.error_message, e)
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, result)
+
+
+class _BackgroundWorker(QObject, metaclass=_AbstractQtMeta):
+    """
+    Tek thread'li havuz ve istek numarası: yeni istek önceki işi iptal eder,
+    sadece son isteğin sonucu (alt sınıfın sinyali, _emit_result) ya da
+    hatası (failed) GUI'ye ulaşır.
+    """
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Tek thread: iptal edilen iş bitmeden yenisi sıraya girer, iki iş aynı anda çalışmaz
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.generation = 0
+        self.job = None
+        self.signals = _JobSignals()
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+
+    @property
+    def busy(self) -> bool:
+        return self.job is not None
+
+    def _start(self, job_class, *args) -> int:
+        self.cancel()
+        self.generation += 1
+        self.job = job_class(self.generation, self.signals, *args)
+        self.pool.start(self.job)
+        return self.generation
+
+    def cancel(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Kuyruktaki işler bitene kadar bekler (kapanışta)."""
+        return self.pool.waitForDone(msecs)
+
+    def _take_job(self, generation: int) -> bool:
+        """İş son istekse bırakılır (sonuç da hata da işi bitirir; busy kalmaz)."""
+        if self.job is None or generation != self.generation:
+            return False  # yerine daha yeni bir istek geldi
+        self.job = None
+        return True
+
+    @abstractmethod
+    def _emit_result(self, result):
+        """Sonucu alt sınıfın sinyaliyle yayınlar."""
+
+    def _on_finished(self, generation: int, result):
+        if self._take_job(generation):
+            self._emit_result(result)
+
+    def _on_failed(self, generation: int, message: str):
+        if self._take_job(generation):
+            self.failed.emit(message)
+
+
+class _PlanJob(_Job):
+    error_message = "❌ Plan hesaplama hatası:"
+
+    def __init__(self, generation: int, signals: _JobSignals, data: dict, custom_pit_times: dict,
+                 custom_laps: dict):
+        super().__init__(generation, signals)
+        self.data = data
+        self.custom_pit_times = custom_pit_times
+        self.custom_laps = custom_laps
+
+    def compute(self):
+        return StintPlan(self.data, self.custom_pit_times, self.custom_laps, cancelled=self.cancel_event.is_set)
+
+
+class PlanWorker(_BackgroundWorker):
+    """
+    submit(data, custom_pit_times, custom_laps): hesap arka planda başlar.
+    plan_ready(plan): sadece son isteğin sonucu, GUI thread'inde.
+    failed(message): son istek hata verdi.
+    """
+    plan_ready = pyqtSignal(object)
+
+    def submit(self, data: dict, custom_pit_times: dict, custom_laps: dict) -> int:
+        return self._start(_PlanJob, dict(data), copy.deepcopy(custom_pit_times), dict(custom_laps))
+
+    def _emit_result(self, plan):
+        self.plan_ready.emit(plan)
+
+
+class _FcyLookupJob(_Job):
+    error_message = "❌ FCY tablosu hesaplama hatası:"
+
+    def __init__(self, generation: int, signals: _JobSignals, inputs: PlanInputs, stint_laps: dict,
+                 tire_consumption: float):
+        super().__init__(generation, signals)
+        self.inputs = inputs
+        self.stint_laps = stint_laps
+        self.tire_consumption = tire_consumption
+
+    def compute(self):
+        return {
+            strategy: build_fcy_lookup(self.inputs, laps, self.tire_consumption, strategy,
+                                       cancelled=self.cancel_event.is_set)
+            for strategy, laps in self.stint_laps.items()
+        }
+
+
+class FcyLookupWorker(_BackgroundWorker):
+    """
+    submit(plan): planın form stratejileri için FCY tabloları arka planda kurulur.
+    lookups_ready(dict): strateji -> FcyLookup, sadece son isteğin sonucu.
+    failed(message): son istek hata verdi.
+    """
+    lookups_ready = pyqtSignal(object)
+
+    def submit(self, plan) -> int:
+        # Üretilmiş sütunların (ör. FCY) form değeri yok, tablo kurulmaz
+        stint_laps = {s: int(plan.data[s]) for s in plan.strategies if int(plan.data.get(s) or 0) > 0}
+        return self._start(_FcyLookupJob, plan.inputs, stint_laps, plan.data.get("tire_consumption", 0))
+
+    def _emit_result(self, lookups):
+        self.lookups_ready.emit(lookups)
+
+
+class _SimulationJob(_Job):
+    error_message = "❌ Simülasyon hatası:"
+
+    def __init__(self, generation: int, signals: _JobSignals, inputs: PlanInputs, profiles: list,
+                 params: SimulationParams):
+        super().__init__(generation, signals)
+        self.inputs = inputs
+        self.profiles = profiles
+        self.params = params
+
+    def compute(self):
+        return run_simulation(self.inputs, self.profiles, self.params, cancelled=self.cancel_event.is_set)
+
+
+class SimulationWorker(_BackgroundWorker):
+    """
+    submit(inputs, profiles, params): simülasyon arka planda başlar.
+    results_ready(dict): strateji -> SimulationResult, sadece son isteğin sonucu.
+    failed(message): son istek hata verdi.
+    """
+    results_ready = pyqtSignal(object)
+
+    def submit(self, inputs: PlanInputs, profiles: list, params: SimulationParams = SimulationParams()) -> int:
+        return self._start(_SimulationJob, inputs, profiles, params)
+
+    def _emit_result(self, results):
+        self.results_ready.emit(results)
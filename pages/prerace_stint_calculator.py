@@ -1,7 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
 from pages.strategy_form import StrategyForm
 from pages.table_component import TableComponent
-import os
 
 class PreRaceStintCalculator(QWidget):
     def __init__(self):
@@ -11,10 +10,10 @@ class PreRaceStintCalculator(QWidget):
 
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("background-color: transparent; border: none;")
+        # Zemin ve kenarlık ui/styles.qss'te (#PreraceScroll)
+        scroll_area.setObjectName("PreraceScroll")
 
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: transparent;")
         scroll_layout = QVBoxLayout(scroll_content)
 
         self.strategy_form = StrategyForm()
@@ -29,15 +28,18 @@ class PreRaceStintCalculator(QWidget):
 
         # ✅ Signal bağlantıları
         self.strategy_form.data_ready.connect(self.table_component.update_table)
+        self.strategy_form.data_edited.connect(self.table_component.update_table_live)
+        self.strategy_form.live_mode_changed.connect(self.table_component.set_live_mode)
+        self.strategy_form.simulation_requested.connect(self.table_component.run_simulation)
 
         self.strategy_form.save_button.clicked.connect(
             lambda: self.table_component.save_strategy_data(
-                os.path.splitext(os.path.basename(self.strategy_form.get_current_filename()))[0]
+                self.strategy_form.get_current_key()
             )
         )
 
         self.strategy_form.load_button.clicked.connect(
             lambda: self.table_component.load_strategy_data(
-                os.path.splitext(os.path.basename(self.strategy_form.get_current_filename()))[0]
+                self.strategy_form.get_current_key()
             )
         )
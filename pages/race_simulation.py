@@ -0,0 +1,296 @@
+# pages/race_simulation.py
+"""
+Monte Carlo yarış simülasyonu.
+
+Qt'ye bağımlı değildir. Her strateji, StintPlan'ın hesapladığı sütunundan
+(stint turları ve pit süreleri) bir pit takvimine çevrilir; binlerce yarış
+NumPy batch'leri halinde, süreç havuzunda (multiprocessing) yürütülür.
+Rastgele etkenler:
+  - tur süresi sapması (ortalama tur süresinin yüzdesi, normal dağılım)
+  - FCY / safety car: saatte fcy_per_hour ortalamalı Poisson, süre uniform;
+    FCY'deki turlar lap_time_factor kadar yavaş
+  - pit süresi sapması (saniye, normal dağılım)
+
+Aynı batch'te tüm stratejiler aynı rastgele sayıları kullanır (ortak FCY'ler,
+ortak tur sapması); karşılaştırma ve "en iyi olma oranı" bu yüzden adildir.
+Sonuç her strateji için bayrakta tamamlanan tur ve bitiş çizgisini geçiş
+anı (yarış başından saniye) dağılımıdır.
+"""
+import math
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+import multiprocessing
+import os
+
+import numpy as np
+
+from pages.fcy_engine import FCY_LAP_TIME_FACTOR
+from pages.stint_plan import PlanInputs, PlanCancelled
+
+# Tur sapması bu kadar standart sapmada kırpılır (tur dizisi uzunluğu buna göre)
+LAP_SIGMA_CLIP = 4.0
+# FCY pencereleri bu çözünürlükte (saniye) işaretlenir
+FCY_BIN_SECONDS = 10.0
+# Havuz beklenirken iptal bu aralıkla kontrol edilir (saniye)
+CANCEL_POLL_SECONDS = 0.1
+
+# Alt süreçte: run_simulation'ın iptal bayrağı (havuz initializer'ı kurar)
+_worker_stop = None
+
+
+def _init_worker(stop):
+    global _worker_stop
+    _worker_stop = stop
+
+
+def _worker_cancelled() -> bool:
+    return _worker_stop is not None and _worker_stop.is_set()
+
+
+@dataclass(frozen=True)
+class SimulationParams:
+    runs: int = 20000
+    batch_size: int = 2000
+    # Tur süresi standart sapması, ortalama tur süresine oran
+    lap_time_sigma: float = 0.01
+    fcy_per_hour: float = 0.25
+    fcy_min_seconds: float = 120.0
+    fcy_max_seconds: float = 480.0
+    lap_time_factor: float = FCY_LAP_TIME_FACTOR
+    # Pit süresi standart sapması (saniye)
+    pit_jitter_seconds: float = 2.0
+    seed: int = None
+
+
+@dataclass(frozen=True)
+class StrategyProfile:
+    """Planın bir sütunu: stint turları ve her stint sonundaki pit süresi."""
+    strategy: str
+    stint_laps: tuple
+    pit_seconds: tuple
+    # Plan biterse (yarış beklenenden hızlı) aynı uzunlukta stint'ler tam pitle devam eder
+    extra_stint_laps: int
+    extra_pit_seconds: float
+
+    @classmethod
+    def from_records(cls, strategy: str, records: list, inputs: PlanInputs):
+        records = [r for r in records if r.laps > 0]
+        laps = tuple(int(r.laps) for r in records)
+        return cls(
+            strategy=strategy,
+            stint_laps=laps,
+            pit_seconds=tuple(float(r.pit_seconds) for r in records),
+            extra_stint_laps=max(laps, default=0),
+            extra_pit_seconds=inputs.pit_lane_time + inputs.fuel_time + inputs.tire_time,
+        )
+
+    def schedule(self, lap_count: int):
+        """
+        lap_count turluk dizi: her turun sonundaki pit süresi ve pit sırası
+        (pit olmayan turlarda -1).
+        """
+        pit = np.zeros(lap_count)
+        stop_index = np.full(lap_count, -1, dtype=np.int64)
+        lap = stop = 0
+        stints = list(zip(self.stint_laps, self.pit_seconds))
+        while lap < lap_count:
+            if stop < len(stints):
+                laps, seconds = stints[stop]
+            elif self.extra_stint_laps > 0:
+                laps, seconds = self.extra_stint_laps, self.extra_pit_seconds
+            else:
+                break
+            lap += laps
+            if lap - 1 < lap_count and seconds > 0:
+                pit[lap - 1] = seconds
+                stop_index[lap - 1] = stop
+            stop += 1
+        return pit, stop_index, stop
+
+
+class SimulationResult:
+    """Bir stratejinin tüm koşulardaki bayrak turu ve bitiş anı."""
+
+    def __init__(self, strategy: str, laps: np.ndarray, finish_seconds: np.ndarray, wins: int):
+        self.strategy = strategy
+        self.laps = laps
+        self.finish_seconds = finish_seconds
+        self.wins = wins
+
+    @property
+    def runs(self) -> int:
+        return len(self.laps)
+
+    @property
+    def mean_laps(self) -> float:
+        return float(self.laps.mean()) if self.runs else 0.0
+
+    @property
+    def mean_finish(self) -> float:
+        return float(self.finish_seconds.mean()) if self.runs else 0.0
+
+    @property
+    def win_share(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    def lap_percentiles(self, q=(10, 50, 90)) -> list[float]:
+        return [float(v) for v in np.percentile(self.laps, q)] if self.runs else [0.0] * len(q)
+
+    def finish_percentiles(self, q=(10, 50, 90)) -> list[float]:
+        return [float(v) for v in np.percentile(self.finish_seconds, q)] if self.runs else [0.0] * len(q)
+
+    def lap_histogram(self) -> dict:
+        """tur -> koşu sayısı"""
+        values, counts = np.unique(self.laps, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+
+def rank_results(results: dict) -> list[SimulationResult]:
+    """Önce ortalama tur (çok olan), sonra ortalama bitiş anı (erken olan)."""
+    return sorted(results.values(), key=lambda r: (-r.mean_laps, r.mean_finish))
+
+
+def simulate_batch(inputs: PlanInputs, profiles: list, params: SimulationParams, size: int, seed,
+                   cancelled=None):
+    """
+    size yarışlık bir batch; süreç havuzunda çalışır (üst seviye, pickle edilebilir).
+    Dönüş: strateji -> (tur dizisi, bitiş dizisi), strateji -> batch'te en iyi olma sayısı.
+    cancelled her strateji öncesi sorulur (havuzda varsayılan: run_simulation'ın
+    iptal bayrağı); True dönerse PlanCancelled.
+    """
+    cancelled = cancelled or _worker_cancelled
+    if cancelled():
+        raise PlanCancelled()
+    rng = np.random.default_rng(seed)
+    race_time = inputs.race_time
+    lap = inputs.average_lap_time
+
+    min_lap = lap * max(0.05, 1.0 - LAP_SIGMA_CLIP * params.lap_time_sigma)
+    lap_count = int(math.ceil(race_time / min_lap)) + 2
+
+    # Ortak rastgele sayılar
+    noise = rng.standard_normal((size, lap_count))
+    green = lap * (1.0 + params.lap_time_sigma * np.clip(noise, -LAP_SIGMA_CLIP, LAP_SIGMA_CLIP))
+
+    fcy_counts = rng.poisson(params.fcy_per_hour * race_time / 3600.0, size)
+    slots = max(1, int(fcy_counts.max(initial=0)))
+    fcy_start = rng.uniform(0.0, race_time, (size, slots))
+    fcy_end = fcy_start + rng.uniform(params.fcy_min_seconds, params.fcy_max_seconds, (size, slots))
+    # Kullanılmayan slotlar boş pencere
+    unused = np.arange(slots)[None, :] >= fcy_counts[:, None]
+    fcy_end[unused] = fcy_start[unused]
+
+    schedules = {p.strategy: p.schedule(lap_count) for p in profiles}
+    stop_slots = max((stops for _, _, stops in schedules.values()), default=0) + 1
+    pit_noise = rng.standard_normal((size, stop_slots)) * params.pit_jitter_seconds
+
+    # FCY maskesi FCY_BIN_SECONDS'lik zaman ızgarasında: pencere başına +1 / -1, kümülatif toplam > 0
+    # Bayrakta devam eden tur da ızgaraya sığar; sonrası önemsiz (son bin'e kırpılır)
+    bins = int(math.ceil((race_time + 2 * lap * params.lap_time_factor) / FCY_BIN_SECONDS)) + 1
+    rows = np.repeat(np.arange(size), slots)
+    delta = np.zeros((size, bins + 1), dtype=np.int8)
+    np.add.at(delta, (rows, np.minimum(fcy_start // FCY_BIN_SECONDS, bins).astype(np.int64).ravel()), 1)
+    np.add.at(delta, (rows, np.minimum(fcy_end // FCY_BIN_SECONDS, bins).astype(np.int64).ravel()), -1)
+    fcy_mask = np.cumsum(delta, axis=1, dtype=np.int8) > 0
+
+    def under_fcy(mid):
+        index = np.minimum((mid * (1.0 / FCY_BIN_SECONDS)).astype(np.int64), bins)
+        return np.take_along_axis(fcy_mask, index, axis=1)
+
+    lap_numbers = np.arange(1, lap_count + 1)
+    outputs = {}
+    scores = []
+    for profile in profiles:
+        if cancelled():
+            raise PlanCancelled()
+        pit, stop_index, _ = schedules[profile.strategy]
+        pits = np.where(stop_index >= 0, pit[None, :] + pit_noise[:, np.maximum(stop_index, 0)], 0.0)
+        pits = np.maximum(pits, 0.0)
+
+        # İki geçiş: yeşil turlarla zamanlar -> FCY'ye düşen turlar yavaşlar -> tekrar
+        laps = green
+        for _ in range(2):
+            ends = np.cumsum(laps + pits, axis=1) - pits
+            mid = ends - laps / 2
+            laps = np.where(under_fcy(mid), green * params.lap_time_factor, green)
+        ends = np.cumsum(laps + pits, axis=1) - pits
+
+        # Bayraktan sonra çizgiyi ilk geçiş yarışın bitişidir
+        finish_index = np.minimum((ends < race_time).sum(axis=1), lap_count - 1)
+        finish = ends[np.arange(size), finish_index]
+        completed = lap_numbers[finish_index]
+        outputs[profile.strategy] = (completed.astype(np.int32), finish.astype(np.float32))
+        scores.append(completed * 1e6 - finish)
+
+    wins = {p.strategy: 0 for p in profiles}
+    if scores:
+        best = np.argmax(np.vstack(scores), axis=0)
+        for i, count in enumerate(np.bincount(best, minlength=len(profiles))):
+            wins[profiles[i].strategy] = int(count)
+    return outputs, wins
+
+
+def run_simulation(inputs: PlanInputs, profiles: list, params: SimulationParams = SimulationParams(),
+                   processes: int = None, cancelled=None) -> dict:
+    """
+    params.runs yarışı batch'lere böler ve süreç havuzunda yürütür.
+    Dönüş: strateji -> SimulationResult. cancelled True dönerse PlanCancelled.
+    """
+    profiles = [p for p in profiles if p.stint_laps]
+    if not profiles or inputs.race_time <= 0 or inputs.average_lap_time <= 0 or params.runs <= 0:
+        return {}
+
+    sizes = [params.batch_size] * (params.runs // params.batch_size)
+    if params.runs % params.batch_size:
+        sizes.append(params.runs % params.batch_size)
+    seeds = np.random.SeedSequence(params.seed).spawn(len(sizes))
+
+    laps = {p.strategy: [] for p in profiles}
+    finish = {p.strategy: [] for p in profiles}
+    wins = {p.strategy: 0 for p in profiles}
+
+    def collect(outputs, batch_wins):
+        for strategy, (batch_laps, batch_finish) in outputs.items():
+            laps[strategy].append(batch_laps)
+            finish[strategy].append(batch_finish)
+            wins[strategy] += batch_wins[strategy]
+
+    workers = min(len(sizes), processes or os.cpu_count() or 1)
+    if workers <= 1:
+        for size, seed in zip(sizes, seeds):
+            if cancelled is not None and cancelled():
+                raise PlanCancelled()
+            collect(*simulate_batch(inputs, profiles, params, size, seed, cancelled))
+    else:
+        # spawn: Qt uygulamasının süreci fork edilmez (Windows'ta zaten tek seçenek)
+        context = multiprocessing.get_context("spawn")
+        stop = context.Event()
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                   initializer=_init_worker, initargs=(stop,))
+        try:
+            pending = {pool.submit(simulate_batch, inputs, profiles, params, size, seed)
+                       for size, seed in zip(sizes, seeds)}
+            while pending:
+                # İptal batch bitmesi beklenmeden, çalışırken de kontrol edilir
+                if cancelled is not None and cancelled():
+                    raise PlanCancelled()
+                done, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(*future.result())
+        except BaseException:
+            # Sıradaki batch'ler atılır, çalışanlar bir sonraki stratejide durur;
+            # süreçler kapanmadan dönülmez, yeni Simulate eski koşunun arkasında kalmaz
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+
+    return {
+        strategy: SimulationResult(strategy, np.concatenate(laps[strategy]),
+                                   np.concatenate(finish[strategy]), wins[strategy])
+        for strategy in laps
+    }
+
+
+def profiles_from_plan(plan) -> list[StrategyProfile]:
+    return [StrategyProfile.from_records(s, plan.column(s), plan.inputs) for s in plan.strategies]
@@ -1,9 +1,11 @@
 import json
 import os
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QWidget, QFormLayout
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QWidget,
+    QFormLayout, QCheckBox
 )
 from PyQt6.QtCore import Qt
+from pages.driver_rotation import RotationRules, parse_clock
 
 DATA_DIR = "data/teams_drivers"
 
@@ -11,7 +13,7 @@ class SettingsDialog(QDialog):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Takım Ayarları")
-        self.setMinimumWidth(400)
+        self.setMinimumWidth(600)
 
         os.makedirs(DATA_DIR, exist_ok=True)
         self.teams_data = self.load_all_teams()
@@ -49,6 +51,10 @@ class SettingsDialog(QDialog):
                 border-radius: 6px;
                 padding: 6px;
             }
+            QCheckBox {
+                color: white;
+                font-size: 14px;
+            }
         """)
 
         layout = QVBoxLayout(self)
@@ -66,13 +72,46 @@ class SettingsDialog(QDialog):
         layout.addWidget(QLabel("Takım İsmi:"))
         layout.addWidget(self.team_input)
 
-        # 6 adet pilot alanı
+        # 6 adet pilot alanı + rotasyon sınırları (min / max sürüş HH:mm, gece tercihi)
         self.driver_inputs = []
+        self.min_drive_inputs = []
+        self.max_drive_inputs = []
+        self.night_checks = []
         form_layout = QFormLayout()
         for i in range(6):
             inp = QLineEdit()
-            form_layout.addRow(f"Pilot {i + 1}:", inp)
+            min_drive = QLineEdit()
+            min_drive.setPlaceholderText("Min HH:mm")
+            max_drive = QLineEdit()
+            max_drive.setPlaceholderText("Max HH:mm")
+            for field in (min_drive, max_drive):
+                field.setFixedWidth(100)
+            night = QCheckBox("🌙")
+            night.setToolTip("Gece stint'lerini tercih eder")
+
+            row = QHBoxLayout()
+            row.addWidget(inp)
+            row.addWidget(min_drive)
+            row.addWidget(max_drive)
+            row.addWidget(night)
+            form_layout.addRow(f"Pilot {i + 1}:", row)
             self.driver_inputs.append(inp)
+            self.min_drive_inputs.append(min_drive)
+            self.max_drive_inputs.append(max_drive)
+            self.night_checks.append(night)
+
+        # Takım geneli rotasyon kuralları
+        self.max_consecutive_input = QLineEdit()
+        self.max_consecutive_input.setPlaceholderText(str(RotationRules.max_consecutive))
+        self.night_start_input = QLineEdit()
+        self.night_start_input.setPlaceholderText("22:00")
+        self.night_end_input = QLineEdit()
+        self.night_end_input.setPlaceholderText("06:00")
+        night_row = QHBoxLayout()
+        night_row.addWidget(self.night_start_input)
+        night_row.addWidget(self.night_end_input)
+        form_layout.addRow("Max Art Arda Stint:", self.max_consecutive_input)
+        form_layout.addRow("Gece (Başlangıç - Bitiş):", night_row)
         layout.addLayout(form_layout)
 
         # Kaydet butonu
@@ -98,12 +137,50 @@ class SettingsDialog(QDialog):
         if team_name != "--- Yeni Takım ---" and team_name in self.teams_data:
             self.team_input.setText(team_name)
             drivers = self.teams_data[team_name].get("drivers", [])
+            rotation = self.teams_data[team_name].get("rotation", {}) or {}
+            limits = rotation.get("drivers", {}) or {}
             for i, input_field in enumerate(self.driver_inputs):
-                input_field.setText(drivers[i] if i < len(drivers) else "")
+                name = drivers[i] if i < len(drivers) else ""
+                limit = limits.get(name, {}) if name else {}
+                input_field.setText(name)
+                self.min_drive_inputs[i].setText(limit.get("min_drive", ""))
+                self.max_drive_inputs[i].setText(limit.get("max_drive", ""))
+                self.night_checks[i].setChecked(bool(limit.get("night", False)))
+            self.max_consecutive_input.setText(str(rotation.get("max_consecutive", "")))
+            self.night_start_input.setText(rotation.get("night_start", ""))
+            self.night_end_input.setText(rotation.get("night_end", ""))
         else:
             self.team_input.clear()
-            for input_field in self.driver_inputs:
-                input_field.clear()
+            for fields in (self.driver_inputs, self.min_drive_inputs, self.max_drive_inputs,
+                           [self.max_consecutive_input, self.night_start_input, self.night_end_input]):
+                for input_field in fields:
+                    input_field.clear()
+            for check in self.night_checks:
+                check.setChecked(False)
+
+    def rotation_settings(self) -> dict:
+        """Formdaki rotasyon kuralları; boş alanlar yazılmaz (varsayılan kullanılır)."""
+        limits = {}
+        for i, input_field in enumerate(self.driver_inputs):
+            name = input_field.text().strip()
+            if not name:
+                continue
+            limit = {}
+            for key, field in (("min_drive", self.min_drive_inputs[i]), ("max_drive", self.max_drive_inputs[i])):
+                if parse_clock(field.text()) is not None:
+                    limit[key] = field.text().strip()
+            if self.night_checks[i].isChecked():
+                limit["night"] = True
+            if limit:
+                limits[name] = limit
+
+        rotation = {"drivers": limits}
+        if self.max_consecutive_input.text().strip().isdigit():
+            rotation["max_consecutive"] = int(self.max_consecutive_input.text().strip())
+        for key, field in (("night_start", self.night_start_input), ("night_end", self.night_end_input)):
+            if parse_clock(field.text()) is not None:
+                rotation[key] = field.text().strip()
+        return rotation
 
     def save_team(self):
         team_name = self.team_input.text().strip()
@@ -118,9 +195,13 @@ class SettingsDialog(QDialog):
             return
 
         filepath = os.path.join(DATA_DIR, f"{team_name}.json")
+        # Dosyadaki diğer anahtarlar korunur
+        document = dict(self.teams_data.get(team_name, {}))
+        document["drivers"] = drivers
+        document["rotation"] = self.rotation_settings()
         try:
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump({"drivers": drivers}, f, indent=4, ensure_ascii=False)
+                json.dump(document, f, indent=4, ensure_ascii=False)
             QMessageBox.information(self, "Başarılı", f"{team_name} takımı kaydedildi.")
             self.accept()
         except Exception as e:
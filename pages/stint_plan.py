@@ -0,0 +1,319 @@
+# pages/stint_plan.py
+"""
+Stint planı hesaplama motoru.
+
+Qt'ye bağımlı değildir: StrategyForm.send_data sözlüğü ile TableComponent'teki
+custom_pit_times / custom_laps değerlerini alır ve her strateji için stint
+kayıtlarını üretir. Tablo, canlı monitör ve pilot sayfası bu kayıtlardan çizer.
+"""
+from bisect import bisect_right
+from dataclasses import dataclass
+
+from pages.strategy_utils import calculate_stint_time, calculate_time_left
+
+# Sadece sonsuz döngü koruması (ör. sıfır tur süresi); gerçek satır sayısı stint sayısıdır
+STINT_LIMIT = 10000
+# Kayan nokta toplamları yarış süresinin bir tık altında kalabiliyor;
+# bu pay altında kalan süre için boş (00:00:00) stint açılmaz.
+TIME_EPSILON = 1e-6
+
+
+class PlanCancelled(Exception):
+    """Plan hesaplanırken iptal edildi (yerine daha yeni bir istek geldi)."""
+
+
+@dataclass(frozen=True)
+class PlanInputs:
+    """send_data sözlüğündeki sayısal form değerleri."""
+    race_time: float = 0
+    average_lap_time: float = 0
+    fuel_time: float = 0
+    tire_time: float = 0
+    pit_lane_time: float = 0
+    fuel_consumption: float = 0
+    virtual_fuel: float = 0
+
+    @classmethod
+    def from_data(cls, data: dict) -> "PlanInputs":
+        return cls(
+            race_time=data.get("race_time_seconds", 0),
+            average_lap_time=data.get("average_lap_time_seconds", 0),
+            fuel_time=data.get("fuel_time", 0),
+            tire_time=data.get("tire_time", 0),
+            pit_lane_time=data.get("pit_lane_time", 0),
+            fuel_consumption=data.get("fuel_consumption", 0),
+            virtual_fuel=data.get("virtual_fuel", 0),
+        )
+
+
+@dataclass(frozen=True)
+class StintRecord:
+    """Tek bir stratejinin tek bir stint satırı (tüm süreler saniye)."""
+    row: int
+    strategy: str
+    strategy_index: int
+    laps: int
+    stint_seconds: float
+    pit_seconds: float
+    total_seconds: float
+    remaining_seconds: float
+    fuel: float
+    virtual: float
+    extra_laps: int = 0
+
+
+STRATEGY_PREFIX = "strategy_"
+
+
+def is_strategy_key(key: str) -> bool:
+    return key.startswith(STRATEGY_PREFIX)
+
+
+def strategy_key_for_index(index: int) -> str:
+    """0 -> strategy_a, 25 -> strategy_z, 26 -> strategy_aa (form sırasıyla üretilen adlar)."""
+    letters = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("a") + remainder) + letters
+    return STRATEGY_PREFIX + letters
+
+
+def strategy_label(key: str) -> str:
+    """strategy_b -> Strategy B, strategy_fcy_auto -> Strategy FCY AUTO"""
+    return "Strategy " + key[len(STRATEGY_PREFIX):].replace("_", " ").upper()
+
+
+def strategy_keys_from_data(data: dict) -> list[str]:
+    """Tur sayısı girilmiş (> 0) stratejileri form sırasıyla döndürür."""
+    return [k for k in data.keys() if is_strategy_key(k) and (data.get(k) or 0) > 0]
+
+
+def resolve_pit_option(custom: dict, inputs: PlanInputs):
+    """
+    Satıra özel pit ayarını (tire/fuel süreleri, checkbox'lar, ekstra yakıt turu)
+    sayıya çevirir. Hatalı girişte form değerine düşer.
+    """
+    try:
+        tire = float(custom.get("tire", inputs.tire_time))
+    except (TypeError, ValueError):
+        tire = inputs.tire_time
+
+    try:
+        fuel = float(custom.get("fuel", inputs.fuel_time))
+    except (TypeError, ValueError):
+        fuel = inputs.fuel_time
+
+    tire_checked = custom.get("tire_checked", True)
+    fuel_checked = custom.get("fuel_checked", True)
+    extra_laps = custom.get("fuel_extra_laps", 0)
+    return tire, fuel, tire_checked, fuel_checked, extra_laps
+
+
+def calculate_pit_seconds(custom: dict, inputs: PlanInputs) -> float:
+    """Son stint kontrolü olmadan satırın toplam pit süresi."""
+    tire, fuel, tire_checked, fuel_checked, extra_laps = resolve_pit_option(custom, inputs)
+    if not tire_checked and not fuel_checked:
+        return 0.0
+
+    pit_time = inputs.pit_lane_time
+    if tire_checked:
+        pit_time += tire
+    if fuel_checked:
+        pit_time += fuel + inputs.fuel_consumption * extra_laps
+    return pit_time
+
+
+def calculate_stint(inputs: PlanInputs, elapsed: float, laps: int, custom: dict,
+                    row: int, strategy: str, strategy_index: int) -> StintRecord:
+    """
+    elapsed saniyesinde başlayan tek bir stint'i hesaplar.
+    Kalan süre bu stint sonunda doluyorsa pit atlanır.
+    """
+    planned_stint_time = calculate_stint_time(inputs.average_lap_time, laps)
+    extra_laps = custom.get("fuel_extra_laps", 0)
+
+    is_last_stint = elapsed + planned_stint_time + inputs.pit_lane_time >= inputs.race_time
+    pit_time = 0.0 if is_last_stint else calculate_pit_seconds(custom, inputs)
+
+    max_available_stint_time = max(0, inputs.race_time - elapsed - pit_time)
+    actual_stint_time = min(planned_stint_time, max_available_stint_time)
+    cumulative_time = elapsed + actual_stint_time + pit_time
+    time_left = calculate_time_left(inputs.race_time, cumulative_time)
+
+    lap_ratio = actual_stint_time / inputs.average_lap_time if inputs.average_lap_time > 0 else 0
+    fuel_value = inputs.fuel_consumption * lap_ratio + inputs.fuel_consumption * extra_laps
+
+    return StintRecord(
+        row=row,
+        strategy=strategy,
+        strategy_index=strategy_index,
+        laps=laps,
+        stint_seconds=actual_stint_time,
+        pit_seconds=pit_time,
+        total_seconds=cumulative_time,
+        remaining_seconds=time_left,
+        fuel=fuel_value,
+        virtual=inputs.virtual_fuel * lap_ratio,
+        extra_laps=extra_laps,
+    )
+
+
+class StintTimeline:
+    """
+    Bir stratejinin stint sınırları; plan hesaplanırken bir kez kurulur.
+    Aktif stint aramaları bisect ile O(log n) yapılır.
+    """
+
+    def __init__(self, records: list[StintRecord]):
+        self.rows = [r.row for r in records]
+        self.ends = [r.total_seconds for r in records]
+        self.starts = [0.0] + self.ends[:-1]
+        # Kalan süre satır ilerledikçe azalır; bisect için artan sırada tutulur
+        self.remaining_ascending = [r.remaining_seconds for r in reversed(records)]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def active_index(self, time_left: float):
+        """Kalan süresi time_left'e ulaşmış ilk stint'in indeksi (yoksa None)."""
+        reached = bisect_right(self.remaining_ascending, time_left)
+        if reached == 0:
+            return None
+        return len(self.remaining_ascending) - reached
+
+    def index_at(self, elapsed: float):
+        """Yarışın elapsed saniyesinde sürmekte olan stint'in indeksi (yoksa None)."""
+        index = bisect_right(self.starts, elapsed) - 1
+        if index < 0 or index >= len(self.ends) or elapsed >= self.ends[index]:
+            return None
+        return index
+
+
+class StintPlan:
+    """
+    Tüm stratejilerin stint planı.
+
+    plan = StintPlan(data, custom_pit_times, custom_laps)
+    plan.column("strategy_a")    -> [StintRecord, ...]
+    plan.record(3, "strategy_b") -> StintRecord | None
+
+    Strateji sayısı sabit değildir: formdaki her dolu strategy_* alanı ve
+    set_column ile eklenen üretilmiş sütunlar (ör. strategy_fcy_auto) sırayla
+    yer alır. custom_laps anahtarı (satır, strateji adı) olduğundan sütun
+    sırası değişse de tur girişleri doğru stratejide kalır.
+    """
+
+    def __init__(self, data: dict, custom_pit_times: dict = None, custom_laps: dict = None,
+                 cancelled=None):
+        """cancelled: arka plan hesabında satır başına sorulan fonksiyon; True dönerse PlanCancelled."""
+        self.data = data
+        self.inputs = PlanInputs.from_data(data)
+        self.custom_pit_times = custom_pit_times if custom_pit_times is not None else {}
+        self.custom_laps = custom_laps if custom_laps is not None else {}
+        self.strategies = strategy_keys_from_data(data)
+        # strateji -> sütun sırası; onlarca sütunda list.index taraması yapılmaz
+        self.strategy_indexes = {s: i for i, s in enumerate(self.strategies)}
+        self.cancelled = cancelled
+        self.columns = {s: self._build_column(s, [], 0) for s in self.strategies}
+        # Hazır plan GUI thread'inde artık iptal edilemez (recompute_from senkron çalışır)
+        self.cancelled = None
+        self.timelines = {s: StintTimeline(records) for s, records in self.columns.items()}
+        # Dışarıdan hazır verilen (ör. FCY önerisi) sütunlar yeniden hesaplanmaz
+        self.fixed_strategies = set()
+
+    def _build_column(self, strategy: str, records: list, start_row: int) -> list[StintRecord]:
+        """
+        records[:start_row] korunur; start_row'dan itibaren stint'ler o satırın
+        başlangıç süresinden (önceki stint'in kümülatif toplamı) yeniden hesaplanır.
+        """
+        strategy_index = self.strategy_indexes[strategy]
+        default_laps = self.data.get(strategy, 0)
+        records = records[:start_row]
+        elapsed = records[-1].total_seconds if records else 0
+        row = len(records)
+        while elapsed < self.inputs.race_time - TIME_EPSILON and row < STINT_LIMIT:
+            if self.cancelled is not None and self.cancelled():
+                raise PlanCancelled()
+            laps = self.custom_laps.get((row, strategy), default_laps)
+            record = calculate_stint(
+                self.inputs, elapsed, laps, self.custom_pit_times.get(row, {}),
+                row, strategy, strategy_index
+            )
+            records.append(record)
+            if record.stint_seconds <= 0:
+                break  # tur süresi girilmemiş: yarış hiç ilerlemez
+            elapsed = record.total_seconds
+            row += 1
+        return records
+
+    def start_seconds(self, row: int, strategy: str) -> float:
+        """Satırın başladığı an (önceki stint'lerin kümülatif toplamı)."""
+        records = self.columns.get(strategy, [])
+        if row <= 0 or not records:
+            return 0
+        return records[min(row, len(records)) - 1].total_seconds
+
+    def recompute_from(self, row: int, strategies: list[str] = None) -> set[int]:
+        """
+        Satır row'daki pit/tur ayarı değiştiğinde sadece row ve sonrasını
+        yeniden hesaplar. Kaydı değişen satır numaralarını döndürür.
+        """
+        changed_rows = set()
+        for strategy in strategies or self.strategies:
+            if strategy in self.fixed_strategies:
+                continue
+            old_records = self.columns[strategy]
+            if row > len(old_records):
+                continue
+            new_records = self._build_column(strategy, old_records, row)
+            self.columns[strategy] = new_records
+            self.timelines[strategy] = StintTimeline(new_records)
+            for r in range(row, max(len(old_records), len(new_records))):
+                old = old_records[r] if r < len(old_records) else None
+                new = new_records[r] if r < len(new_records) else None
+                if old != new:
+                    changed_rows.add(r)
+        return changed_rows
+
+    def update_lap_counts(self, data: dict, strategies: list[str]) -> set[int]:
+        """
+        Formda sadece strategies'in tur sayısı değiştiğinde: diğer sütunlar
+        korunur, bu sütunlar baştan hesaplanır. Değişen satırları döndürür.
+        """
+        self.data = data
+        return self.recompute_from(0, strategies)
+
+    def set_column(self, strategy: str, records: list[StintRecord]):
+        """Hazır hesaplanmış kayıtları sütun olarak ekler (plan kurallarıyla yeniden hesaplanmaz)."""
+        if strategy not in self.strategy_indexes:
+            self.strategy_indexes[strategy] = len(self.strategies)
+            self.strategies.append(strategy)
+        self.fixed_strategies.add(strategy)
+        self.columns[strategy] = list(records)
+        self.timelines[strategy] = StintTimeline(self.columns[strategy])
+
+    def timeline(self, strategy: str) -> StintTimeline:
+        return self.timelines.get(strategy) or StintTimeline([])
+
+    def strategy_index(self, strategy: str):
+        return self.strategy_indexes.get(strategy)
+
+    def column(self, strategy: str) -> list[StintRecord]:
+        return self.columns.get(strategy, [])
+
+    def record(self, row: int, strategy: str):
+        records = self.columns.get(strategy, [])
+        return records[row] if 0 <= row < len(records) else None
+
+    def stint_count(self) -> int:
+        """En uzun stratejinin stint sayısı."""
+        return max((len(r) for r in self.columns.values()), default=0)
+
+    @property
+    def row_count(self) -> int:
+        """Tablo satır sayısı: tahmin değil, en uzun stratejinin gerçek stint sayısı."""
+        return self.stint_count()
+
+    def is_empty_row(self, row: int) -> bool:
+        return all(self.record(row, s) is None for s in self.strategies)
@@ -0,0 +1,177 @@
+# pages/stint_preview.py
+"""
+Widget'sız strateji önizlemesi.
+
+Live Race Monitor'daki stint listesi ve Drivers Time tablosundaki strateji
+kartları StrategyStore kayıtlarından QPainter ile çizilir. Strateji
+değişince sadece model verisi değişir; widget kopyalanmaz, silinmez.
+"""
+from PyQt6.QtWidgets import QStyledItemDelegate, QListView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QPainter
+
+from pages.strategy_table_model import (
+    RecordRole, ActiveRole, CARD_HEIGHT, card_font, paint_stint_card, paint_stint_box
+)
+
+DriverRole = Qt.ItemDataRole.UserRole + 4
+
+PREVIEW_WIDTH = 300
+HEADER_HEIGHT = 32
+DRIVER_HEIGHT = 22
+ITEM_SPACING = 12
+
+
+class StintPreviewModel(QAbstractListModel):
+    """Seçili stratejinin stint'leri; kayıtlar store'dan okunur."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = None
+        self.strategy = None
+        self.driver_names = None
+        self.active_row = None
+
+    def set_store(self, store):
+        self.store = store
+        store.plan_changed.connect(lambda plan: self.set_strategy(self.strategy, self.driver_names))
+        store.rows_changed.connect(self.on_rows_changed)
+
+    def set_strategy(self, strategy, driver_names=None):
+        """
+        Aynı strateji ve satır sayısında sadece veri yenilenir; aksi halde
+        model sıfırlanır (view mevcut item'ları yeniden kullanır).
+        """
+        new_count = len(self.store.column(strategy)) if self.store is not None and strategy else 0
+        if strategy == self.strategy and new_count == self.rowCount():
+            self.driver_names = driver_names
+            if new_count:
+                self.dataChanged.emit(self.index(0), self.index(new_count - 1))
+            return
+
+        self.beginResetModel()
+        self.strategy = strategy
+        self.driver_names = driver_names
+        self.active_row = None
+        self.endResetModel()
+
+    def on_rows_changed(self, first: int, last: int):
+        last = min(last, self.rowCount() - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def set_active_row(self, row):
+        previous = self.active_row
+        if previous == row:
+            return
+        self.active_row = row
+        for r in (previous, row):
+            if r is not None and 0 <= r < self.rowCount():
+                self.dataChanged.emit(self.index(r), self.index(r))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.store is None or self.strategy is None:
+            return 0
+        return len(self.store.column(self.strategy))
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.rowCount() == 0:
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Stint {row + 1}"
+        if role == RecordRole:
+            return self.store.record(row, self.strategy)
+        if role == ActiveRole:
+            return row == self.active_row
+        if role == DriverRole:
+            if self.driver_names is None:
+                return None
+            name = self.driver_names[row] if row < len(self.driver_names) else ""
+            return name or "-"
+        return None
+
+
+class StintPreviewDelegate(QStyledItemDelegate):
+    """Başlık (Stint N), varsa pilot adı ve stint kartını çizer."""
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect.adjusted(0, 0, 0, -ITEM_SPACING)
+
+        header_rect = QRect(rect.left(), rect.top(), rect.width(), HEADER_HEIGHT)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 128))
+        painter.drawRoundedRect(QRectF(header_rect), 6, 6)
+        painter.setFont(card_font(14, QFont.Weight.Bold))
+        painter.setPen(QColor("white"))
+        painter.drawText(header_rect, Qt.AlignmentFlag.AlignCenter, index.data(Qt.ItemDataRole.DisplayRole))
+        top = header_rect.bottom() + 6
+
+        driver = index.data(DriverRole)
+        if driver is not None:
+            driver_font = card_font(13, QFont.Weight.Normal)
+            driver_font.setItalic(True)
+            painter.setFont(driver_font)
+            painter.setPen(QColor("#FFD700"))
+            painter.drawText(QRect(rect.left(), top, rect.width(), DRIVER_HEIGHT), Qt.AlignmentFlag.AlignCenter, driver)
+            top += DRIVER_HEIGHT
+        painter.restore()
+
+        card_rect = QRect(rect.left(), top, rect.width(), CARD_HEIGHT)
+        record = index.data(RecordRole)
+        if record is None:
+            paint_stint_box(painter, card_rect, "-", index.row())
+        else:
+            paint_stint_card(painter, card_rect, record, active=bool(index.data(ActiveRole)))
+
+    def sizeHint(self, option, index):
+        height = HEADER_HEIGHT + 6 + CARD_HEIGHT + ITEM_SPACING
+        if index.data(DriverRole) is not None:
+            height += DRIVER_HEIGHT
+        return QSize(PREVIEW_WIDTH, height)
+
+
+class StintPreviewView(QListView):
+    """Live monitor stint listesi: sabit genişlik, piksel kaydırma, seçim yok."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.preview_model = StintPreviewModel(self)
+        self.setModel(self.preview_model)
+        self.setItemDelegate(StintPreviewDelegate(self))
+        self.setUniformItemSizes(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.Shape.NoFrame)
+
+    def set_store(self, store):
+        self.preview_model.set_store(store)
+
+    def set_strategy(self, strategy, driver_names=None):
+        self.preview_model.set_strategy(strategy, driver_names)
+
+    @property
+    def strategy(self):
+        return self.preview_model.strategy
+
+    def set_active_row(self, row):
+        self.preview_model.set_active_row(row)
+
+
+class StintCardItemDelegate(QStyledItemDelegate):
+    """Tablo hücresinde (RecordRole verisi) stint kartı çizer; Drivers Time tablosu için."""
+
+    def paint(self, painter, option, index):
+        record = index.data(RecordRole)
+        if record is None:
+            paint_stint_box(painter, option.rect, index.data(Qt.ItemDataRole.DisplayRole) or "-", index.row())
+        else:
+            paint_stint_card(painter, option.rect.adjusted(0, 0, 0, -4), record)
+
+    def sizeHint(self, option, index):
+        return QSize(360, CARD_HEIGHT)
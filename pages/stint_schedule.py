@@ -0,0 +1,122 @@
+# pages/stint_schedule.py
+"""
+Pilot sayfasının stint saat çizelgesi.
+
+Qt'ye bağımlı değildir. Başlangıç / bitiş saatleri baştan sona epoch saniyesi
+(int) olarak tutulur; metne sadece gösterimde çevrilir, bu yüzden 24 saatlik
+ve gün aşan yarışlarda yuvarlama ya da gece yarısı hatası birikmez.
+
+Zincir: satırın başlangıcı önceki satırın bitişidir (ilk satırda yarış
+başlangıcı), bitişi başlangıç + (stint + pit) süresidir. Elle girilen saat
+(override) satırın başlangıcını ve/veya bitişini sabitler; sonraki satırlar
+bu değerden devam eder. Bir override değiştiğinde sadece o satırdan
+itibaren, değerler eskisiyle aynı çıkana kadar yeniden hesaplanır.
+"""
+import time
+
+
+def format_clock(epoch_seconds: int) -> str:
+    """Yerel saatte "HH:mm:ss"."""
+    return time.strftime("%H:%M:%S", time.localtime(epoch_seconds))
+
+
+def format_datetime(epoch_seconds: int) -> str:
+    return time.strftime("%d %b %Y %H:%M:%S", time.localtime(epoch_seconds))
+
+
+def resolve_clock(text: str, reference: int):
+    """
+    "HH:mm" ya da "HH:mm:ss" -> reference'a en yakın gündeki epoch saniyesi
+    (gün aşan yarışlarda doğru gün seçilir); geçersizse None.
+    """
+    try:
+        parts = [int(p) for p in str(text).strip().split(":")]
+    except ValueError:
+        return None
+    if len(parts) not in (2, 3) or not (0 <= parts[0] < 24 and 0 <= parts[1] < 60):
+        return None
+    seconds = parts[2] if len(parts) == 3 else 0
+    if not 0 <= seconds < 60:
+        return None
+
+    local = time.localtime(reference)
+    candidates = []
+    for day_offset in (-1, 0, 1):
+        candidates.append(int(time.mktime((
+            local.tm_year, local.tm_mon, local.tm_mday + day_offset,
+            parts[0], parts[1], seconds, 0, 0, -1
+        ))))
+    return min(candidates, key=lambda c: abs(c - reference))
+
+
+class StintSchedule:
+    """
+    schedule.rebuild(race_start, durations)   -> tüm zincir
+    schedule.set_override(row, start, finish) -> değişen satırlar (range)
+    """
+
+    def __init__(self, race_start: int = 0):
+        self.race_start = int(race_start)
+        # Satır başına stint + pit süresi (saniye); kaydı olmayan satır 0
+        self.durations = []
+        # satır -> (başlangıç, bitiş) epoch; None alan zincirden hesaplanır
+        self.overrides = {}
+        self.starts = []
+        self.finishes = []
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def rebuild(self, race_start: int, durations: list) -> range:
+        """Override'lar satır numarasıyla korunur; yeni satır sayısının dışındakiler atılır."""
+        self.race_start = int(race_start)
+        self.durations = [max(0, int(round(d))) for d in durations]
+        self.overrides = {row: o for row, o in self.overrides.items() if row < len(self.durations)}
+        self.starts = [0] * len(self.durations)
+        self.finishes = [0] * len(self.durations)
+        return self._recompute_from(0, force=True)
+
+    def has_override(self, row: int) -> bool:
+        return row in self.overrides
+
+    def duration(self, row: int) -> int:
+        """Satırın gerçek süresi (override'lar dahil), saniye."""
+        return max(0, self.finishes[row] - self.starts[row])
+
+    def chain_times(self, row: int) -> tuple[int, int]:
+        """Satırın override'ı olmasaydı alacağı başlangıç ve bitiş."""
+        start = self.finishes[row - 1] if row > 0 else self.race_start
+        return start, start + self.durations[row]
+
+    def set_override(self, row: int, start: int = None, finish: int = None) -> range:
+        if not 0 <= row < len(self.durations):
+            return range(0)
+        if start is None and finish is None:
+            return self.clear_override(row)
+        self.overrides[row] = (start, finish)
+        return self._recompute_from(row)
+
+    def clear_override(self, row: int) -> range:
+        if self.overrides.pop(row, None) is None:
+            return range(0)
+        return self._recompute_from(row)
+
+    def _row_times(self, row: int, current: int) -> tuple[int, int]:
+        start, finish = self.overrides.get(row, (None, None))
+        start = current if start is None else start
+        finish = start + self.durations[row] if finish is None else finish
+        return start, finish
+
+    def _recompute_from(self, row: int, force: bool = False) -> range:
+        current = self.finishes[row - 1] if row > 0 else self.race_start
+        last = row - 1
+        for i in range(row, len(self.durations)):
+            start, finish = self._row_times(i, current)
+            # Satır değişmediyse sonrası da değişmez (her satır sadece öncekinin bitişine bağlı)
+            if not force and start == self.starts[i] and finish == self.finishes[i]:
+                break
+            self.starts[i] = start
+            self.finishes[i] = finish
+            last = i
+            current = finish
+        return range(row, last + 1)
@@ -1,5 +1,7 @@
-from PyQt6.QtWidgets import QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QScrollArea
+)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from pages.strategy_utils import (
     parse_race_time,
     parse_average_lap_time,
@@ -7,10 +9,38 @@ from pages.strategy_utils import (
     parse_float_one_decimal,
     parse_float_two_decimal
 )
-import os, json
+from pages.strategy_sweep import sweep_from_data
+from pages.stint_plan import is_strategy_key, strategy_key_for_index, strategy_label
+from utils.strategy_repository import strategy_repository, strategy_key
+from ui.toggleswitch import ToggleSwitch
+
+# Canlı modda son tuş vuruşundan sonra hesaplamaya kadar beklenen süre (ms)
+LIVE_DEBOUNCE_MS = 250
+# Form ilk açıldığında gösterilen strateji alanı sayısı (A-D); "Add Strategy" ile artar
+DEFAULT_STRATEGY_COUNT = 4
+
+PLACEHOLDER_EXAMPLES = {
+    "race_time": "02:00:00",
+    "average_lap_time": "01:35.678",
+    "strategy_a": "22",
+    "strategy_b": "24",
+    "strategy_c": "20",
+    "strategy_d": "25",
+    "fuel_time": "33,4",
+    "tire_time": "24,0",
+    "pit_lane_time": "32,5",
+    "fuel_consumption": "2,33",
+    "virtual_fuel": "2,20",
+    "tire_consumption": "1,80"
+}
 
 class StrategyForm(QWidget):
     data_ready = pyqtSignal(dict)
+    # Canlı mod: yazarken (debounce sonrası) gelen veri; kaydetmez, yarış saatini kurmaz
+    data_edited = pyqtSignal(dict)
+    live_mode_changed = pyqtSignal(bool)
+    # Hesaplanmış plan üzerinde Monte Carlo simülasyonu
+    simulation_requested = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -21,14 +51,7 @@ class StrategyForm(QWidget):
 
         # Üst başlık
         title_label = QLabel("PreRace Stint Calculator")
-        title_label.setStyleSheet("""
-            font-size: 32px;
-            font-weight: bold;
-            color: white;
-            border-bottom: 2px solid #960018;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        """)
+        title_label.setObjectName("StrategyFormTitle")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title_label)
 
@@ -39,12 +62,16 @@ class StrategyForm(QWidget):
         ])
 
         # --- Strategy Section ---
-        strategy_section = self.create_section("🛠 Strategy Section", [
-            ("Strategy A (laps)", "strategy_a"),
-            ("Strategy B (laps)", "strategy_b"),
-            ("Strategy C (laps)", "strategy_c"),
-            ("Strategy D (laps)", "strategy_d")
-        ])
+        strategy_section = self.create_section("🛠 Strategy Section", [], scrollable=True)
+        self.strategy_fields_layout = strategy_section.fields_layout
+        for _ in range(DEFAULT_STRATEGY_COUNT):
+            self.add_strategy_input()
+
+        self.add_strategy_button = QPushButton("➕ Add Strategy")
+        self.add_strategy_button.setFixedHeight(35)
+        self.add_strategy_button.setObjectName("AddStrategyButton")
+        self.add_strategy_button.clicked.connect(self.add_strategy_input)
+        strategy_section.section_layout.addWidget(self.add_strategy_button)
 
         # --- Pit Stop Section ---
         pitstop_section = self.create_section("🏎️ Pit Stop Section", [
@@ -72,40 +99,20 @@ class StrategyForm(QWidget):
         self.calculate_button = QPushButton("⚙️ Calculate Strategy")
         self.save_button = QPushButton("💾 Save Strategy")
         self.load_button = QPushButton("📂 Load Strategy")
+        self.sweep_button = QPushButton("🔍 Sweep Strategy")
+        self.simulate_button = QPushButton("🎲 Simulate")
 
-        for btn in [self.calculate_button, self.save_button, self.load_button]:
+        # Renkler ui/styles.qss'te: StrategyActionButton[role=...]
+        for btn, role in [(self.calculate_button, "calculate"), (self.save_button, "save"),
+                          (self.load_button, "load"), (self.sweep_button, "sweep"),
+                          (self.simulate_button, "simulate")]:
             btn.setFixedSize(230, 50)
-            btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 18px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    filter: brightness(110%);
-                }
-            """)
-
-        self.calculate_button.setStyleSheet(self.calculate_button.styleSheet() + """
-            QPushButton {
-                background-color: #ffd700;
-                color: black;
-            }
-        """)
-        self.save_button.setStyleSheet(self.save_button.styleSheet() + """
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-            }
-        """)
-        self.load_button.setStyleSheet(self.load_button.styleSheet() + """
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-            }
-        """)
+            btn.setObjectName("StrategyActionButton")
+            btn.setProperty("role", role)
 
         self.calculate_button.clicked.connect(self.send_data)
+        self.sweep_button.clicked.connect(self.run_sweep)
+        self.simulate_button.clicked.connect(self.simulation_requested.emit)
 
         # ✅ Butonları yatay hizala
         button_row = QHBoxLayout()
@@ -113,16 +120,20 @@ class StrategyForm(QWidget):
         button_row.addWidget(self.calculate_button)
         button_row.addWidget(self.save_button)
         button_row.addWidget(self.load_button)
+        button_row.addWidget(self.sweep_button)
+        button_row.addWidget(self.simulate_button)
+
+        # ⚡ Canlı mod: yazmaya ara verince değişen strateji sütunu hemen hesaplanır
+        self.live_toggle = ToggleSwitch("Live Update", initial=False)
+        self.live_toggle.checkbox.toggled.connect(self.toggle_live_mode)
+        button_row.addWidget(self.live_toggle)
 
         main_layout.addLayout(button_row)
 
-        # 🔗 FCY hesaplamalarında kullanılacak doğrudan erişim
-        self.strategy_inputs = {
-            "strategy_a": self.inputs["strategy_a"],
-            "strategy_b": self.inputs["strategy_b"],
-            "strategy_c": self.inputs["strategy_c"],
-            "strategy_d": self.inputs["strategy_d"]
-        }
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self.live_timer.timeout.connect(self.send_live_data)
 
         self.avg_lap_time         = self.inputs["average_lap_time"]
         self.fuel_time            = self.inputs["fuel_time"]
@@ -142,15 +153,13 @@ class StrategyForm(QWidget):
         self.virtual_fuel_per_lap = lambda: float(self.inputs["virtual_fuel"].text().replace(",", "."))
         self.tire_consumption = lambda: float(self.inputs["tire_consumption"].text().replace(",", "."))
 
-    def create_section(self, title, fields):
+    def create_section(self, title, fields, scrollable=False):
+        """
+        scrollable: alanlar kart içinde kayan bir listeye eklenir (strateji
+        sayısı sınırsız). Alan listesi widget.fields_layout olarak döner.
+        """
         outer_widget = QWidget()
         outer_widget.setObjectName("SectionCard")
-        outer_widget.setStyleSheet("""
-            background-color: rgba(30, 30, 30, 0.7);
-            border-radius: 10px;
-            padding: 0px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        """)
         outer_layout = QVBoxLayout(outer_widget)
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setSpacing(0)
@@ -161,81 +170,161 @@ class StrategyForm(QWidget):
 
         title_label = QLabel(title)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            font-size: 22px;
-            font-weight: bold;
-            color: white;
-            border-bottom: 2px solid #ffd700;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        """)
+        title_label.setObjectName("SectionTitle")
         section_layout.addWidget(title_label)
 
-        placeholder_examples = {
-            "race_time": "02:00:00",
-            "average_lap_time": "01:35.678",
-            "strategy_a": "22",
-            "strategy_b": "24",
-            "strategy_c": "20",
-            "strategy_d": "25",
-            "fuel_time": "33,4",
-            "tire_time": "24,0",
-            "pit_lane_time": "32,5",
-            "fuel_consumption": "2,33",
-            "virtual_fuel": "2,20",
-            "tire_consumption": "1,80"
-        }
+        fields_layout = section_layout
+        if scrollable:
+            fields_widget = QWidget()
+            fields_layout = QVBoxLayout(fields_widget)
+            fields_layout.setContentsMargins(0, 0, 0, 0)
+            fields_layout.setSpacing(10)
+            fields_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            scroll.setObjectName("SectionScroll")
+            scroll.setWidget(fields_widget)
+            section_layout.addWidget(scroll)
 
         for field_text, field_name in fields:
-            label = QLabel(field_text)
-            label.setFixedHeight(20)
-            label.setStyleSheet("color: white; font-size: 16px;")
-            input_field = QLineEdit()
-            input_field.setFixedHeight(35)
-            input_field.setPlaceholderText(placeholder_examples.get(field_name, ""))
-            if field_name not in ["strategy_a", "strategy_b", "strategy_c", "strategy_d"]:
-                input_field.setText(placeholder_examples.get(field_name, ""))
-            input_field.setStyleSheet("""
-                background-color: #2a2a2a;
-                color: white;
-                font-size: 16px;
-                padding: 8px;
-                border-radius: 6px;
-                border: 1px solid #444;
-            """)
-            self.inputs[field_name] = input_field
-            section_layout.addWidget(label)
-            section_layout.addWidget(input_field)
+            self.add_input_field(fields_layout, field_text, field_name)
 
         outer_layout.addLayout(section_layout)
 
         outer_widget.setFixedHeight(600)
+        outer_widget.section_layout = section_layout
+        outer_widget.fields_layout = fields_layout
 
         return outer_widget
 
+    def add_input_field(self, layout, field_text, field_name):
+        label = QLabel(field_text)
+        label.setFixedHeight(20)
+        label.setObjectName("StrategyFormLabel")
+        input_field = QLineEdit()
+        input_field.setFixedHeight(35)
+        input_field.setPlaceholderText(PLACEHOLDER_EXAMPLES.get(field_name, ""))
+        if not is_strategy_key(field_name):
+            input_field.setText(PLACEHOLDER_EXAMPLES.get(field_name, ""))
+        input_field.setObjectName("StrategyFormInput")
+        input_field.textEdited.connect(self.schedule_live_update)
+        self.inputs[field_name] = input_field
+        layout.addWidget(label)
+        layout.addWidget(input_field)
+        return input_field
+
+    def add_strategy_input(self):
+        """Sıradaki strateji alanını (strategy_e, strategy_f, ...) ekler."""
+        key = strategy_key_for_index(len(self.strategy_keys))
+        return self.add_input_field(self.strategy_fields_layout, f"{strategy_label(key)} (laps)", key)
+
+    def ensure_strategy_inputs(self, count: int):
+        while len(self.strategy_keys) < count:
+            self.add_strategy_input()
+
+    @property
+    def strategy_keys(self) -> list[str]:
+        """Formdaki strateji alanları, ekleniş sırasıyla."""
+        return [key for key in self.inputs if is_strategy_key(key)]
+
+    @property
+    def strategy_inputs(self) -> dict:
+        # 🔗 FCY hesaplamalarında kullanılacak doğrudan erişim
+        return {key: self.inputs[key] for key in self.strategy_keys}
+
+    def collect_data(self) -> dict:
+        data = {}
+        data["json_key"] = self.get_current_key()
+        data["race_time_seconds"] = parse_race_time(self.inputs["race_time"].text())
+        data["average_lap_time_seconds"] = parse_average_lap_time(self.inputs["average_lap_time"].text())
+        for strategy in self.strategy_keys:
+            data[strategy] = parse_integer(self.inputs[strategy].text())
+        for pit in ["fuel_time", "tire_time", "pit_lane_time"]:
+            data[pit] = parse_float_one_decimal(self.inputs[pit].text())
+        for consumption in ["fuel_consumption", "virtual_fuel", "tire_consumption"]:
+            data[consumption] = parse_float_two_decimal(self.inputs[consumption].text())
+        return data
+
+    def has_strategy_values(self) -> bool:
+        return any(self.inputs[s].text().strip() for s in self.strategy_keys)
+
     def send_data(self):
         try:
-            strategy_values = [self.inputs[s].text().strip() for s in ["strategy_a", "strategy_b", "strategy_c", "strategy_d"]]
-            if all(not val for val in strategy_values):
-                QMessageBox.warning(self, "Input Error", "Lütfen en az bir strateji değeri girin (A, B, C veya D).")
+            if not self.has_strategy_values():
+                QMessageBox.warning(self, "Input Error", "Lütfen en az bir strateji değeri girin.")
                 return
 
-            data = {}
-            data["json_key"] = os.path.splitext(os.path.basename(self.get_current_filename()))[0]
-            data["race_time_seconds"] = parse_race_time(self.inputs["race_time"].text())
-            data["average_lap_time_seconds"] = parse_average_lap_time(self.inputs["average_lap_time"].text())
-            for strategy in ["strategy_a", "strategy_b", "strategy_c", "strategy_d"]:
-                data[strategy] = parse_integer(self.inputs[strategy].text())
-            for pit in ["fuel_time", "tire_time", "pit_lane_time"]:
-                data[pit] = parse_float_one_decimal(self.inputs[pit].text())
-            for consumption in ["fuel_consumption", "virtual_fuel", "tire_consumption"]:
-                data[consumption] = parse_float_two_decimal(self.inputs[consumption].text())
-
-            self.data_ready.emit(data)
+            self.live_timer.stop()
+            self.data_ready.emit(self.collect_data())
             self.save_data_to_file()
         except Exception as e:
             print(f"Input Error: {e}")
 
+    def toggle_live_mode(self, enabled: bool):
+        self.live_mode_changed.emit(enabled)
+        if enabled:
+            self.send_live_data()
+        else:
+            self.live_timer.stop()
+
+    def schedule_live_update(self):
+        # Her tuş vuruşu pencereyi yeniden başlatır; hesap kullanıcı durunca yapılır
+        if self.live_toggle.isChecked():
+            self.live_timer.start()
+
+    def send_live_data(self):
+        """Yarım yazılmış girişler (boş strateji, sıfır süre) sessizce atlanır."""
+        if not self.has_strategy_values():
+            return
+        try:
+            data = self.collect_data()
+        except Exception as e:
+            print(f"Input Error: {e}")
+            return
+        if data["race_time_seconds"] <= 0 or data["average_lap_time_seconds"] <= 0:
+            return
+        self.data_edited.emit(data)
+
+    def run_sweep(self):
+        """
+        1..60 tur arası tüm stint uzunluklarını pit/yakıt/lastik varyasyonlarıyla
+        tarar, en iyi tur sayılarını formdaki strateji alanlarına sırayla yazar ve hesaplar.
+        """
+        data = {
+            "race_time_seconds": parse_race_time(self.inputs["race_time"].text()),
+            "average_lap_time_seconds": parse_average_lap_time(self.inputs["average_lap_time"].text()),
+        }
+        for pit in ["fuel_time", "tire_time", "pit_lane_time"]:
+            data[pit] = parse_float_one_decimal(self.inputs[pit].text())
+        for consumption in ["fuel_consumption", "virtual_fuel", "tire_consumption"]:
+            data[consumption] = parse_float_two_decimal(self.inputs[consumption].text())
+
+        if data["race_time_seconds"] <= 0 or data["average_lap_time_seconds"] <= 0:
+            QMessageBox.warning(self, "Input Error", "Sweep için Race Time ve Average Lap Time gerekli.")
+            return
+
+        result = sweep_from_data(data)
+        strategy_keys = self.strategy_keys
+        # Calculate form değerleriyle çalışır: adaylar nominal pit / yakıt / lastik varyantında
+        for candidate in result.nominal_best(len(strategy_keys)):
+            print(f"🔍 {candidate['laps_per_stint']} laps -> {candidate['total_stints']} stint, "
+                  f"{candidate['laps_completed']:.1f} laps, pit loss {candidate['total_pit_loss']:.1f}s, "
+                  f"fuel {candidate['fuel_per_stint']:.2f}L")
+
+        lap_counts = result.best_lap_counts(len(strategy_keys))
+        if not lap_counts:
+            QMessageBox.warning(self, "Sweep", "Uygun stint uzunluğu bulunamadı.")
+            return
+
+        for key in strategy_keys:
+            self.inputs[key].clear()
+        for key, laps in zip(strategy_keys, lap_counts):
+            self.inputs[key].setText(str(laps))
+
+        self.send_data()
+
     def set_current_context(self, category, brand, track):
         """Dropdown'dan gelen class, car, track bilgilerini alır ve dosyadan yükleme yapar."""
         self.current_class = category
@@ -243,55 +332,36 @@ class StrategyForm(QWidget):
         self.current_track = track
         self.load_data_from_file(category, brand, track)
 
-    def get_current_filename(self):
-        filename = f"{self.current_class}_{self.current_car}_{self.current_track}".lower().replace(" ", "")
-        return os.path.join("data", "strategy_inputs", f"{filename}.json")
+    def get_current_key(self):
+        return strategy_key(self.current_class, self.current_car, self.current_track)
 
     def load_data_from_file(self, category, brand, track):
         """Kayıtlı form verilerini JSON dosyasından yükler."""
         self.current_class = category
         self.current_car = brand
         self.current_track = track
-        filename = self.get_current_filename()
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                saved = json.load(f)
-            for key, field in self.inputs.items():
-                if key in saved:
-                    field.setText(saved[key])
-
-    def save_data_to_file(self):
-        """Kullanıcının form girdilerini JSON dosyasına kaydeder, diğer verileri silmez."""
-        os.makedirs(os.path.join("data", "strategy_inputs"), exist_ok=True)
-        filename = self.get_current_filename()
-
-        # 🔁 Önceki veriyi oku
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    print(">>> Uyarı: JSON hatalı, boş veri ile devam ediliyor")
-                    data = {}
-        else:
-            data = {}
-
-        # 🔁 Form alanlarını güncelle
+        saved = strategy_repository.get(category, brand, track).form
+        # Kayıtta daha fazla strateji varsa alanları önce oluştur
+        self.ensure_strategy_inputs(sum(1 for key in saved if is_strategy_key(key)))
         for key, field in self.inputs.items():
-            data[key] = field.text()
+            if key in saved:
+                field.setText(saved[key])
+            elif is_strategy_key(key):
+                # Önceki araç / pistten kalan fazla strateji alanları bu kayda taşınmaz
+                field.clear()
 
-        # 🔁 Diğer alanlara dokunulmadan kaydet
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def save_data_to_file(self):
+        """Kullanıcının form girdilerini kaydeder (gecikmeli, arka planda), diğer verileri silmez."""
+        strategy_repository.update(
+            self.get_current_key(),
+            {key: field.text() for key, field in self.inputs.items()}
+        )
 
     def get_strategy_data(self):
         return {
             "race_time": self.race_time(),
             "average_lap_time": self.lap_time(),
-            "strategy_a": self.strategy_inputs["strategy_a"].text(),
-            "strategy_b": self.strategy_inputs["strategy_b"].text(),
-            "strategy_c": self.strategy_inputs["strategy_c"].text(),
-            "strategy_d": self.strategy_inputs["strategy_d"].text(),
+            **{key: field.text() for key, field in self.strategy_inputs.items()},
             "fuel_time": self.fuel_time(),
             "tire_time": self.tire_time(),
             "pit_lane_time": self.pit_time(),
@@ -0,0 +1,103 @@
+# pages/strategy_store.py
+"""
+Sayfalar arası ortak strateji durumu.
+
+Prerace tablosu, canlı monitör ve pilot sayfası aynı StintPlan'ı bu store
+üzerinden okur; değerler saniye / litre / yüzde olarak sayısal tutulur,
+QLabel metinlerinden geri okunmaz. Değişiklikler sinyal ile yayınlanır.
+"""
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+def plan_structure(plan) -> tuple:
+    """Satır sayısı, stratejiler ve sütun uzunlukları; değişirse view'lar reset ister."""
+    return plan.row_count, tuple(plan.strategies), tuple(len(plan.column(s)) for s in plan.strategies)
+
+
+def same_structure(old, new) -> bool:
+    """İki plan aynı satır/sütun yapısında mı (view'lar reset gerektirmez)."""
+    return plan_structure(old) == plan_structure(new)
+
+
+class StrategyStore(QObject):
+    # Yeni plan hesaplandı (satır / sütun yapısı değişmiş olabilir)
+    plan_changed = pyqtSignal(object)
+    # Mevcut planda first..last satırlarının kayıtları değişti
+    rows_changed = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.plan = None
+
+    def set_plan(self, plan):
+        self.plan = plan
+        self.plan_changed.emit(plan)
+
+    def apply_plan(self, plan):
+        """
+        Yeniden hesaplanan planı uygular. Stratejiler, satır ve stint sayıları
+        aynıysa model sıfırlanmaz; sadece kaydı değişen satırlar yayınlanır.
+        """
+        old = self.plan
+        if old is None or not same_structure(old, plan):
+            self.set_plan(plan)
+            return
+
+        changed = [
+            row for row in range(plan.row_count)
+            if any(old.record(row, s) != plan.record(row, s) for s in plan.strategies)
+        ]
+        self.plan = plan
+        if changed:
+            self.rows_changed.emit(min(changed), max(changed))
+
+    def recompute_from(self, row: int, strategies: list[str] = None) -> set[int]:
+        """Plan row'dan itibaren yeniden hesaplanır; değişen satırlar yayınlanır."""
+        if self.plan is None:
+            return set()
+
+        before = plan_structure(self.plan)
+        changed = self.plan.recompute_from(row, strategies)
+        self._emit_rows(before, changed)
+        return changed
+
+    def update_lap_counts(self, data: dict, strategies: list[str]) -> set[int]:
+        """Sadece tur sayısı değişen strateji sütunları yeniden hesaplanır (canlı güncelleme)."""
+        if self.plan is None:
+            return set()
+
+        before = plan_structure(self.plan)
+        changed = self.plan.update_lap_counts(data, strategies)
+        self._emit_rows(before, changed)
+        return changed
+
+    def _emit_rows(self, before: tuple, changed: set[int]):
+        # Stint sayısı değiştiyse satırlar eklenip silinir: view'lar planı baştan okur
+        if plan_structure(self.plan) != before:
+            self.plan_changed.emit(self.plan)
+        elif changed:
+            self.rows_changed.emit(min(changed), max(changed))
+
+    @property
+    def strategies(self) -> list[str]:
+        return self.plan.strategies if self.plan is not None else []
+
+    def has_strategy(self, strategy: str) -> bool:
+        return strategy in self.strategies
+
+    def column(self, strategy: str):
+        return self.plan.column(strategy) if self.plan is not None else []
+
+    def record(self, row: int, strategy: str):
+        return self.plan.record(row, strategy) if self.plan is not None else None
+
+    def timeline(self, strategy: str):
+        return self.plan.timeline(strategy) if self.plan is not None else None
+
+    def active_row(self, strategy: str, time_left: float):
+        """Kalan süresi time_left'e ulaşmış ilk stint (plan hesaplanırken kurulan indeks üzerinde bisect)."""
+        timeline = self.timeline(strategy)
+        if timeline is None:
+            return None
+        index = timeline.active_index(time_left)
+        return timeline.rows[index] if index is not None else None
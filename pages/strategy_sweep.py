@@ -0,0 +1,157 @@
+# pages/strategy_sweep.py
+"""
+Stint uzunluğu taraması (sweep).
+
+Her tur/stint değeri ile pit lane, yakıt ve lastik süresi varyasyonlarının
+tamamını tek bir NumPy geçişinde değerlendirir. Hesap, StintPlan'daki
+varsayılan (özel pit ayarı olmayan) stint kurallarının kapalı formudur.
+"""
+import numpy as np
+
+MAX_VIRTUAL_ENERGY = 100.0
+
+
+class SweepResult:
+    """
+    Tüm diziler (laps, pit_lane, fuel_time, tire_time) boyutundadır.
+    nominal: form değerlerinin (pit_lane, fuel_time, tire_time) indeksleri.
+    """
+
+    def __init__(self, laps, pit_lane_times, fuel_times, tire_times,
+                 total_stints, total_pit_loss, laps_completed, fuel_per_stint, feasible,
+                 nominal=(0, 0, 0)):
+        self.laps = laps
+        self.pit_lane_times = pit_lane_times
+        self.fuel_times = fuel_times
+        self.tire_times = tire_times
+        self.total_stints = total_stints
+        self.total_pit_loss = total_pit_loss
+        self.laps_completed = laps_completed
+        self.fuel_per_stint = fuel_per_stint
+        self.feasible = feasible
+        self.nominal = tuple(nominal)
+
+    def ranking(self) -> np.ndarray:
+        """
+        Uygun adayların düz indeksleri; önce tamamlanan tur (çok olan),
+        sonra toplam pit kaybı (az olan).
+        """
+        flat = np.flatnonzero(self.feasible)
+        order = np.lexsort((self.total_pit_loss.ravel()[flat], -self.laps_completed.ravel()[flat]))
+        return flat[order]
+
+    def candidate(self, flat_index: int) -> dict:
+        l, p, f, t = np.unravel_index(flat_index, self.total_stints.shape)
+        return {
+            "laps_per_stint": int(self.laps[l]),
+            "pit_lane_time": float(self.pit_lane_times[p]),
+            "fuel_time": float(self.fuel_times[f]),
+            "tire_time": float(self.tire_times[t]),
+            "total_stints": int(self.total_stints[l, p, f, t]),
+            "total_pit_loss": float(self.total_pit_loss[l, p, f, t]),
+            "laps_completed": float(self.laps_completed[l, p, f, t]),
+            "fuel_per_stint": float(self.fuel_per_stint[l, p, f, t]),
+        }
+
+    def best(self, count: int = 4) -> list[dict]:
+        return [self.candidate(i) for i in self.ranking()[:count]]
+
+    def nominal_ranking(self) -> np.ndarray:
+        """
+        Nominal pit / yakıt / lastik varyantında uygun tur indeksleri, ranking()
+        ile aynı sırayla. Calculate form değerleriyle çalıştığı için tur
+        sayıları bu dilimde karşılaştırılır; ucuz varyantlar sıralamayı kaydırmaz.
+        """
+        p, f, t = self.nominal
+        flat = np.flatnonzero(self.feasible[:, p, f, t])
+        order = np.lexsort((self.total_pit_loss[flat, p, f, t], -self.laps_completed[flat, p, f, t]))
+        return flat[order]
+
+    def nominal_best(self, count: int = 4) -> list[dict]:
+        shape = self.total_stints.shape
+        return [self.candidate(np.ravel_multi_index((l, *self.nominal), shape))
+                for l in self.nominal_ranking()[:count]]
+
+    def best_lap_counts(self, count: int = 4) -> list[int]:
+        """Nominal varyantta en iyi count tur sayısı (formdaki strateji alanları için)."""
+        return [int(self.laps[l]) for l in self.nominal_ranking()[:count]]
+
+
+def sweep_strategies(race_time: float, average_lap_time: float, fuel_consumption: float,
+                     virtual_fuel: float, pit_lane_times, fuel_times, tire_times,
+                     lap_range=range(1, 61), nominal=None) -> SweepResult:
+    """
+    Her stint turu için: toplam stint, toplam pit kaybı, tamamlanan tur ve
+    stint başı yakıt. Sanal enerji %100'ü aşan stint'ler uygun sayılmaz.
+    nominal verilmezse her varyasyon ekseninin ortası nominal sayılır.
+    """
+    laps = np.asarray(list(lap_range), dtype=np.int64)
+    pit_lane = np.atleast_1d(np.asarray(pit_lane_times, dtype=np.float64))
+    fuel = np.atleast_1d(np.asarray(fuel_times, dtype=np.float64))
+    tire = np.atleast_1d(np.asarray(tire_times, dtype=np.float64))
+
+    # (laps, pit_lane, fuel, tire) ızgarası
+    planned = (laps * average_lap_time).astype(np.float64)[:, None, None, None]
+    lane = pit_lane[None, :, None, None]
+    pit_full = lane + fuel[None, None, :, None] + tire[None, None, None, :]
+    cycle = planned + pit_full
+
+    shape = np.broadcast_shapes(planned.shape, pit_full.shape)
+    planned = np.broadcast_to(planned, shape)
+    lane = np.broadcast_to(lane, shape)
+    pit_full = np.broadcast_to(pit_full, shape)
+    cycle = np.broadcast_to(cycle, shape)
+
+    valid = (cycle > 0) & (race_time > 0)
+    safe_cycle = np.where(valid, cycle, 1.0)
+
+    # Son stint: başlangıcı + tam tur döngüsü yarış süresine ulaşan ilk stint
+    last_index = np.maximum(0, np.ceil(race_time / safe_cycle) - 1)
+    last_start = last_index * cycle
+
+    # Son stint'te pit yalnızca stint + pit lane yarış süresini aşmıyorsa yapılır.
+    # Pit'siz bitişte araç bayrağa kadar pit'siz stint'lerle devam eder.
+    no_pit = last_start + planned + lane >= race_time
+    last_pit = np.where(no_pit, 0.0, pit_full)
+    last_driven = np.maximum(0.0, race_time - last_start - last_pit)
+    safe_planned = np.where(planned > 0, planned, 1.0)
+    tail_stints = np.where(no_pit & (planned > 0), np.ceil(last_driven / safe_planned), 1)
+    tail_stints = np.maximum(tail_stints, 1)
+
+    total_stints = np.where(valid, last_index + tail_stints, 0).astype(np.int64)
+    total_pit_loss = np.where(valid, last_index * pit_full + last_pit, 0.0)
+    if average_lap_time > 0:
+        laps_completed = np.where(valid, (last_index * planned + last_driven) / average_lap_time, 0.0)
+    else:
+        laps_completed = np.zeros(shape)
+
+    lap_grid = np.broadcast_to(laps[:, None, None, None], shape)
+    fuel_per_stint = lap_grid * fuel_consumption
+    feasible = valid & (total_stints > 0)
+    if virtual_fuel > 0:
+        feasible &= lap_grid * virtual_fuel <= MAX_VIRTUAL_ENERGY
+
+    if nominal is None:
+        nominal = (len(pit_lane) // 2, len(fuel) // 2, len(tire) // 2)
+    return SweepResult(laps, pit_lane, fuel, tire, total_stints, total_pit_loss,
+                       laps_completed, fuel_per_stint, feasible, nominal)
+
+
+def sweep_from_data(data: dict, lap_range=range(1, 61), spread=(0.9, 1.0, 1.1)) -> SweepResult:
+    """
+    send_data sözlüğünden tarama; pit lane / yakıt / lastik süreleri form
+    değerinin spread katları ile varyasyonlanır; 1.0'a en yakın kat nominaldir.
+    """
+    spread = np.asarray(spread, dtype=np.float64)
+    nominal = int(np.argmin(np.abs(spread - 1.0)))
+    return sweep_strategies(
+        data.get("race_time_seconds", 0),
+        data.get("average_lap_time_seconds", 0),
+        data.get("fuel_consumption", 0),
+        data.get("virtual_fuel", 0),
+        data.get("pit_lane_time", 0) * spread,
+        data.get("fuel_time", 0) * spread,
+        data.get("tire_time", 0) * spread,
+        lap_range,
+        (nominal, nominal, nominal),
+    )
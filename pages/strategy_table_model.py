@@ -0,0 +1,562 @@
+# pages/strategy_table_model.py
+"""
+Strateji tablosu için model/view katmanı.
+
+StrategyTableModel hücreleri StintPlan kayıtlarından sunar, StintCardDelegate
+kartları (stint, pit, total, remaining, fuel, virtual) doğrudan QPainter ile
+çizer. Hücre başına widget yoktur; tur ve pit girişleri için editör sadece
+düzenleme anında açılır.
+"""
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QLineEdit, QWidget, QHBoxLayout
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QRectF, QSize, QEvent
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPixmap, QImage, QPixmapCache
+
+from pages.stint_plan import calculate_pit_seconds, strategy_label
+from pages.strategy_utils import format_time
+from utils.resource_path import resource_path
+
+RecordRole = Qt.ItemDataRole.UserRole + 1
+OptionRole = Qt.ItemDataRole.UserRole + 2
+ActiveRole = Qt.ItemDataRole.UserRole + 3
+
+FIXED_COLUMNS = 2
+STRATEGY_COLUMN_MIN_WIDTH = 300
+
+# Kart ölçüleri (eski QLabel padding/margin değerleri ile aynı görünüm)
+CARD_MARGIN = 10
+BLOCK_HEIGHT = 32
+BLOCK_SPACING = 5
+DIVIDER_SPACING = 8
+LAP_FIELD_HEIGHT = 30
+CARD_HEIGHT = CARD_MARGIN * 2 + 4 * (BLOCK_HEIGHT + BLOCK_SPACING + DIVIDER_SPACING) + BLOCK_HEIGHT + BLOCK_SPACING
+
+CARD_BLOCKS = [
+    ("Stint Time", "#1E90FF", "clock.png"),
+    ("Pit Time", "#FFD700", "pitstop_sign.png"),
+    ("Total Time", "#708090", "hourglass.png"),
+    ("Remaining", "#FF6347", "time_remaining.png"),
+    ("Fuel", "#32CD32", "fuel_can.png"),
+    ("Virtual", "#9370DB", "lightning.png"),
+]
+
+BLOCK_ICON_SIZE = 14
+ICON_FILES = [icon_file for _, _, icon_file in CARD_BLOCKS]
+
+# Kaynak PNG'ler diskten bir kez okunur
+_icon_sources = {}
+
+
+def icon_source(icon_file: str) -> QImage:
+    if icon_file not in _icon_sources:
+        _icon_sources[icon_file] = QImage(resource_path(f"assets/icons/{icon_file}"))
+    return _icon_sources[icon_file]
+
+
+def icon_atlas(size: int, ratio: float) -> QPixmap:
+    """
+    Tüm kart ikonları hedef boyut ve DPI'da önceden ölçeklenip tek pixmap'e
+    yan yana dizilir (QPixmapCache'te tutulur). Çizimde sadece kopyalanır.
+    """
+    key = f"crm_card_icons_{size}_{ratio:.2f}"
+    atlas = QPixmapCache.find(key)
+    if atlas is None:
+        pixels = round(size * ratio)
+        atlas = QPixmap(pixels * len(ICON_FILES), pixels)
+        atlas.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(atlas)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        for index, icon_file in enumerate(ICON_FILES):
+            source = icon_source(icon_file)
+            if not source.isNull():
+                painter.drawImage(QRect(index * pixels, 0, pixels, pixels), source)
+        painter.end()
+        atlas.setDevicePixelRatio(ratio)
+        QPixmapCache.insert(key, atlas)
+    return atlas
+
+
+def draw_block_icon(painter: QPainter, target: QRect, icon_file: str):
+    """Atlas'taki ikonu ölçeklemeden çizer."""
+    ratio = painter.device().devicePixelRatioF()
+    size = target.width()
+    atlas = icon_atlas(size, ratio)
+    pixels = round(size * ratio)
+    index = ICON_FILES.index(icon_file)
+    painter.drawPixmap(QRectF(target), atlas, QRectF(index * pixels, 0, pixels, pixels))
+
+
+def row_shade(row: int) -> QColor:
+    return QColor(0, 0, 0, 230) if row % 2 == 0 else QColor(0, 0, 0, 102)
+
+
+def block_color(hex_color: str, alpha: float = 0.8) -> QColor:
+    color = QColor(hex_color)
+    color.setAlphaF(alpha)
+    return color
+
+
+def card_font(pixel_size: int = 13, weight=QFont.Weight.DemiBold) -> QFont:
+    font = QFont("Poppins")
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+def card_values(record) -> dict:
+    return {
+        "Stint Time": format_time(record.stint_seconds),
+        "Pit Time": format_time(record.pit_seconds),
+        "Total Time": format_time(record.total_seconds),
+        "Remaining": format_time(record.remaining_seconds),
+        "Fuel": f"{record.fuel:.2f}L",
+        "Virtual": f"{record.virtual:.2f}%",
+    }
+
+
+def card_block_rects(rect: QRect) -> dict:
+    """Kart içindeki blokların konumları; paint ve editör konumlandırma ortak kullanır."""
+    inner = rect.adjusted(CARD_MARGIN, CARD_MARGIN, -CARD_MARGIN, -CARD_MARGIN)
+    rects = {}
+    y = inner.top()
+    for name, _, _ in CARD_BLOCKS[:4]:
+        rects[name] = QRect(inner.left(), y, inner.width(), BLOCK_HEIGHT)
+        y += BLOCK_HEIGHT + BLOCK_SPACING
+        rects[f"{name} divider"] = QRect(inner.left(), y + 3, inner.width(), 2)
+        y += DIVIDER_SPACING
+
+    half = (inner.width() - BLOCK_SPACING) // 2
+    rects["Fuel"] = QRect(inner.left(), y, half, BLOCK_HEIGHT)
+    rects["Virtual"] = QRect(inner.left() + half + BLOCK_SPACING, y, inner.width() - half - BLOCK_SPACING, BLOCK_HEIGHT)
+    y += BLOCK_HEIGHT + BLOCK_SPACING
+    rects["laps"] = QRect(inner.center().x() - 25, y, 50, LAP_FIELD_HEIGHT - 6)
+    return rects
+
+
+def paint_block(painter: QPainter, rect: QRect, label: str, value: str, color: str, icon_file: str):
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(block_color(color))
+    painter.drawRoundedRect(QRectF(rect), 6, 6)
+
+    text = f"{label}: {value}"
+    metrics = painter.fontMetrics()
+    icon_size = BLOCK_ICON_SIZE
+    available = rect.width() - icon_size - 12
+    if metrics.horizontalAdvance(text) > available:
+        text = metrics.elidedText(text, Qt.TextElideMode.ElideRight, available)
+    text_width = metrics.horizontalAdvance(text)
+    content_width = icon_size + 4 + text_width
+    x = rect.left() + max(0, (rect.width() - content_width) // 2)
+    draw_block_icon(painter, QRect(x, rect.center().y() - icon_size // 2, icon_size, icon_size), icon_file)
+    painter.setPen(QColor("white"))
+    painter.drawText(QRect(x + icon_size + 4, rect.top(), rect.right() - x - icon_size - 4, rect.height()),
+                     Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+
+
+def paint_stint_card(painter: QPainter, rect: QRect, record, selected=False, active=False,
+                     laps_text=None):
+    """Tek strateji kartını çizer; laps_text None değilse altta tur alanı gösterilir."""
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    background = QColor(255, 215, 0, 51) if selected else row_shade(record.row)
+    painter.setPen(QPen(QColor("lime"), 2) if active else Qt.PenStyle.NoPen)
+    painter.setBrush(background)
+    painter.drawRoundedRect(QRectF(rect.adjusted(1, 1, -1, -6)), 10, 10)
+
+    painter.setFont(card_font())
+    rects = card_block_rects(rect)
+    values = card_values(record)
+    for name, color, icon_file in CARD_BLOCKS:
+        value = values[name]
+        if active and name == "Stint Time":
+            value = f"{value}  🟢 ACTIVE"
+        paint_block(painter, rects[name], name, value, color, icon_file)
+
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(255, 140, 0, 204))
+    for name, _, _ in CARD_BLOCKS[:4]:
+        painter.drawRect(rects[f"{name} divider"])
+
+    if laps_text is not None:
+        lap_rect = rects["laps"]
+        painter.setBrush(QColor("#222"))
+        painter.setPen(QPen(QColor("#555"), 1))
+        painter.drawRoundedRect(QRectF(lap_rect), 4, 4)
+        painter.setFont(card_font(12, QFont.Weight.Normal))
+        painter.setPen(QColor("white") if laps_text else QColor("#888"))
+        painter.drawText(lap_rect, Qt.AlignmentFlag.AlignCenter, laps_text or "laps")
+
+    painter.restore()
+
+
+def paint_stint_box(painter: QPainter, rect: QRect, text: str, row: int, selected=False):
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(255, 215, 0, 51) if selected else row_shade(row))
+    painter.drawRoundedRect(QRectF(rect.adjusted(5, 5, -5, -5)), 8, 8)
+    painter.setFont(card_font(24, QFont.Weight.Bold))
+    painter.setPen(QColor("white"))
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+    painter.restore()
+
+
+def option_card_rects(rect: QRect) -> dict:
+    """Strategy Option hücresinin tıklanabilir bölgeleri."""
+    frame = rect.adjusted(5, 5, -5, -5)
+    inner = frame.adjusted(12, 12, -12, -12)
+    rects = {"frame": frame}
+
+    pit_card = QRect(inner.left(), inner.top(), inner.width(), 70)
+    total_card = QRect(inner.left(), pit_card.bottom() + 6, inner.width(), 70)
+    extra_card = QRect(inner.left(), total_card.bottom() + 6, inner.width(), 60)
+    rects.update({"pit_card": pit_card, "total_card": total_card, "extra_card": extra_card})
+
+    row_y = pit_card.top() + 34
+    x = pit_card.left() + 10
+    rects["tire_cb"] = QRect(x, row_y, 90, 24)
+    rects["tire_input"] = QRect(x + 94, row_y, 50, 24)
+    rects["fuel_cb"] = QRect(x + 150, row_y, 90, 24)
+    rects["fuel_input"] = QRect(x + 244, row_y, 50, 24)
+    rects["inputs"] = QRect(x, row_y - 2, pit_card.width() - 20, 28)
+
+    rects["total_value"] = QRect(total_card.left() + 10, total_card.top() + 30, total_card.width() - 20, 34)
+
+    for i in range(4):
+        rects[f"radio_{i}"] = QRect(extra_card.left() + 10 + i * 55, extra_card.top() + 30, 50, 22)
+    return rects
+
+
+def paint_indicator(painter: QPainter, rect: QRect, checked: bool, round_shape=False):
+    painter.setPen(QPen(QColor("#FFD700") if (checked and round_shape) else QColor("white"), 2))
+    painter.setBrush(QColor("#FFD700") if checked else Qt.BrushStyle.NoBrush)
+    if round_shape:
+        painter.drawEllipse(QRectF(rect))
+    else:
+        painter.drawRoundedRect(QRectF(rect), 4, 4)
+
+
+def paint_option_card(painter: QPainter, rect: QRect, option: dict, detailed: bool, selected=False):
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    rects = option_card_rects(rect)
+
+    painter.setPen(QPen(QColor("#FFD700"), 2))
+    painter.setBrush(QColor(255, 215, 0, 51) if selected else QColor(15, 15, 15, 217))
+    painter.drawRoundedRect(QRectF(rects["frame"]), 18, 18)
+
+    sub_cards = [
+        ("pit_card", "Pit Components", QColor(80, 80, 80, 102)),
+        ("total_card", "Total Pit Time", QColor(60, 60, 60, 102)),
+        ("extra_card", "Extra Fuel Lap", QColor(40, 40, 40, 77)),
+    ]
+    for key, title, color in sub_cards:
+        card = rects[key]
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(card), 10, 10)
+        painter.setFont(card_font(12, QFont.Weight.Bold))
+        painter.setPen(QColor("white"))
+        painter.drawText(card.adjusted(16, 8, -8, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, title)
+
+    painter.setFont(card_font(13, QFont.Weight.Bold))
+    for key, text, value_key, input_key in [("tire_cb", "TireTime", "tire", "tire_input"),
+                                            ("fuel_cb", "FuelTime", "fuel", "fuel_input")]:
+        cb_rect = rects[key]
+        paint_indicator(painter, QRect(cb_rect.left(), cb_rect.center().y() - 8, 16, 16), option[f"{value_key}_checked"])
+        painter.setPen(QColor("white"))
+        painter.drawText(cb_rect.adjusted(22, 0, 0, 0), Qt.AlignmentFlag.AlignVCenter, text)
+        if detailed:
+            input_rect = rects[input_key]
+            painter.setPen(QPen(QColor(255, 255, 255, 51), 1))
+            painter.setBrush(QColor(0, 0, 0, 230))
+            painter.drawRoundedRect(QRectF(input_rect), 6, 6)
+            painter.setPen(QColor("#FFD700"))
+            painter.drawText(input_rect, Qt.AlignmentFlag.AlignCenter, str(option[value_key]))
+
+    value_rect = rects["total_value"]
+    painter.setPen(QPen(QColor("#FFD700"), 2))
+    painter.setBrush(QColor("#000000"))
+    painter.drawRoundedRect(QRectF(value_rect), 12, 12)
+    painter.setFont(card_font(16, QFont.Weight.ExtraBold))
+    painter.setPen(QColor("#FFD700"))
+    painter.drawText(value_rect, Qt.AlignmentFlag.AlignCenter, f"Total Pit Time: {option['total']:.1f}s")
+
+    painter.setFont(card_font(12, QFont.Weight.Normal))
+    for i in range(4):
+        radio_rect = rects[f"radio_{i}"]
+        paint_indicator(painter, QRect(radio_rect.left(), radio_rect.center().y() - 7, 14, 14),
+                        option["fuel_extra_laps"] == i, round_shape=True)
+        painter.setPen(QColor("white"))
+        painter.drawText(radio_rect.adjusted(20, 0, 0, 0), Qt.AlignmentFlag.AlignVCenter, f"+{i}")
+
+    painter.restore()
+
+
+class StrategyTableModel(QAbstractTableModel):
+    """
+    Satırlar stint, sütunlar: Stint No, Strategy Option ve her strateji.
+    Plan StrategyStore'dan gelir; pit ayarları plan.custom_pit_times, tur girişleri plan.custom_laps içinde tutulur.
+    """
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.plan = None
+        self.detailed_mode = False
+        # Canlı modda tur girişi o stratejiyi satırdan itibaren hemen yeniden hesaplar
+        self.live_recalculate = False
+        self.active_rows = {}
+        store.plan_changed.connect(self.set_plan)
+        store.rows_changed.connect(self.on_rows_changed)
+
+    def set_plan(self, plan):
+        self.beginResetModel()
+        self.plan = plan
+        self.active_rows = {}
+        self.endResetModel()
+
+    def on_rows_changed(self, first: int, last: int):
+        # Aynı yapıdaki yeni plan reset olmadan gelir (StrategyStore.apply_plan)
+        self.plan = self.store.plan
+        last = min(last, self.rowCount() - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+
+    def set_detailed_mode(self, detailed: bool):
+        self.detailed_mode = detailed
+        if self.rowCount() and self.columnCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.plan is None:
+            return 0
+        return self.plan.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.plan is None:
+            return 0
+        return FIXED_COLUMNS + len(self.plan.strategies)
+
+    def strategy_for_column(self, col: int):
+        if self.plan is None or col < FIXED_COLUMNS:
+            return None
+        index = col - FIXED_COLUMNS
+        return self.plan.strategies[index] if index < len(self.plan.strategies) else None
+
+    def column_for_strategy(self, strategy: str):
+        index = self.plan.strategy_index(strategy) if self.plan is not None else None
+        return None if index is None else FIXED_COLUMNS + index
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal:
+            return None
+        if section == 0:
+            return "Stint No"
+        if section == 1:
+            return "Strategy Option"
+        strategy = self.strategy_for_column(section)
+        return strategy_label(strategy).upper() if strategy else None
+
+    def pit_option(self, row: int) -> dict:
+        inputs = self.plan.inputs
+        custom = self.plan.custom_pit_times.get(row, {})
+        return {
+            "tire": custom.get("tire", inputs.tire_time),
+            "fuel": custom.get("fuel", inputs.fuel_time),
+            "tire_checked": custom.get("tire_checked", True),
+            "fuel_checked": custom.get("fuel_checked", True),
+            "fuel_extra_laps": custom.get("fuel_extra_laps", 0),
+            "total": calculate_pit_seconds(custom, inputs),
+        }
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.plan is None:
+            return None
+
+        row, col = index.row(), index.column()
+        empty = self.plan.is_empty_row(row)
+
+        if col == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return "-" if empty else str(row + 1)
+            return None
+
+        if col == 1:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return "-" if empty else ""
+            if role == OptionRole and not empty:
+                return self.pit_option(row)
+            return None
+
+        strategy = self.strategy_for_column(col)
+        record = self.plan.record(row, strategy)
+        if role == RecordRole:
+            return record
+        if role == ActiveRole:
+            return record is not None and self.active_rows.get(strategy) == row
+        if role == Qt.ItemDataRole.DisplayRole:
+            return "-" if record is None else ""
+        if role == Qt.ItemDataRole.EditRole:
+            value = self.plan.custom_laps.get((row, strategy), "")
+            return str(value) if value else ""
+        return None
+
+    def flags(self, index):
+        base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if not index.isValid() or self.plan is None or not self.detailed_mode:
+            return base
+        if index.column() == 1 and not self.plan.is_empty_row(index.row()):
+            return base | Qt.ItemFlag.ItemIsEditable
+        if index.column() >= FIXED_COLUMNS and self.data(index, RecordRole) is not None:
+            return base | Qt.ItemFlag.ItemIsEditable
+        return base
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or self.plan is None or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        row, col = index.row(), index.column()
+        if col == 1:
+            self.set_pit_option(row, **value)
+            return True
+
+        strategy = self.strategy_for_column(col)
+        if strategy is not None:
+            key = (row, strategy)
+            try:
+                laps = int(value)
+            except (TypeError, ValueError):
+                laps = 0
+            if laps > 0:
+                self.plan.custom_laps[key] = laps
+            else:
+                self.plan.custom_laps.pop(key, None)
+            self.dataChanged.emit(index, index)
+            # Canlı mod kapalıysa tur girişi Calculate ile uygulanır
+            if self.live_recalculate:
+                self.store.recompute_from(row, [strategy])
+            return True
+        return False
+
+    def set_pit_option(self, row: int, **changes):
+        self.plan.custom_pit_times.setdefault(row, {}).update(changes)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 1))
+        # Sadece row ve sonrası hesaplanır; değişen satırlar store sinyaliyle yeniden çizilir
+        self.store.recompute_from(row)
+
+    def set_active_row(self, strategy: str, row):
+        previous = self.active_rows.get(strategy)
+        if previous == row:
+            return
+        self.active_rows[strategy] = row
+        col = self.column_for_strategy(strategy)
+        if col is None:
+            return
+        for r in (previous, row):
+            if r is not None and 0 <= r < self.rowCount():
+                self.dataChanged.emit(self.index(r, col), self.index(r, col))
+
+    def active_row(self, strategy: str):
+        return self.active_rows.get(strategy)
+
+
+class PitOptionEditor(QWidget):
+    """Tire / Fuel süreleri için sadece düzenleme anında oluşturulan editör."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+        self.tire_input = QLineEdit()
+        self.fuel_input = QLineEdit()
+        for field in (self.tire_input, self.fuel_input):
+            field.setFixedWidth(60)
+            layout.addWidget(field)
+        self.tire_input.setPlaceholderText("tire")
+        self.fuel_input.setPlaceholderText("fuel")
+
+
+class StintCardDelegate(QStyledItemDelegate):
+    """Strateji tablosunun tüm hücrelerini çizer ve tıklamaları işler."""
+
+    def paint(self, painter, option, index):
+        model = index.model()
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        row, col = index.row(), index.column()
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+
+        if col == 0 or text == "-":
+            paint_stint_box(painter, option.rect, text or "", row, selected)
+        elif col == 1:
+            paint_option_card(painter, option.rect, index.data(OptionRole), model.detailed_mode, selected)
+        else:
+            laps_text = index.data(Qt.ItemDataRole.EditRole) if model.detailed_mode else None
+            paint_stint_card(painter, option.rect, index.data(RecordRole), selected,
+                             bool(index.data(ActiveRole)), laps_text)
+
+    def sizeHint(self, option, index):
+        height = self.row_height(index.model().detailed_mode)
+        if index.column() == 0:
+            return QSize(90, height)
+        if index.column() == 1:
+            return QSize(340, height)
+        return QSize(300, height)
+
+    @staticmethod
+    def row_height(detailed: bool) -> int:
+        return CARD_HEIGHT + (LAP_FIELD_HEIGHT if detailed else 0)
+
+    def editorEvent(self, event, model, option, index):
+        # ✅ Checkbox ve radio'lar çizili; tıklama bölgesine göre model güncellenir
+        if index.column() != 1 or event.type() != QEvent.Type.MouseButtonRelease:
+            return super().editorEvent(event, model, option, index)
+
+        pit_option = index.data(OptionRole)
+        if pit_option is None:
+            return False
+
+        rects = option_card_rects(option.rect)
+        pos = event.position().toPoint()
+        if rects["tire_cb"].contains(pos):
+            model.set_pit_option(index.row(), tire_checked=not pit_option["tire_checked"])
+            return True
+        if rects["fuel_cb"].contains(pos):
+            model.set_pit_option(index.row(), fuel_checked=not pit_option["fuel_checked"])
+            return True
+        for i in range(4):
+            if rects[f"radio_{i}"].contains(pos):
+                if pit_option["fuel_extra_laps"] != i:
+                    model.set_pit_option(index.row(), fuel_extra_laps=i)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        if index.column() == 1:
+            return PitOptionEditor(parent)
+        editor = QLineEdit(parent)
+        editor.setPlaceholderText("laps")
+        return editor
+
+    def setEditorData(self, editor, index):
+        if isinstance(editor, PitOptionEditor):
+            pit_option = index.data(OptionRole) or {}
+            editor.tire_input.setText(str(pit_option.get("tire", "")))
+            editor.fuel_input.setText(str(pit_option.get("fuel", "")))
+        else:
+            editor.setText(index.data(Qt.ItemDataRole.EditRole) or "")
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, PitOptionEditor):
+            model.setData(index, {"tire": editor.tire_input.text(), "fuel": editor.fuel_input.text()})
+        else:
+            model.setData(index, editor.text())
+
+    def updateEditorGeometry(self, editor, option, index):
+        if index.column() == 1:
+            rects = option_card_rects(option.rect)
+            editor.setGeometry(QRect(rects["tire_input"].left(), rects["inputs"].top(),
+                                     rects["fuel_input"].right() - rects["tire_input"].left(), rects["inputs"].height()))
+        else:
+            editor.setGeometry(card_block_rects(option.rect)["laps"])
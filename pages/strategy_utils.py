@@ -1,6 +1,4 @@
 # pages/strategy_utils.py
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt
 
 def calculate_total_time(stint_time_seconds, pit_time_seconds):
     """
@@ -119,28 +117,6 @@ def calculate_time_left(race_time_seconds: float, elapsed_time_seconds: float) -
     """
     return max(race_time_seconds - elapsed_time_seconds, 0)
 
-# 🎯 FCY anında kalan süreye göre strateji önerileri
-def generate_adaptive_strategies(remaining_secs: int) -> list[str]:
-    """
-    Kalan süreye göre önerilen strateji listesi üretir.
-    Her öneri farklı stint dağılımları verir (örneğin 2x60dk, 3x40dk).
-    """
-    suggestions = []
-
-    # Her stint ortalama süresi (örnek: 40dk, 45dk, 50dk)
-    stint_durations = [50 * 60, 45 * 60, 40 * 60]  # saniye cinsinden
-
-    for duration in stint_durations:
-        stint_count = remaining_secs // duration
-        leftover = remaining_secs % duration
-
-        if stint_count >= 1:
-            suggestions.append(
-                f"{stint_count} x {duration // 60} dk + {leftover // 60} dk ek"
-            )
-
-    return suggestions
-
 # def generate_strategy_table(strategy_data: dict) -> QWidget:
 #     widget = QWidget()
 #     layout = QVBoxLayout(widget)
@@ -0,0 +1,39 @@
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from pages.race_simulation import SimulationParams, StrategyProfile, run_simulation
+from pages.stint_plan import PlanCancelled, PlanInputs
+
+INPUTS = PlanInputs(race_time=86400, average_lap_time=210, fuel_time=30, tire_time=20,
+                    pit_lane_time=25, fuel_consumption=3)
+
+
+def profiles():
+    return [StrategyProfile(f"strategy_{i}", tuple([12 + i] * 40), tuple([75.0] * 40), 12 + i, 75.0)
+            for i in range(4)]
+
+
+def test_small_run_in_process():
+    results = run_simulation(INPUTS, profiles(), SimulationParams(runs=200, batch_size=100, seed=1),
+                             processes=1)
+    assert set(results) == {p.strategy for p in profiles()}
+    assert all(r.runs == 200 for r in results.values())
+    assert sum(r.wins for r in results.values()) == 200
+
+
+def test_cancel_mid_run_stops_worker_processes():
+    stop = threading.Event()
+    threading.Timer(3.0, stop.set).start()
+    params = SimulationParams(runs=200000, batch_size=2000, seed=1)
+
+    started = time.perf_counter()
+    with pytest.raises(PlanCancelled):
+        run_simulation(INPUTS, profiles(), params, processes=3, cancelled=stop.is_set)
+    elapsed = time.perf_counter() - started
+
+    # Batch'in bitmesi beklenmez; dönüşte havuzun süreçleri kapanmış olmalı
+    assert elapsed < 5.0
+    assert multiprocessing.active_children() == []
@@ -0,0 +1,45 @@
+import numpy as np
+
+from pages.strategy_sweep import sweep_from_data
+
+# Tüm varyant ızgarası üzerinden sıralansa [32, 33, 34, 28] çıkan form
+# (28 tur sadece 0.9× pit süreleriyle öne geçer)
+FORM = {
+    "race_time_seconds": 28800,
+    "average_lap_time_seconds": 178.9,
+    "fuel_time": 14.0,
+    "tire_time": 21.0,
+    "pit_lane_time": 34.0,
+    "fuel_consumption": 2.4,
+    "virtual_fuel": 2.9,
+}
+
+
+def test_lap_counts_ranked_at_nominal_variant():
+    result = sweep_from_data(FORM)
+    assert result.best_lap_counts(4) == [32, 33, 34, 27]
+    assert result.best_lap_counts(4) == sweep_from_data(FORM, spread=(1.0,)).best_lap_counts(4)
+
+
+def test_nominal_best_uses_form_pit_times():
+    result = sweep_from_data(FORM)
+    for candidate in result.nominal_best(4):
+        assert np.isclose(candidate["pit_lane_time"], FORM["pit_lane_time"])
+        assert np.isclose(candidate["fuel_time"], FORM["fuel_time"])
+        assert np.isclose(candidate["tire_time"], FORM["tire_time"])
+    assert [c["laps_per_stint"] for c in result.nominal_best(4)] == result.best_lap_counts(4)
+
+
+def test_random_forms_match_nominal_only_sweep():
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        form = {
+            "race_time_seconds": float(rng.choice([6 * 3600, 8 * 3600, 24 * 3600])),
+            "average_lap_time_seconds": rng.uniform(90, 240),
+            "fuel_time": rng.uniform(10, 40),
+            "tire_time": rng.uniform(10, 40),
+            "pit_lane_time": rng.uniform(15, 40),
+            "fuel_consumption": rng.uniform(1, 4),
+            "virtual_fuel": rng.uniform(0, 5),
+        }
+        assert sweep_from_data(form).best_lap_counts(4) == sweep_from_data(form, spread=(1.0,)).best_lap_counts(4)
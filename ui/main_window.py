@@ -3,32 +3,84 @@ from PyQt6.QtWidgets import (
     QLabel, QListWidget, QComboBox, QStackedWidget, QPushButton, QListWidgetItem, QHeaderView,
     QSystemTrayIcon, QMenu, QApplication, QScrollArea
 )
-from PyQt6.QtGui import QFont, QPixmap, QPainter, QIcon, QAction
-from PyQt6.QtCore import Qt, QSize, QLocale
+from PyQt6.QtGui import QFont, QPixmap, QPainter, QIcon, QAction, QColor
+from PyQt6.QtCore import Qt, QSize, QLocale, QDateTime, QTimer, QRectF
 QLocale.setDefault(QLocale(QLocale.Language.English))
 from PyQt6.QtGui import QFontDatabase
 import json
 import os
+import time
 
 from pages.home_page import HomePage
-from pages.prerace_stint_calculator import PreRaceStintCalculator
-from pages.drivers_time import DriversTimePage
-from pages.live_race_monitor import LiveRaceMonitor
-from pages.practice_data_analysis import PracticeDataAnalysis
-from pages.teams_strategy_comparison import TeamsStrategyComparison
-from pages.settings import SettingsDialog
 
 from utils.resource_path import resource_path
+from utils.telemetry import TelemetryService
+from utils.persistence import strategy_inputs
+from utils.strategy_repository import strategy_repository, strategy_key
+from utils.image_loader import ImageLoader
+from utils.startup_timeline import startup_timeline
+from utils.style import apply_app_stylesheet
+
+# Arka plan görseli çözülene kadar kullanılan düz renk
+BACKGROUND_COLOR = QColor(18, 18, 18)
 
 class CentralWidget(QWidget):
     def __init__(self):
         super().__init__()
-        self.background = QPixmap(resource_path("assets/background.jpg"))
+        # 🖼 Görsel arka planda çözülür (ImageLoader), gelene kadar düz renk çizilir
+        self.background = QPixmap()
+        # Pencere boyutu ve DPI'a göre önceden ölçeklenmiş kopya; her karede sadece kopyalanır
+        self.scaled_background = QPixmap()
+        self.scaled_key = None
+        # 🌙 Tray'deyken görsel çizilmez, ölçekli kopya bırakılır
+        self.low_power = False
+
+    def set_background(self, image):
+        self.background = QPixmap.fromImage(image)
+        self.scaled_key = None
+        self.update()
+
+    def set_low_power(self, enabled: bool):
+        if self.low_power == enabled:
+            return
+        self.low_power = enabled
+        if enabled:
+            self.scaled_background = QPixmap()
+            self.scaled_key = None
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.scaled_key = None
+
+    def scaled_pixmap(self) -> QPixmap:
+        """Boyut / DPI değişmedikçe aynı ölçekli pixmap döner."""
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio)
+        if key != self.scaled_key:
+            target = QSize(round(self.width() * ratio), round(self.height() * ratio))
+            self.scaled_background = self.background.scaled(
+                target,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self.scaled_background.setDevicePixelRatio(ratio)
+            self.scaled_key = key
+        return self.scaled_background
 
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
-        painter.drawPixmap(self.rect(), self.background)
+        if self.low_power or self.background.isNull():
+            painter.fillRect(event.rect(), BACKGROUND_COLOR)
+            return
+
+        # Sadece geçersizleşen bölge, ölçeklemeden kopyalanır
+        rect = event.rect()
+        pixmap = self.scaled_pixmap()
+        ratio = pixmap.devicePixelRatio()
+        source = QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio)
+        painter.drawPixmap(QRectF(rect), pixmap, source)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -36,16 +88,23 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("CaspianRaceMonitor")
         self.setGeometry(100, 100, 1200, 800)
 
+        startup_timeline.mark("MainWindow: window")
+
+        # 🧵 Araç / marka / bayrak / arka plan görselleri arka planda çözülür
+        self.image_loader = ImageLoader(self)
+
         central_widget = CentralWidget()
         self.setCentralWidget(central_widget)
+        self.image_loader.request(resource_path("assets/background.jpg"), central_widget.set_background)
 
         main_layout = QVBoxLayout()
         central_widget.setLayout(main_layout)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
 
-        with open(resource_path("ui/styles.qss"), "r", encoding="utf-8") as f:
-            self.setStyleSheet(f.read())
+        # main.py yüklemişse tekrar ayrıştırılmaz
+        apply_app_stylesheet()
+        startup_timeline.mark("MainWindow: stylesheet")
 
         font_id = QFontDatabase.addApplicationFont(resource_path("assets/fonts/Race Sport.ttf"))
         if font_id == -1:
@@ -58,9 +117,10 @@ class MainWindow(QMainWindow):
             race_sport_font = QFont(font_families[0], 36)
         else:
             race_sport_font = QFont("Arial", 36)
+        startup_timeline.mark("MainWindow: font")
 
         top_area = QWidget()
-        top_area.setStyleSheet("background-color: rgba(30, 30, 30, 0.8); border-radius: 10px;")
+        top_area.setObjectName("TopArea")
         top_area.setFixedHeight(160)
         top_layout = QHBoxLayout(top_area)
         top_layout.setContentsMargins(10, 10, 10, 10)
@@ -71,7 +131,10 @@ class MainWindow(QMainWindow):
         self.toggle_button.clicked.connect(self.toggle_sidebar)
 
         header = QLabel()
-        header.setPixmap(QPixmap(resource_path("assets/header/header.png")))
+        self.image_loader.request(
+            resource_path("assets/header/header.png"),
+            lambda image: header.setPixmap(QPixmap.fromImage(image))
+        )
         header.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         header.setScaledContents(True)
         header.setFixedHeight(80)
@@ -80,16 +143,21 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout(header_container)
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(8)
-        header_container.setStyleSheet("background-color: transparent;")
+        header_container.setObjectName("HeaderContainer")
 
         monitor_icon = QLabel()
-        monitor_icon.setPixmap(QPixmap(resource_path("assets/icons/monitor.png")).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio))
+        self.image_loader.request(
+            resource_path("assets/icons/monitor.png"),
+            lambda image: monitor_icon.setPixmap(
+                QPixmap.fromImage(image).scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+        )
         header_layout.addWidget(monitor_icon)
         header_layout.addWidget(header)
 
         self.car_image_label = QLabel()
         self.car_image_label.setFixedSize(346, 100)
-        self.car_image_label.setStyleSheet("background-color: transparent;")
+        self.car_image_label.setObjectName("CarImage")
         self.car_image_label.setScaledContents(True)
 
         self.class_selector = QComboBox()
@@ -114,9 +182,8 @@ class MainWindow(QMainWindow):
         tracks = tracks_data["tracks"]
         for track in tracks:
             name = track["name"]
-            icon_path = resource_path(f"assets/flags/{track['flag']}")
-            flag_icon = QIcon(icon_path)
-            self.track_selector.addItem(flag_icon, name)
+            self.track_selector.addItem(name)
+            self.request_combo_icon(self.track_selector, name, resource_path(f"assets/flags/{track['flag']}"))
 
         self.class_selector.currentTextChanged.connect(self.trigger_strategy_reload)
         self.car_selector.currentTextChanged.connect(self.trigger_strategy_reload)
@@ -144,6 +211,7 @@ class MainWindow(QMainWindow):
 
         top_layout.addWidget(self.profile_button)
         top_layout.addWidget(self.settings_button)
+        startup_timeline.mark("MainWindow: header & selectors")
 
         body_area = QWidget()
         body_layout = QHBoxLayout(body_area)
@@ -167,70 +235,33 @@ class MainWindow(QMainWindow):
 
         self.sidebar.itemClicked.connect(self.change_page)
 
+        # 📄 Sayfalar ilk ziyarette oluşturulur (change_page / page()); Home hemen hazır
         self.content_area = QStackedWidget()
-        self.page_home = HomePage()
-        self.page_prerace = PreRaceStintCalculator()
-
-        category = self.class_selector.currentText()
-        brand = self.car_selector.currentText()
-        track = self.track_selector.currentText()
-
-        # ✅ LiveRaceMonitor önce oluşturulmalı
-        scroll_area_live_monitor = QScrollArea()
-        scroll_area_live_monitor.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-            }
-            QScrollArea > QWidget > QWidget {
-                background-color: transparent;
-            }
-        """)
-        scroll_area_live_monitor.setWidgetResizable(True)
-
-        self.page_live_monitor = LiveRaceMonitor()
-        scroll_area_live_monitor.setWidget(self.page_live_monitor)
-        self.page_live_monitor.set_table_component(self.page_prerace.table_component)
-        self.page_live_monitor.set_strategy_form(self.page_prerace.strategy_form)
-
-        # ✅ class/car/track bilgilerine göre json_key oluştur
-        json_key = f"{category}_{brand}_{track}".lower()
-        self.page_live_monitor.json_key = json_key
-
-        # ✅ DriversTimePage sonra oluşturulur
-        self.page_drivers_time = DriversTimePage()
-        self.page_drivers_time.set_table_component(self.page_prerace.table_component)
-        self.page_drivers_time.strategy_selected_callback = self.page_live_monitor.show_strategy_preview_widgets
-
-        # ✅ Context güncellemesi
-        self.page_prerace.strategy_form.set_current_context(category, brand, track)
-        self.page_prerace.strategy_form.data_ready.connect(self.set_race_finish_timer_from_form)
-
-        # ✅ RST'yi JSON'dan al ve sayaç için hedef zamanı ayarla
-        from PyQt6.QtCore import QDateTime
-        filename = os.path.join("data", "strategy_inputs", "hypercar_alpinea424_silverstonecircuit.json")
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                rst_string = data.get("start_time", "")
-                rst_dt = QDateTime.fromString(rst_string, "dd MMM yyyy HH:mm")
-                if rst_dt.isValid():
-                    print("📦 JSON'dan RST:", rst_dt.toString("dd MMM yyyy HH:mm:ss"))
-                    self.page_live_monitor.set_target_time(rst_dt)
-                else:
-                    print("❌ RST geçersiz:", rst_string)
+        self.pages = {}
+        self.page_containers = {}
+        self.page_builders = {
+            "Home": self.build_home_page,
+            "PreRace Stint Calculator": self.build_prerace_page,
+            "Drivers Time": self.build_drivers_time_page,
+            "Live Race Monitor": self.build_live_monitor_page,
+            "Practice Data Analysis": self.build_practice_analysis_page,
+            "Teams Strategy Comparison": self.build_teams_strategy_page,
+        }
 
-        self.page_practice_analysis = PracticeDataAnalysis()
-        self.page_teams_strategy = TeamsStrategyComparison()
+        # Son Calculate'in yarış süresi; Live Race Monitor oluşturulunca uygulanır
+        self.race_finish_seconds = None
 
+        self.current_context = (
+            self.class_selector.currentText(),
+            self.car_selector.currentText(),
+            self.track_selector.currentText()
+        )
 
-        self.content_area.addWidget(self.page_home)
-        self.content_area.addWidget(self.page_prerace)
-        self.content_area.addWidget(self.page_drivers_time)
-        self.content_area.addWidget(self.page_live_monitor)
-        self.content_area.addWidget(self.page_practice_analysis)
-        self.content_area.addWidget(self.page_teams_strategy)
+        # 📡 Telemetri: CRM_TELEMETRY ws:// adresi ya da JSON-lines kayıt dosyası olabilir
+        self.telemetry = TelemetryService(self)
 
-        self.content_area.setCurrentIndex(0)
+        self.content_area.setCurrentWidget(self.page_container("Home"))
+        startup_timeline.mark("MainWindow: home page")
 
         body_layout.addWidget(self.sidebar)
         body_layout.addWidget(self.content_area, 1)
@@ -243,18 +274,7 @@ class MainWindow(QMainWindow):
         close_button = QPushButton("✕", self)
         close_button.setObjectName("HeaderButton")
         close_button.setFixedSize(30, 30)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                font-size: 16px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 0, 0, 0.5);
-                border-radius: 4px;
-            }
-        """)
+        close_button.setProperty("role", "close")
         close_button.move(self.width() - 40, 10)
         close_button.clicked.connect(self.close)
         close_button.raise_()  # En öne al
@@ -264,8 +284,121 @@ class MainWindow(QMainWindow):
             close_button.move(self.width() - 40, 10)
 
         self.resizeEvent = lambda event: reposition_close_button()
+
+        # 🕐 Tray ve telemetri ilk kareden sonra başlatılır
+        QTimer.singleShot(0, self.finish_startup)
+        startup_timeline.mark("MainWindow: layout")
+
+    def finish_startup(self):
+        startup_timeline.mark("first event loop turn")
         self.init_tray_icon()
 
+        telemetry_address = os.environ.get("CRM_TELEMETRY")
+        if telemetry_address:
+            self.page_live_monitor  # telemetri alıcısı olarak sayfa hazır olmalı
+            self.telemetry.start_address(telemetry_address)
+
+        startup_timeline.mark("tray & telemetry")
+        startup_timeline.report()
+
+    # ---- Sayfalar (lazy) ----
+
+    def page(self, name: str):
+        """Sayfayı ilk istendiğinde oluşturur ve QStackedWidget'a ekler."""
+        page = self.pages.get(name)
+        if page is None:
+            started = time.perf_counter()
+            page, container = self.page_builders[name]()
+            self.pages[name] = page
+            self.page_containers[name] = container
+            self.content_area.addWidget(container)
+            print(f"📄 {name} oluşturuldu ({(time.perf_counter() - started) * 1000:.0f} ms)")
+        return page
+
+    def page_container(self, name: str):
+        self.page(name)
+        return self.page_containers[name]
+
+    def is_page_built(self, name: str) -> bool:
+        return name in self.pages
+
+    @property
+    def page_home(self):
+        return self.page("Home")
+
+    @property
+    def page_prerace(self):
+        return self.page("PreRace Stint Calculator")
+
+    @property
+    def page_drivers_time(self):
+        return self.page("Drivers Time")
+
+    @property
+    def page_live_monitor(self):
+        return self.page("Live Race Monitor")
+
+    @property
+    def page_practice_analysis(self):
+        return self.page("Practice Data Analysis")
+
+    @property
+    def page_teams_strategy(self):
+        return self.page("Teams Strategy Comparison")
+
+    def build_home_page(self):
+        page = HomePage()
+        return page, page
+
+    def build_prerace_page(self):
+        from pages.prerace_stint_calculator import PreRaceStintCalculator
+        page = PreRaceStintCalculator()
+        page.strategy_form.data_ready.connect(self.set_race_finish_timer_from_form)
+        page.strategy_form.set_current_context(*self.current_context)
+        return page, page
+
+    def build_live_monitor_page(self):
+        from pages.live_race_monitor import LiveRaceMonitor
+        prerace = self.page_prerace
+
+        scroll_area_live_monitor = QScrollArea()
+        scroll_area_live_monitor.setObjectName("LiveMonitorScroll")
+        scroll_area_live_monitor.setWidgetResizable(True)
+
+        page = LiveRaceMonitor()
+        scroll_area_live_monitor.setWidget(page)
+        page.set_table_component(prerace.table_component)
+        page.set_strategy_store(prerace.table_component.store)
+        page.set_strategy_form(prerace.strategy_form)
+        page.set_telemetry_service(self.telemetry)
+        page.race_clock.set_low_power(not self.isVisible())
+        self.apply_live_monitor_context(page, *self.current_context)
+        if self.race_finish_seconds is not None:
+            page.set_finish_time_seconds(self.race_finish_seconds)
+        return page, scroll_area_live_monitor
+
+    def build_drivers_time_page(self):
+        from pages.drivers_time import DriversTimePage
+        prerace = self.page_prerace
+
+        page = DriversTimePage()
+        page.set_table_component(prerace.table_component)
+        page.set_strategy_store(prerace.table_component.store)
+        # Live monitor ilk strateji seçiminde oluşturulur
+        page.strategy_selected_callback = lambda name: self.page_live_monitor.show_strategy_preview(name)
+        page.set_current_context(*self.current_context)
+        return page, page
+
+    def build_practice_analysis_page(self):
+        from pages.practice_data_analysis import PracticeDataAnalysis
+        page = PracticeDataAnalysis()
+        return page, page
+
+    def build_teams_strategy_page(self):
+        from pages.teams_strategy_comparison import TeamsStrategyComparison
+        page = TeamsStrategyComparison()
+        return page, page
+
 
     def toggle_sidebar(self):
         if self.sidebar.isVisible():
@@ -275,18 +408,8 @@ class MainWindow(QMainWindow):
 
     def change_page(self, item):
         text = item.text().strip()
-        if text == "Home":
-            self.content_area.setCurrentIndex(0)
-        elif text == "PreRace Stint Calculator":
-            self.content_area.setCurrentIndex(1)
-        elif text == "Drivers Time":
-            self.content_area.setCurrentIndex(2)
-        elif text == "Live Race Monitor":
-            self.content_area.setCurrentIndex(3)
-        elif text == "Practice Data Analysis":
-            self.content_area.setCurrentIndex(4)
-        elif text == "Teams Strategy Comparison":
-            self.content_area.setCurrentIndex(5)
+        if text in self.page_builders:
+            self.content_area.setCurrentWidget(self.page_container(text))
 
     def update_car_selector(self, selected_class):
         self.car_selector.clear()
@@ -294,20 +417,25 @@ class MainWindow(QMainWindow):
         for car in cars:
             car_name = car["name"]
             brand_name = car["brand"]
-            icon_path = resource_path(f"assets/brands/{brand_name}.png")
-            icon = QIcon(icon_path)
-            self.car_selector.addItem(icon, car_name)
+            self.car_selector.addItem(car_name)
+            self.request_combo_icon(self.car_selector, car_name, resource_path(f"assets/brands/{brand_name}.png"))
 
     def update_class_selector(self):
         self.class_selector.clear()
         for class_name in self.cars_data.keys():
             icon_filename = class_name.lower().replace(" ", "") + ".png"
             icon_path = resource_path(os.path.join("assets/class", icon_filename))
+            self.class_selector.addItem(class_name)
             if os.path.exists(icon_path):
-                icon = QIcon(icon_path)
-                self.class_selector.addItem(icon, class_name)
-            else:
-                self.class_selector.addItem(class_name)
+                self.request_combo_icon(self.class_selector, class_name, icon_path)
+
+    def request_combo_icon(self, combo, text, icon_path):
+        """İkon arka planda çözülür; geldiğinde öğe hâlâ listedeyse atanır."""
+        def apply(image):
+            index = combo.findText(text)
+            if index >= 0 and not image.isNull():
+                combo.setItemIcon(index, QIcon(QPixmap.fromImage(image)))
+        self.image_loader.request(icon_path, apply)
 
     def update_car_image(self, selected_car):
         selected_class = self.class_selector.currentText()
@@ -316,26 +444,64 @@ class MainWindow(QMainWindow):
             if car["name"] == selected_car:
                 car_img_path = resource_path(f"assets/cars/{selected_class.lower()}/{car['brand']}.png")
                 if os.path.exists(car_img_path):
-                    self.car_image_label.setPixmap(QPixmap(car_img_path))
+                    self.image_loader.request(
+                        car_img_path,
+                        lambda image, name=selected_car: self.set_car_image(name, image)
+                    )
                 else:
                     self.car_image_label.clear()
                 break
 
+    def set_car_image(self, car_name, image):
+        # Çözme sürerken seçim değiştiyse eski görsel atanmaz
+        if car_name == self.car_selector.currentText():
+            self.car_image_label.setPixmap(QPixmap.fromImage(image))
+
     def trigger_strategy_reload(self):
+        if not hasattr(self, "pages"):
+            return  # sayfalar henüz oluşturulmadı
         category = self.class_selector.currentText()
         brand = self.car_selector.currentText()
         track = self.track_selector.currentText()
-        self.page_prerace.strategy_form.set_current_context(category, brand, track)
+        self.apply_context(category, brand, track)
+
+    def apply_context(self, category, brand, track):
+        """
+        Seçili class/car/track'i oluşturulmuş sayfalara dağıtır; dosya depodan
+        (önbellekli) okunur. Henüz oluşturulmamış sayfalar bağlamı oluşturulurken alır.
+        """
+        self.current_context = (category, brand, track)
+        if self.is_page_built("PreRace Stint Calculator"):
+            self.page_prerace.strategy_form.set_current_context(category, brand, track)
+        if self.is_page_built("Drivers Time"):
+            self.page_drivers_time.set_current_context(category, brand, track)
+        if self.is_page_built("Live Race Monitor"):
+            self.apply_live_monitor_context(self.page_live_monitor, category, brand, track)
+
+    def apply_live_monitor_context(self, page, category, brand, track):
+        page.json_key = strategy_key(category, brand, track)
+
+        # ✅ RST'yi kayıttan al ve sayaç için hedef zamanı ayarla
+        rst_string = strategy_repository.get(category, brand, track).start_time
+        if rst_string:
+            rst_dt = QDateTime.fromString(rst_string, "dd MMM yyyy HH:mm")
+            if rst_dt.isValid():
+                print("📦 JSON'dan RST:", rst_dt.toString("dd MMM yyyy HH:mm:ss"))
+                page.set_target_time(rst_dt)
+            else:
+                print("❌ RST geçersiz:", rst_string)
 
 
     def resize_columns(self):
+        if not self.is_page_built("PreRace Stint Calculator"):
+            return
         try:
-            self.page_prerace.table_component.table.resizeColumnsToContents()
-            self.page_prerace.table_component.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+            self.page_prerace.table_component.apply_column_layout()
         except Exception as e:
             print("resize_columns hatası:", e)
             
     def open_settings_dialog(self):
+        from pages.settings import SettingsDialog
         dialog = SettingsDialog()
         if dialog.exec():
             team_name = dialog.team_input.text().strip()
@@ -343,28 +509,17 @@ class MainWindow(QMainWindow):
                 self.page_drivers_time.set_current_team(team_name)
 
     def set_race_finish_timer_from_form(self, data: dict):
-        race_time_seconds = data.get("race_time_seconds", 0)
-        self.page_live_monitor.set_finish_time_seconds(race_time_seconds)
+        # Live monitor henüz oluşturulmadıysa sadece saklanır (sayfa Calculate'te kurulmaz)
+        self.race_finish_seconds = data.get("race_time_seconds", 0)
+        if self.is_page_built("Live Race Monitor"):
+            self.page_live_monitor.set_finish_time_seconds(self.race_finish_seconds)
 
     def init_tray_icon(self):
         self.tray_icon = QSystemTrayIcon(QIcon(resource_path("assets/icons/crm_icon.ico")), self)
         self.tray_icon.setToolTip("Caspian Race Monitor")
 
         tray_menu = QMenu()
-        tray_menu.setStyleSheet("""
-            QMenu {
-                background-color: white;
-                color: black;
-                border: 1px solid #aaa;
-                padding: 6px;
-                font-size: 14px;
-                font-family: Poppins;
-            }
-            QMenu::item:selected {
-                background-color: #f0f0f0;
-                color: black;
-            }
-        """)
+        tray_menu.setObjectName("TrayMenu")
 
         # ✅ Fullscreen action
         restore_action = QAction("Go Fullscreen", self)
@@ -388,7 +543,28 @@ class MainWindow(QMainWindow):
         event.ignore()
         self.hide()
 
+    def hideEvent(self, event):
+        # 🌙 Tray'de gizliyken yarış saati daha seyrek tick atar, arka plan düz renk çizilir
+        super().hideEvent(event)
+        self.centralWidget().set_low_power(True)
+        if self.is_page_built("Live Race Monitor"):
+            self.page_live_monitor.race_clock.set_low_power(True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.centralWidget().set_low_power(False)
+        if self.is_page_built("Live Race Monitor"):
+            self.page_live_monitor.race_clock.set_low_power(False)
+
     def quit_app(self):
+        self.telemetry.stop()
+        # ⏹ Yarım kalan plan hesabı beklenmez
+        if self.is_page_built("PreRace Stint Calculator"):
+            self.page_prerace.table_component.plan_worker.cancel()
+            self.page_prerace.table_component.fcy_lookup_worker.cancel()
+            self.page_prerace.table_component.simulation_worker.cancel()
+        # 💾 Bekleyen gecikmeli kayıtlar kapanmadan yazılır
+        strategy_inputs.flush()
         self.tray_icon.hide()
         QApplication.quit()
 
@@ -0,0 +1,59 @@
+# utils/image_loader.py
+"""
+Arka planda görsel çözme.
+
+Araç, marka, bayrak ve arka plan görselleri QThreadPool işlerinde QImage olarak
+çözülür (QPixmap GUI thread'ine bağlıdır, QImage değildir). Sonuç queued sinyal
+ile GUI thread'ine döner; QPixmap / QIcon dönüşümü orada yapılır. Çözülen
+görseller yol bazında önbelleklenir.
+"""
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage
+
+
+class _DecodeSignals(QObject):
+    decoded = pyqtSignal(str, QImage)
+
+
+class _DecodeJob(QRunnable):
+    def __init__(self, path: str, signals: _DecodeSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        image = QImage(self.path)
+        if image.isNull():
+            print("⚠ Görsel yüklenemedi:", self.path)
+        self.signals.decoded.emit(self.path, image)
+
+
+class ImageLoader(QObject):
+    """request(path, callback): callback(QImage) GUI thread'inde çağrılır."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool.globalInstance()
+        self.cache = {}
+        self.waiting = {}
+        self.signals = _DecodeSignals()
+        self.signals.decoded.connect(self._on_decoded)
+
+    def request(self, path: str, callback):
+        if path in self.cache:
+            callback(self.cache[path])
+            return
+        if path in self.waiting:
+            self.waiting[path].append(callback)
+            return
+        self.waiting[path] = [callback]
+        self.pool.start(_DecodeJob(path, self.signals))
+
+    @property
+    def pending(self) -> int:
+        return len(self.waiting)
+
+    def _on_decoded(self, path: str, image: QImage):
+        self.cache[path] = image
+        for callback in self.waiting.pop(path, []):
+            callback(image)
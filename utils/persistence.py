@@ -0,0 +1,161 @@
+# utils/persistence.py
+"""
+data/strategy_inputs için write-behind JSON deposu.
+
+Her anahtar (<class>_<car>_<track>) için belge bellekte tek kopya tutulur;
+sayfalar sadece kendi üst seviye alanlarını update() ile birleştirir, böylece
+aynı dosyaya yazan sayfalar birbirinin değişikliğini ezmez. Diske yazma
+DEBOUNCE_SECONDS boyunca biriktirilir ve arka plan thread'inde geçici dosya +
+os.replace ile atomik olarak yapılır; GUI thread'i disk I/O beklemez.
+Dosya dışarıdan değişirse (mtime farkı) bekleyen yazma yoksa belge yeniden okunur.
+"""
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEBOUNCE_SECONDS = 0.5
+
+
+class WriteBehindJsonStore:
+    def __init__(self, directory: str, debounce: float = DEBOUNCE_SECONDS):
+        self.directory = directory
+        self.debounce = debounce
+        self.documents = {}
+        # anahtar -> yazma zamanı (time.monotonic())
+        self.pending = {}
+        # Eski bir payload yenisinin üstüne yazılmasın diye belge sürümleri
+        self.versions = {}
+        self.written_versions = {}
+        # anahtar -> belgenin okunduğu / en son yazıldığı dosya mtime'ı (ns)
+        self.mtimes = {}
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.worker = None
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _mtime(self, key: str):
+        try:
+            return os.stat(self.path(key)).st_mtime_ns
+        except OSError:
+            return None
+
+    def _document(self, key: str) -> dict:
+        """
+        Lock altında çağrılır; belge ilk erişimde diskten okunur. Dosya dışarıdan
+        değiştiyse ve bekleyen yazma yoksa yeniden okunur (tek os.stat maliyeti).
+        """
+        document = self.documents.get(key)
+        mtime = self._mtime(key)
+        if document is not None and (key in self.pending or mtime == self.mtimes.get(key)):
+            return document
+
+        document = {}
+        if mtime is not None:
+            try:
+                with open(self.path(key), "r", encoding="utf-8") as f:
+                    document = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print("⚠ JSON okuma hatası:", e)
+        self.documents[key] = document
+        self.mtimes[key] = mtime
+        # Yeniden okunan belge yeni bir sürümdür (önbellekteki görünümler geçersizleşir)
+        self.versions[key] = self.versions.get(key, 0) + 1
+        self.written_versions[key] = self.versions[key]
+        return document
+
+    def revision(self, key: str) -> int:
+        """Belgenin sürümü; bellekte ya da diskte değiştikçe artar."""
+        with self.lock:
+            self._document(key)
+            return self.versions[key]
+
+    def load(self, key: str) -> dict:
+        """Belgenin kopyası (henüz diske yazılmamış değişiklikler dahil)."""
+        with self.lock:
+            return copy.deepcopy(self._document(key))
+
+    def update(self, key: str, changes: dict):
+        """Üst seviye alanları birleştirir ve gecikmeli yazma planlar; diğer alanlara dokunmaz."""
+        with self.lock:
+            self._document(key).update(copy.deepcopy(changes))
+            self.versions[key] = self.versions.get(key, 0) + 1
+            self.pending[key] = time.monotonic() + self.debounce
+            self._ensure_worker()
+            self.wakeup.notify()
+
+    def flush(self):
+        """Bekleyen tüm yazmaları hemen (çağıran thread'de) diske yazar."""
+        with self.lock:
+            keys = list(self.pending)
+            self.pending.clear()
+            payloads = [self._serialize(key) for key in keys]
+        for key, version, payload in payloads:
+            self._write(key, version, payload)
+
+    def _ensure_worker(self):
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._run, name="persistence", daemon=True)
+            self.worker.start()
+
+    def _serialize(self, key: str) -> tuple:
+        return key, self.versions.get(key, 0), json.dumps(self.documents[key], indent=4, ensure_ascii=False)
+
+    def _run(self):
+        while True:
+            with self.lock:
+                while not self.pending:
+                    self.wakeup.wait()
+                now = time.monotonic()
+                due = [key for key, deadline in self.pending.items() if deadline <= now]
+                if not due:
+                    self.wakeup.wait(min(self.pending.values()) - now)
+                    continue
+                payloads = []
+                for key in due:
+                    del self.pending[key]
+                    payloads.append(self._serialize(key))
+
+            for key, version, payload in payloads:
+                self._write(key, version, payload)
+
+    def _write(self, key: str, version: int, payload: str):
+        with self.write_lock:
+            if version <= self.written_versions.get(key, -1):
+                return
+            if self._write_atomic(key, payload):
+                self.written_versions[key] = version
+                # Kendi yazdığımız dosya dış değişiklik sayılmasın
+                with self.lock:
+                    self.mtimes[key] = self._mtime(key)
+
+    def _write_atomic(self, key: str, payload: str) -> bool:
+        filename = self.path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_name, filename)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+            print(f"✔ Saved to {filename}")
+            return True
+        except OSError as e:
+            print("❌ JSON yazma hatası:", e)
+            return False
+
+
+strategy_inputs = WriteBehindJsonStore(os.path.join("data", "strategy_inputs"))
+# Uygulama kapanırken bekleyen yazmalar kaybolmasın
+atexit.register(strategy_inputs.flush)
@@ -0,0 +1,220 @@
+# utils/race_clock.py
+"""
+Tek saatli yarış zamanlayıcısı.
+
+LiveRaceMonitor'daki tüm sayaçlar (race start, finish, FCY, pitlane, pitzone)
+tek bir QTimer tick'inde hesaplanır: kronometreler time.monotonic(), finish
+geri sayımı duvar saatine sabitlenmiş yarış başlangıcı üzerinden. Her tick'te
+tek bir sinyal yayınlanır, sayfa etiketlerini bu sinyalde topluca günceller.
+Sayaçlar tick sayarak ilerlemediği için geciken tick'ler kaymaya yol açmaz.
+Timer her tick'te yeniden kurulur: finish geri sayımı çalışırken bir sonraki
+tick gösterilen saniyenin değiştiği ana hizalanır, ekran saniye atlamaz ya
+da tekrarlamaz.
+"""
+import math
+import time
+
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+TICK_INTERVAL_MS = 1000
+# Pencere tray'de gizliyken daha seyrek uyanılır
+LOW_POWER_TICK_INTERVAL_MS = 5000
+# Hizalı tick saniye sınırından bu kadar sonra atar (yukarı yuvarlama yeni saniyeyi görsün)
+TICK_ALIGN_MARGIN_MS = 5
+
+
+class PauseLedger:
+    """Duraklatma muhasebesi: toplam duraklatılmış süre ve açık duraklatma."""
+
+    def __init__(self):
+        self.paused_since = None
+        self.paused_total = 0.0
+
+    @property
+    def paused(self) -> bool:
+        return self.paused_since is not None
+
+    def pause(self, now: float):
+        if self.paused_since is None:
+            self.paused_since = now
+
+    def resume(self, now: float):
+        if self.paused_since is not None:
+            self.paused_total += now - self.paused_since
+            self.paused_since = None
+
+    def reset(self):
+        self.paused_since = None
+        self.paused_total = 0.0
+
+    def total(self, now: float) -> float:
+        if self.paused_since is None:
+            return self.paused_total
+        return self.paused_total + (now - self.paused_since)
+
+
+class Stopwatch:
+    """
+    Başlangıç anı + duraklatma muhasebesi ile hesaplanan kronometre.
+    Duraklatılan kronometre resume ile kaldığı yerden devam eder.
+    """
+
+    def __init__(self):
+        self.started_at = None
+        self.pauses = PauseLedger()
+
+    @property
+    def started(self) -> bool:
+        return self.started_at is not None
+
+    @property
+    def paused(self) -> bool:
+        return self.started and self.pauses.paused
+
+    @property
+    def running(self) -> bool:
+        return self.started and not self.pauses.paused
+
+    def start(self, now: float):
+        """Sıfırdan başlatır."""
+        self.started_at = now
+        self.pauses.reset()
+
+    def pause(self, now: float):
+        if self.running:
+            self.pauses.pause(now)
+
+    def resume(self, now: float):
+        if self.paused:
+            self.pauses.resume(now)
+
+    def reset(self):
+        self.started_at = None
+        self.pauses.reset()
+
+    def elapsed(self, now: float) -> float:
+        if self.started_at is None:
+            return 0.0
+        return max(0.0, now - self.started_at - self.pauses.total(now))
+
+
+class FinishCountdown:
+    """
+    Yarış bitişine geri sayım. Başlangıç duvar saatine (epoch) sabitlenir,
+    kalan süre her okumada başlangıç, duraklatmalar ve düzeltmeden hesaplanır;
+    kaçan ya da geciken tick'ler hata biriktirmez.
+    """
+
+    def __init__(self, total_seconds: float = 0):
+        self.total_seconds = total_seconds
+        self.stopwatch = Stopwatch()
+        # Telemetri ile senkronizasyondan gelen sapma (saniye, + = daha az kalan)
+        self.correction = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.stopwatch.running
+
+    @property
+    def started_at(self):
+        """Yarış başlangıcının epoch saniyesi (başlamadıysa None)."""
+        return self.stopwatch.started_at
+
+    def set_total(self, total_seconds: float):
+        """Yeni yarış süresi: geri sayım başa döner."""
+        self.total_seconds = total_seconds
+        self.correction = 0.0
+        self.stopwatch.reset()
+
+    def start(self, now: float):
+        """İlk çağrıda yarışı now anına sabitler, sonrakilerde duraklatmadan devam eder."""
+        if self.stopwatch.started:
+            self.stopwatch.resume(now)
+        else:
+            self.stopwatch.start(now)
+
+    def pause(self, now: float):
+        self.stopwatch.pause(now)
+
+    def elapsed(self, now: float) -> float:
+        return self.stopwatch.elapsed(now) + self.correction
+
+    def left(self, now: float) -> float:
+        return max(0.0, self.total_seconds - self.elapsed(now))
+
+    def left_seconds(self, now: float) -> int:
+        """Ekranda gösterilen tam saniye (yukarı yuvarlanır)."""
+        return int(math.ceil(self.left(now) - 1e-9))
+
+    def sync(self, time_left: float, now: float):
+        """Kalan süreyi dışarıdan gelen değere eşitler (başlangıç/duraklatma bozulmaz)."""
+        self.correction += self.left(now) - time_left
+
+
+class RaceClock(QObject):
+    """
+    Tek QTimer; her tick'te tick(now) yayınlar. now, time.monotonic() değeridir.
+    Adlandırılmış kronometreler now ile, finish geri sayımı wall_now() ile okunur.
+    """
+    tick = pyqtSignal(float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stopwatches = {}
+        self.finish = FinishCountdown()
+        self.low_power = False
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_timeout)
+        self.realign()
+
+    @staticmethod
+    def now() -> float:
+        return time.monotonic()
+
+    @staticmethod
+    def wall_now() -> float:
+        return time.time()
+
+    def sync_finish(self, time_left: float):
+        """Telemetri düzeltme beslemesi: finish geri sayımını yeniden senkronlar."""
+        self.finish.sync(time_left, self.wall_now())
+        if self.finish.running:
+            # Yeniden kurulan timer aynı saniye sınırını hedefler, sık senkron tick'i geciktirmez
+            self.realign()
+
+    def stopwatch(self, name: str) -> Stopwatch:
+        if name not in self.stopwatches:
+            self.stopwatches[name] = Stopwatch()
+        return self.stopwatches[name]
+
+    def set_low_power(self, enabled: bool):
+        """Pencere gizliyken tick aralığını uzatır."""
+        if self.low_power == enabled:
+            return
+        self.low_power = enabled
+        if enabled:
+            self.realign()
+        else:
+            self._on_timeout()
+
+    def next_interval(self) -> int:
+        """Bir sonraki tick'e kalan süre (ms)."""
+        if self.low_power:
+            return LOW_POWER_TICK_INTERVAL_MS
+        if self.finish.running:
+            # Kalan sürenin kesirli kısmı bitince gösterilen saniye bir azalır
+            fraction = self.finish.left(self.wall_now()) % 1.0
+            return int(fraction * 1000) + TICK_ALIGN_MARGIN_MS
+        return TICK_INTERVAL_MS
+
+    def realign(self):
+        """Timer'ı bir sonraki tick'e yeniden kurar (geri sayım başlayınca / senkronlanınca)."""
+        # CoarseTimer %5 erken atabilir; görünür saniyeler için PreciseTimer
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer if self.low_power else Qt.TimerType.PreciseTimer)
+        self.timer.start(self.next_interval())
+
+    def _on_timeout(self):
+        self.tick.emit(self.now())
+        self.realign()
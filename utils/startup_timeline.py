@@ -0,0 +1,32 @@
+# utils/startup_timeline.py
+"""
+Açılış zaman çizelgesi: her aşamanın süresi ve süreç başından itibaren geçen
+süre kaydedilir, ilk kare çizildikten sonra konsola tek seferde yazdırılır.
+"""
+import time
+
+_process_start = time.perf_counter()
+
+
+class StartupTimeline:
+    def __init__(self):
+        self.phases = []
+        self.last = _process_start
+        self.reported = False
+
+    def mark(self, phase: str):
+        """Bir önceki işaretten bu yana geçen süreyi phase adıyla kaydeder."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last, now - _process_start))
+        self.last = now
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+        print("⏱ Startup timeline:")
+        for phase, duration, total in self.phases:
+            print(f"   {phase:<28} {duration * 1000:8.1f} ms   (t+{total * 1000:.1f} ms)")
+
+
+startup_timeline = StartupTimeline()
@@ -0,0 +1,105 @@
+# utils/strategy_repository.py
+"""
+(class, car, track) anahtarlı strateji girdisi deposu.
+
+Her dosya bir kez ayrıştırılır; sayfalar ham JSON yerine tipli StrategyInputs
+görünümünü okur. Görünüm, belge sürümü değişmedikçe (bellekte güncelleme ya da
+dosyanın dışarıdan değişmesi, mtime ile) önbellekten döner; class/car/track
+değiştirmek bir sözlük erişimi ve tek bir os.stat'tır.
+"""
+from dataclasses import dataclass, field
+
+from utils.persistence import strategy_inputs
+
+# StrategyForm alanları dışında kalan, diğer sayfalara ait üst seviye anahtarlar
+NON_FORM_KEYS = {"strategy_options", "start_time", "team", "loadstrategy", "driver_assignments"}
+
+
+def strategy_key(class_name: str, car_name: str, track_name: str) -> str:
+    """Dosya adı anahtarı: hypercar_alpinea424_silverstonecircuit"""
+    return f"{class_name}_{car_name}_{track_name}".lower().replace(" ", "")
+
+
+@dataclass(frozen=True)
+class StrategyInputs:
+    """Bir strateji dosyasının tipli, salt okunur görünümü."""
+    key: str
+    # StrategyForm alan adı -> metin
+    form: dict = field(default_factory=dict)
+    # satır -> {"tire", "fuel", "tire_checked", "fuel_checked"}
+    strategy_options: dict = field(default_factory=dict)
+    # "dd MMM yyyy HH:mm"
+    start_time: str = ""
+    team: str = ""
+    loadstrategy: str = ""
+    # satır -> pilot adı
+    driver_assignments: dict = field(default_factory=dict)
+
+    @property
+    def race_time(self) -> str:
+        return self.form.get("race_time", "")
+
+    @property
+    def exists(self) -> bool:
+        return bool(self.form or self.strategy_options or self.start_time or self.driver_assignments)
+
+    @classmethod
+    def from_document(cls, key: str, document: dict):
+        options = {}
+        for row_str, opt in document.get("strategy_options", {}).items():
+            try:
+                options[int(row_str)] = {
+                    "tire": opt.get("tire", ""),
+                    "fuel": opt.get("fuel", ""),
+                    "tire_checked": opt.get("tire_checked", True),
+                    "fuel_checked": opt.get("fuel_checked", True)
+                }
+            except (ValueError, AttributeError):
+                continue
+
+        assignments = {}
+        for row_str, driver in document.get("driver_assignments", {}).items():
+            try:
+                assignments[int(row_str)] = str(driver)
+            except ValueError:
+                continue
+
+        return cls(
+            key=key,
+            form={k: v for k, v in document.items() if k not in NON_FORM_KEYS and isinstance(v, str)},
+            strategy_options=options,
+            start_time=document.get("start_time", ""),
+            team=document.get("team", ""),
+            loadstrategy=document.get("loadstrategy", ""),
+            driver_assignments=assignments,
+        )
+
+
+class StrategyInputRepository:
+    def __init__(self, store=strategy_inputs):
+        self.store = store
+        # anahtar -> (belge sürümü, StrategyInputs)
+        self.views = {}
+
+    def get(self, class_name: str, car_name: str, track_name: str) -> StrategyInputs:
+        return self.get_by_key(strategy_key(class_name, car_name, track_name))
+
+    def get_by_key(self, key: str) -> StrategyInputs:
+        revision = self.store.revision(key)
+        cached = self.views.get(key)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        view = StrategyInputs.from_document(key, self.store.load(key))
+        self.views[key] = (revision, view)
+        return view
+
+    def update(self, key: str, changes: dict):
+        """Yazma write-behind depoya gider; görünüm bir sonraki get'te yeniden kurulur."""
+        self.store.update(key, changes)
+
+    def path(self, key: str) -> str:
+        return self.store.path(key)
+
+
+strategy_repository = StrategyInputRepository()
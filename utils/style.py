@@ -0,0 +1,39 @@
+# utils/style.py
+"""
+Uygulama stil sayfası yardımcıları.
+
+ui/styles.qss QApplication'a tek sefer yüklenir; sayfalar widget başına
+setStyleSheet çağırmaz, objectName ve dinamik property seçicileri kullanır.
+Durum değişiklikleri (pilot rengi, uyarı, düzenleme modu) sadece property
+değiştirip widget'ı yeniden polish eder; CSS tekrar ayrıştırılmaz.
+"""
+from PyQt6.QtWidgets import QApplication
+
+from utils.resource_path import resource_path
+
+
+def apply_app_stylesheet(app=None) -> bool:
+    """ui/styles.qss'i uygulamaya bir kez yükler; sonraki çağrılar bir şey yapmaz."""
+    app = app or QApplication.instance()
+    if app is None or app.property("crmStylesheetLoaded"):
+        return False
+    try:
+        with open(resource_path("ui/styles.qss"), "r", encoding="utf-8") as f:
+            app.setStyleSheet(f.read())
+    except OSError as e:
+        print(f"Stil dosyası yüklenemedi: {e}")
+        return False
+    app.setProperty("crmStylesheetLoaded", True)
+    return True
+
+
+def set_style_property(widget, name: str, value) -> bool:
+    """Dinamik property'yi değiştirir ve sadece değer farklıysa widget'ı yeniden polish eder."""
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    return True
@@ -0,0 +1,280 @@
+# utils/telemetry.py
+"""
+Canlı telemetri alımı (LMU WebSocket beslemesi ya da JSON-lines kaydı).
+
+Olaylar GUI thread'inin dışında, ayrı bir thread'de çalışan asyncio döngüsünde
+okunur ve tek bir TelemetrySnapshot üzerinde birleştirilir. GUI'ye en fazla
+PUBLISH_INTERVAL_SECONDS'ta bir, sadece değişiklik varsa queued sinyal ile
+son durum gönderilir; 100 Hz'lik bir besleme UI'ya 10 Hz'lik tek bir güncelleme
+olarak ulaşır.
+
+Olay biçimi (her satır / mesaj bir JSON nesnesi):
+    {"type": "lap", "lap": 12, "lap_time": 215.3}
+    {"type": "pit", "state": "pitlane"}        # track / pitlane / pitzone
+    {"type": "fuel", "fuel": 45.2}
+    {"type": "flag", "flag": "fcy"}            # green / fcy / sc / vsc / ...
+    {"type": "session", "time_left": 12345}
+Kayıt dosyalarında isteğe bağlı "t" alanı (kayıt başından itibaren saniye)
+replay hızını belirler.
+"""
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass, replace
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# UI'ya yayın aralığı (saniye): 10 Hz
+PUBLISH_INTERVAL_SECONDS = 0.1
+# WebSocket bağlantısı koparsa yeniden deneme bekleme süreleri
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 10.0
+
+PIT_STATES = ("track", "pitlane", "pitzone")
+FCY_FLAGS = {"fcy", "sc", "vsc", "full_course_yellow", "safety_car"}
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """Birleştirilmiş son durum; bilinmeyen alanlar None."""
+    lap: int = None
+    last_lap_seconds: float = None
+    fuel: float = None
+    pit_state: str = "track"
+    flag: str = "green"
+    time_left: float = None
+    event_count: int = 0
+    received_at: float = None  # time.monotonic()
+
+    @property
+    def fcy_active(self) -> bool:
+        return self.flag in FCY_FLAGS
+
+
+def parse_event(line) -> dict:
+    """JSON satırını olaya çevirir; geçersiz ya da tipsiz satırlar için None."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(event, dict) or "type" not in event:
+        return None
+    return event
+
+
+def apply_event(snapshot: TelemetrySnapshot, event: dict) -> TelemetrySnapshot:
+    """Olayı snapshot'a uygular; bilinmeyen olaylar sadece sayacı artırır."""
+    changes = {}
+    event_type = event.get("type")
+    try:
+        if event_type == "lap":
+            if "lap" in event:
+                changes["lap"] = int(event["lap"])
+            if event.get("lap_time") is not None:
+                changes["last_lap_seconds"] = float(event["lap_time"])
+        elif event_type == "pit":
+            state = str(event.get("state", "")).lower()
+            if state in PIT_STATES:
+                changes["pit_state"] = state
+        elif event_type == "fuel":
+            changes["fuel"] = float(event["fuel"])
+        elif event_type == "flag":
+            changes["flag"] = str(event.get("flag", "green")).lower()
+        elif event_type == "session":
+            changes["time_left"] = max(0.0, float(event["time_left"]))
+    except (KeyError, TypeError, ValueError):
+        changes = {}
+
+    return replace(
+        snapshot,
+        event_count=snapshot.event_count + 1,
+        received_at=time.monotonic(),
+        **changes
+    )
+
+
+async def jsonl_replay_source(path: str, speed: float = 1.0):
+    """
+    Kaydedilmiş JSON-lines dosyasını "t" zaman damgalarına göre tekrar oynatır
+    (speed > 1 hızlandırır, speed <= 0 beklemeden okur). Çevrimdışı test içindir.
+    """
+    start = time.monotonic()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            event = parse_event(line)
+            if event is None:
+                continue
+            if speed > 0 and "t" in event:
+                delay = float(event["t"]) / speed - (time.monotonic() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield event
+            # Beklemesiz replay'de de döngü diğer görevlere (yayıncı) nefes aldırsın
+            await asyncio.sleep(0)
+
+
+async def websocket_source(url: str):
+    """LMU telemetri WebSocket'i; bağlantı koparsa artan beklemeyle yeniden bağlanır."""
+    try:
+        import websockets
+    except ImportError:
+        print("❌ websockets paketi yüklü değil, telemetri başlatılamadı.")
+        return
+
+    backoff = RECONNECT_MIN_SECONDS
+    while True:
+        try:
+            async with websockets.connect(url) as ws:
+                backoff = RECONNECT_MIN_SECONDS
+                async for message in ws:
+                    event = parse_event(message)
+                    if event is not None:
+                        yield event
+        except (OSError, websockets.WebSocketException) as e:
+            print(f"⚠ Telemetri bağlantısı koptu ({e}), {backoff:.0f}s sonra tekrar denenecek.")
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+
+
+def source_from_address(address: str, speed: float = 1.0):
+    """ws:// / wss:// adresi için WebSocket, diğerleri için JSON-lines replay kaynağı."""
+    if address.startswith(("ws://", "wss://")):
+        return lambda: websocket_source(address)
+    return lambda: jsonl_replay_source(address, speed)
+
+
+class _TelemetryRun:
+    """
+    Bir start() çağrısının thread'i, event loop'u ve görevi. Loop start()'ta
+    kurulur, bu yüzden stop() thread daha görevi oluşturmadan gelse de iptal
+    kaybolmaz; eski çalıştırmanın durumu yenisininkine karışmaz.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.stop_event = threading.Event()
+        self.snapshot = TelemetrySnapshot()
+        self.task = None
+        self.thread = None
+
+    @property
+    def alive(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def cancel(self):
+        self.stop_event.set()
+        try:
+            self.loop.call_soon_threadsafe(self._cancel_task)
+        except RuntimeError:
+            pass  # loop zaten kapandı
+
+    def _cancel_task(self):
+        if self.task is not None:
+            self.task.cancel()
+
+
+class TelemetryService(QObject):
+    """
+    Telemetri kaynağını arka plan thread'inde asyncio ile tüketir.
+    snapshot_ready: birleştirilmiş TelemetrySnapshot (GUI'de queued bağlanmalı)
+    status_changed: "connected" / "stopped" / hata metni
+    Sinyaller sadece güncel çalıştırmadan yayınlanır.
+    """
+    snapshot_ready = pyqtSignal(object)
+    status_changed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.run = None
+        # join süresinde bitmeyen, iptal edilmiş çalıştırmalar (referans bırakılmaz)
+        self.stopping_runs = []
+
+    @property
+    def snapshot(self) -> TelemetrySnapshot:
+        return self.run.snapshot if self.run is not None else TelemetrySnapshot()
+
+    @property
+    def running(self) -> bool:
+        return self.run is not None and self.run.alive
+
+    def start(self, source_factory):
+        """source_factory: çağrıldığında async olay üreteci döndüren fonksiyon."""
+        self.stop()
+        run = _TelemetryRun()
+        run.thread = threading.Thread(
+            target=self._run_thread, args=(run, source_factory), name="telemetry", daemon=True
+        )
+        self.run = run
+        run.thread.start()
+
+    def start_address(self, address: str, speed: float = 1.0):
+        self.start(source_from_address(address, speed))
+
+    def stop(self, timeout: float = 2.0):
+        run, self.run = self.run, None
+        if run is not None:
+            run.cancel()
+            self.stopping_runs.append(run)
+        for stale in self.stopping_runs:
+            if stale.thread is not None:
+                stale.thread.join(timeout)
+        self.stopping_runs = [r for r in self.stopping_runs if r.alive]
+        if self.stopping_runs:
+            print(f"⚠ {len(self.stopping_runs)} telemetri thread'i henüz kapanmadı.")
+
+    def _is_current(self, run: _TelemetryRun) -> bool:
+        return run is self.run
+
+    def _run_thread(self, run: _TelemetryRun, source_factory):
+        loop = run.loop
+        asyncio.set_event_loop(loop)
+        try:
+            if not run.stop_event.is_set():
+                run.task = loop.create_task(self._consume(run, source_factory))
+                loop.run_until_complete(run.task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print("❌ Telemetri hatası:", e)
+            if self._is_current(run):
+                self.status_changed.emit(str(e))
+        finally:
+            # İptal edilen kaynak üreteçleri kapanmadan loop kapatılmaz
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+        if self._is_current(run):
+            self.status_changed.emit("stopped")
+
+    async def _consume(self, run: _TelemetryRun, source_factory):
+        dirty = asyncio.Event()
+        publisher = asyncio.create_task(self._publish(run, dirty))
+        if self._is_current(run):
+            self.status_changed.emit("connected")
+        try:
+            async for event in source_factory():
+                if not self._is_current(run):
+                    break
+                run.snapshot = apply_event(run.snapshot, event)
+                dirty.set()
+        finally:
+            # Kaynak bittiğinde son durum da yayınlanır
+            publisher.cancel()
+            if dirty.is_set() and self._is_current(run):
+                self.snapshot_ready.emit(run.snapshot)
+
+    async def _publish(self, run: _TelemetryRun, dirty: asyncio.Event):
+        """Değişiklik varsa en fazla PUBLISH_INTERVAL_SECONDS'ta bir son durumu yayınlar."""
+        while self._is_current(run):
+            await dirty.wait()
+            dirty.clear()
+            if not self._is_current(run):
+                break
+            # Sinyal GUI thread'indeki alıcıya kuyruklanarak iletilir
+            self.snapshot_ready.emit(run.snapshot)
+            await asyncio.sleep(PUBLISH_INTERVAL_SECONDS)